@@ -1,20 +1,20 @@
 """CANFAR Science Platform Python Client."""
 
+from __future__ import annotations
+
+from importlib import import_module
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-# Configuration paths and defaults (defined before logging import to avoid cycles)
+# Configuration paths and defaults
 CONFIG_DIR: Path = Path.home() / ".canfar"
 CONFIG_PATH: Path = CONFIG_DIR / "config.yaml"
-
-from .utils.logging import (  # noqa: E402
-    configure_logging,
-    get_logger,
-)
-
 CERT_PATH: Path = Path.home() / ".ssl" / "cadcproxy.pem"
 
-from . import authentication, server  # noqa: E402
-from .authentication import login  # noqa: E402
+if TYPE_CHECKING:
+    from . import authentication, server
+    from .authentication import login
+    from .utils.logging import configure_logging, get_logger
 
 # Kept in sync with pyproject.toml by release-please
 # DO NOT EDIT MANUALLY
@@ -30,3 +30,32 @@ __all__ = [
     "login",
     "server",
 ]
+
+# Public attributes imported on first access, as (module, attribute). Loading the
+# client, authentication and logging stacks eagerly made every ``import canfar``
+# (e.g. ``canfar.helpers.distributed`` inside a replica) pay for all of them.
+_LAZY: dict[str, tuple[str, str | None]] = {
+    "authentication": (".authentication", None),
+    "server": (".server", None),
+    "login": (".authentication", "login"),
+    "configure_logging": (".utils.logging", "configure_logging"),
+    "get_logger": (".utils.logging", "get_logger"),
+}
+
+
+def __getattr__(name: str) -> object:
+    """Import lazily exported attributes on first access."""
+    try:
+        module, attribute = _LAZY[name]
+    except KeyError:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg) from None
+    value = import_module(module, __name__)
+    if attribute is not None:
+        value = getattr(value, attribute)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
@@ -6,9 +6,10 @@ using the cadcutils.net.auth library as the backbone for X509 authentication.
 
 from __future__ import annotations
 
+import threading
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, NamedTuple
 
 from cadcutils.net.auth import Subject, get_cert
 from cryptography import x509
@@ -26,6 +27,27 @@ class CertificateError(ValueError):
     """Raised when an X.509 certificate cannot be used."""
 
 
+class Validity(NamedTuple):
+    """Validity window of a parsed certificate file.
+
+    Attributes:
+        path: Resolved path to the certificate file.
+        start: Start of the validity window as a Unix timestamp.
+        end: End of the validity window as a Unix timestamp.
+    """
+
+    path: Path
+    start: float
+    end: float
+
+
+# Parsed validity windows keyed by resolved path, each tagged with the
+# (mtime, size, inode) of the file version it was parsed from.
+_Fingerprint = tuple[int, int, int]
+_parsed: dict[str, tuple[_Fingerprint, Validity]] = {}
+_parsed_lock = threading.Lock()
+
+
 def _to_utc(value: datetime) -> datetime:
     """Return timezone aware datetime.
 
@@ -62,6 +84,47 @@ def _validity_window(cert: x509.Certificate) -> tuple[datetime, datetime]:
     return _to_utc(start), _to_utc(end)
 
 
+def validity(path: Path = CERT_PATH) -> Validity:
+    """Return the validity window of a certificate file.
+
+    The certificate is parsed once per file version; later calls for an unchanged
+    file (same mtime, size and inode) only ``stat`` it.
+
+    Args:
+        path (Path, optional): Path to certificate file.
+            Defaults to canfar.CERT_PATH, which is ~/.ssl/cadcproxy.pem.
+
+    Returns:
+        Validity: Resolved path and validity window of the certificate.
+
+    Raises:
+        FileNotFoundError: If the certificate file does not exist.
+        CertificateError: If the certificate has no validity information.
+        ValueError: If the file is not a PEM certificate.
+    """
+    destination = path.resolve(strict=True)
+    stat = destination.stat()
+    fingerprint = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+    key = destination.as_posix()
+    with _parsed_lock:
+        cached = _parsed.get(key)
+    if cached is not None and cached[0] == fingerprint:
+        return cached[1]
+
+    cert = x509.load_pem_x509_certificate(destination.read_bytes(), default_backend())
+    start, end = _validity_window(cert)
+    window = Validity(destination, start.timestamp(), end.timestamp())
+    with _parsed_lock:
+        _parsed[key] = (fingerprint, window)
+    return window
+
+
+def clear_cache() -> None:
+    """Forget every parsed certificate validity window."""
+    with _parsed_lock:
+        _parsed.clear()
+
+
 def assert_valid_dates(
     destination: Path, valid_from: datetime, valid_until: datetime
 ) -> None:
@@ -228,12 +291,12 @@ def expiry(path: Path = CERT_PATH) -> float:
         ValueError: If certificate is expired, not yet valid, or cannot be parsed.
     """
     try:
-        destination = path.resolve(strict=True)
-        data = destination.read_bytes()
-        cert = x509.load_pem_x509_certificate(data, default_backend())
-        valid_from, valid_until = _validity_window(cert)
-        assert_valid_dates(destination, valid_from, valid_until)
-        return valid_until.timestamp()
+        window = validity(path)
+        assert_valid_dates(
+            window.path,
+            datetime.fromtimestamp(window.start, tz=timezone.utc),
+            datetime.fromtimestamp(window.end, tz=timezone.utc),
+        )
     except FileNotFoundError as err:
         msg = f"x509 cert not found: {err}"
         log.debug(msg)
@@ -243,6 +306,7 @@ def expiry(path: Path = CERT_PATH) -> float:
     except Exception as err:
         msg = f"Unable to load PEM file at {path.as_posix()}. {err}"
         raise CertificateError(msg) from err
+    return window.end
 
 
 def authenticate_credential(credential: X509Credential) -> X509Credential:
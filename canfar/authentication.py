@@ -72,7 +72,7 @@ def login(idp: str, force: bool = False) -> None:
         AuthenticationError: Credential or discovery failure.
     """
     idp_info = get_idp(idp)
-    config = Configuration()  # ty: ignore[missing-argument]
+    config = Configuration.load()
 
     if _has_authentication(config, idp) and not force:
         return
@@ -96,7 +96,7 @@ def use(idp: str) -> None:
         AuthenticationError: Saved authentication missing for ``idp``.
     """
     get_idp(idp)
-    config = Configuration()  # ty: ignore[missing-argument]
+    config = Configuration.load()
 
     try:
         config.get_credential(idp)
@@ -117,7 +117,7 @@ def list() -> builtins.list[Authentication]:  # noqa: A001
     Returns:
         Authentication records for configured IDPs. Order not guaranteed.
     """
-    config = Configuration()  # ty: ignore[missing-argument]
+    config = Configuration.snapshot()
     return [
         _authentication_for_credential(config, cred)
         for cred in config.authentication.values()
@@ -136,7 +136,7 @@ def remove(idp: str, *, force: bool = False) -> None:
         AuthenticationError: Missing auth or active auth removed without force.
     """
     get_idp(idp)
-    config = Configuration()  # ty: ignore[missing-argument]
+    config = Configuration.load()
 
     if not _has_authentication(config, idp):
         _fail(
@@ -174,7 +174,7 @@ def purge(*, force: bool = False) -> None:
             hint="Re-run with --force to reset authentication and server state.",
         )
 
-    config = Configuration()  # ty: ignore[missing-argument]
+    config = Configuration.load()
     config.purge_authentication()
     config.save()
 
@@ -188,7 +188,7 @@ def show() -> Authentication:
     Raises:
         AuthenticationError: Active authentication is not configured.
     """
-    config = Configuration()  # ty: ignore[missing-argument]
+    config = Configuration.snapshot()
     try:
         credential = config.get_credential(config.active.authentication)
     except KeyError as exc:
@@ -73,10 +73,10 @@ def _parse_environment(env: list[str] | None) -> dict[str, Any]:
     return environment
 
 
-async def _create_sessions(request: CreateRequest) -> list[str]:
+async def _create_sessions(request: CreateRequest, *, resume: bool) -> list[str]:
     """Create the requested Sessions on the selected Science Platform Server."""
     async with AsyncSession() as session:
-        return await session.create(request)
+        return await session.create(request, resume=resume)
 
 
 def _render_create_failure(
@@ -194,6 +194,16 @@ def creation(
     replicas: Annotated[
         int, typer.Option("--replicas", "-r", help="Number of replicas to create.")
     ] = 1,
+    resume: Annotated[
+        bool,
+        typer.Option(
+            "--resume",
+            help=(
+                "Resume an interrupted launch of the same request, "
+                "submitting only replicas that are not running."
+            ),
+        ),
+    ] = False,
     debug: Annotated[
         bool,
         typer.Option(
@@ -274,7 +284,7 @@ def creation(
         return
 
     try:
-        session_ids = run(_create_sessions(request))
+        session_ids = run(_create_sessions(request, resume=resume))
     except KeyboardInterrupt:
         _render_create_failure(
             StructuredError(
@@ -110,43 +110,35 @@ def _login_flow(
     get_console().print("[green]✓[/green] Login completed successfully")
 
 
-def register_login_command(app: typer.Typer) -> None:
-    """Register the top-level ``login`` command on ``app``."""
-
-    @app.command(
-        "login",
-        help="Login to CANFAR Science Platform.",
-        rich_help_panel="Auth Management",
-    )
-    def login_command(
-        idp: Annotated[
-            str | None,
-            typer.Argument(help="Canonical Identity Provider key."),
-        ] = None,
-        force: Annotated[
-            bool,
-            typer.Option("-f", "--force", help="Force re-authentication."),
-        ] = False,
-        dev: Annotated[
-            bool,
-            typer.Option("--dev", help="Include dev servers in discovery."),
-        ] = False,
-        timeout: Annotated[
-            int,
-            typer.Option(
-                "-t",
-                "--timeout",
-                help="Timeout for HTTP requests during login.",
-                min=1,
-            ),
-        ] = 10,
-    ) -> None:
-        """Login to CANFAR Science Platform."""
-        selected_idp = idp or select_idp(list_idps())
-        try:
-            get_idp(selected_idp)
-        except KeyError as exc:
-            get_console(stderr=True).print(f"[bold red]{exc}[/bold red]")
-            raise typer.Exit(1) from exc
-
-        _login_flow(selected_idp, force=force, dev=dev, timeout=timeout)
+def login_command(
+    idp: Annotated[
+        str | None,
+        typer.Argument(help="Canonical Identity Provider key."),
+    ] = None,
+    force: Annotated[
+        bool,
+        typer.Option("-f", "--force", help="Force re-authentication."),
+    ] = False,
+    dev: Annotated[
+        bool,
+        typer.Option("--dev", help="Include dev servers in discovery."),
+    ] = False,
+    timeout: Annotated[
+        int,
+        typer.Option(
+            "-t",
+            "--timeout",
+            help="Timeout for HTTP requests during login.",
+            min=1,
+        ),
+    ] = 10,
+) -> None:
+    """Login to CANFAR Science Platform."""
+    selected_idp = idp or select_idp(list_idps())
+    try:
+        get_idp(selected_idp)
+    except KeyError as exc:
+        get_console(stderr=True).print(f"[bold red]{exc}[/bold red]")
+        raise typer.Exit(1) from exc
+
+    _login_flow(selected_idp, force=force, dev=dev, timeout=timeout)
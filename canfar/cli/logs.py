@@ -5,6 +5,7 @@ from __future__ import annotations
 from typing import Annotated
 
 import typer
+from rich.text import Text
 
 from canfar.cli._run import run
 from canfar.sessions import AsyncSession
@@ -23,8 +24,22 @@ def get_logs(
         list[str],
         typer.Argument(help="One or more session IDs."),
     ],
+    follow: Annotated[
+        bool,
+        typer.Option(
+            "-f",
+            "--follow",
+            help="Stream new log lines until the sessions finish.",
+        ),
+    ] = False,
 ) -> None:
     """Get logs from the science platform server."""
+    if follow:
+        try:
+            run(_follow_logs(session_ids))
+        except KeyboardInterrupt:
+            raise typer.Exit(130) from None
+        return
 
     async def _get_logs() -> None:
         """Fetch logs for the requested sessions and render them."""
@@ -50,3 +65,23 @@ def get_logs(
             get_console().print(log_text)
 
     run(_get_logs())
+
+
+async def _follow_logs(session_ids: list[str]) -> None:
+    """Print new log lines as they arrive, prefixed when following many sessions."""
+    prefixed = len(set(session_ids)) > 1
+    console = get_console()
+    async with AsyncSession() as session:
+        try:
+            async for session_id, line in session.follow_logs(ids=session_ids):
+                text = (
+                    Text.assemble((f"{session_id} | ", "bold magenta"), line)
+                    if prefixed
+                    else Text(line)
+                )
+                console.print(text, highlight=False, soft_wrap=True)
+        except Exception as e:
+            get_console(stderr=True).print(
+                f"[bold red]Error:[/bold red] Could not follow logs. {e}"
+            )
+            raise typer.Exit(1) from e
@@ -7,30 +7,10 @@ from typing import TYPE_CHECKING, Annotated
 
 import typer
 
-from canfar.cli import output
-from canfar.cli.auth import auth
-from canfar.cli.config import config
-from canfar.cli.create import create
-from canfar.cli.delete import delete
-from canfar.cli.events import events
-from canfar.cli.image import image
-from canfar.cli.info import info
-from canfar.cli.login import register_login_command
-from canfar.cli.logs import logs
-from canfar.cli.open import open_command
-from canfar.cli.prune import prune
-from canfar.cli.ps import ps
-from canfar.cli.server import server
-from canfar.cli.stats import stats
-from canfar.cli.version import version
 from canfar.config.migration import ConfigResetRequiredError
 from canfar.exceptions.context import AuthContextError, AuthExpiredError
-from canfar.hooks.typer.aliases import (
-    ROOT_CHILD_ARGS_META_KEY,
-    AliasGroup,
-    set_before_command,
-)
-from canfar.utils.console import emit_active_server_banner, get_console
+from canfar.hooks.typer.aliases import ROOT_CHILD_ARGS_META_KEY, set_before_command
+from canfar.hooks.typer.lazy import LazyAliasGroup, LazyCommand
 from canfar.utils.logging import (
     InvalidLogFilePathError,
     InvalidLoggingEnvironmentError,
@@ -41,11 +21,18 @@ from canfar.utils.logging import (
 if TYPE_CHECKING:
     from collections.abc import Mapping
 
+    from canfar.cli.output import OutputMode
     from canfar.errors import StructuredError
 
+# ``canfar.cli.output`` (httpx) and ``canfar.utils.console`` (the configuration
+# models, cryptography, cadcutils) are imported where they are used, so that
+# ``canfar --help`` does not pay for them.
+
 
-def _leaf_output_mode(args: list[str]) -> output.OutputMode:
+def _leaf_output_mode(args: list[str]) -> OutputMode:
     """Infer an already-parsed leaf machine flag for root setup failures."""
+    from canfar.cli import output  # noqa: PLC0415
+
     if "--json" in args:
         return output.OutputMode.JSON
     if "--yaml" in args:
@@ -57,6 +44,8 @@ def _emit_banner_for_command(params: Mapping[str, object]) -> None:
     """Emit the active-server banner for a parsed human-output command."""
     if params.get("json_output") or params.get("yaml_output"):
         return
+    from canfar.utils.console import emit_active_server_banner  # noqa: PLC0415
+
     emit_active_server_banner()
 
 
@@ -90,14 +79,19 @@ def callback(
     child_args: list[str] = ctx.meta.get(ROOT_CHILD_ARGS_META_KEY, [])
     if "--" in child_args:
         child_args = child_args[: child_args.index("--")]
-    setup_mode = _leaf_output_mode(child_args)
 
-    def warning_writer(error: StructuredError) -> None:
+    def report(error: StructuredError, human: str) -> None:
+        from canfar.cli import output  # noqa: PLC0415
+
+        setup_mode = _leaf_output_mode(child_args)
         if setup_mode is output.OutputMode.HUMAN:
-            typer.echo(f"{error.code}: {error.message}", err=True)
+            typer.echo(human, err=True)
         else:
             output.to_stderr(error, setup_mode)
 
+    def warning_writer(error: StructuredError) -> None:
+        report(error, f"{error.code}: {error.message}")
+
     try:
         configure_logging(
             loglevel=log_level,
@@ -106,18 +100,142 @@ def callback(
             warning_writer=warning_writer,
         )
     except (InvalidLoggingEnvironmentError, InvalidLogFilePathError) as err:
-        if setup_mode is output.OutputMode.HUMAN:
-            typer.echo(str(err), err=True)
-        else:
-            output.to_stderr(err.error, setup_mode)
+        report(err.error, str(err))
         raise typer.Exit(2) from err
 
     if ctx.invoked_subcommand is None:
+        from canfar.utils.console import get_console  # noqa: PLC0415
+
         get_console().print(ctx.get_help())
         raise typer.Exit(0)
     set_before_command(ctx, _emit_banner_for_command)
 
 
+class CanfarGroup(LazyAliasGroup):
+    """Root command group; subcommand modules are imported on first use."""
+
+    lazy_commands = (
+        LazyCommand(
+            "login",
+            "canfar.cli.login:login_command",
+            help="Login to CANFAR Science Platform.",
+            rich_help_panel="Auth Management",
+        ),
+        LazyCommand(
+            "auth",
+            "canfar.cli.auth:auth",
+            help="Manage authentication providers.",
+            rich_help_panel="Auth Management",
+        ),
+        LazyCommand(
+            "authentication",
+            "canfar.cli.auth:auth",
+            help="Alias for auth.",
+            rich_help_panel="Aliases",
+            hidden=True,
+        ),
+        LazyCommand(
+            "server",
+            "canfar.cli.server:server",
+            help="Manage science platform servers.",
+            no_args_is_help=True,
+            rich_help_panel="Auth Management",
+        ),
+        LazyCommand(
+            "create",
+            "canfar.cli.create:create",
+            short_help="Launch a new session.",
+            no_args_is_help=True,
+            rich_help_panel="Session Management",
+        ),
+        LazyCommand(
+            "ps",
+            "canfar.cli.ps:ps",
+            short_help="Show sessions.",
+            rich_help_panel="Session Management",
+        ),
+        LazyCommand(
+            "events",
+            "canfar.cli.events:events",
+            short_help="List events for sessions.",
+            rich_help_panel="Session Management",
+        ),
+        LazyCommand(
+            "info",
+            "canfar.cli.info:info",
+            help="Show session info",
+            rich_help_panel="Session Management",
+        ),
+        LazyCommand(
+            "open",
+            "canfar.cli.open:open_command",
+            help="Open sessions in a browser",
+            no_args_is_help=True,
+            rich_help_panel="Session Management",
+        ),
+        LazyCommand(
+            "logs",
+            "canfar.cli.logs:logs",
+            help="Show session logs",
+            rich_help_panel="Session Management",
+        ),
+        LazyCommand(
+            "delete",
+            "canfar.cli.delete:delete",
+            short_help="Delete sessions by ID.",
+            no_args_is_help=True,
+            rich_help_panel="Session Management",
+        ),
+        LazyCommand(
+            "prune",
+            "canfar.cli.prune:prune",
+            short_help="Delete sessions by criteria.",
+            no_args_is_help=True,
+            rich_help_panel="Session Management",
+        ),
+        LazyCommand(
+            "run | launch",
+            "canfar.cli.create:create",
+            help="Aliases for create.",
+            no_args_is_help=True,
+            rich_help_panel="Aliases",
+        ),
+        LazyCommand(
+            "del",
+            "canfar.cli.delete:delete",
+            help="Aliases for delete.",
+            no_args_is_help=True,
+            rich_help_panel="Aliases",
+        ),
+        LazyCommand(
+            "stats",
+            "canfar.cli.stats:stats",
+            help="Show cluster stats",
+            rich_help_panel="Cluster Information",
+        ),
+        LazyCommand(
+            "image",
+            "canfar.cli.image:image",
+            help="Manage images",
+            no_args_is_help=True,
+            rich_help_panel="Image Management",
+        ),
+        LazyCommand(
+            "config",
+            "canfar.cli.config:config",
+            help="Manage client config",
+            no_args_is_help=True,
+            rich_help_panel="Client Info",
+        ),
+        LazyCommand(
+            "version",
+            "canfar.cli.version:version",
+            help="View client info",
+            rich_help_panel="Client Info",
+        ),
+    )
+
+
 cli: typer.Typer = typer.Typer(
     name="canfar",
     help="CANFAR Science Platform",
@@ -131,132 +249,17 @@ cli: typer.Typer = typer.Typer(
     rich_help_panel="CANFAR CLI Commands",
     callback=callback,
     invoke_without_command=True,
-    cls=AliasGroup,
+    cls=CanfarGroup,
 )
 
-register_login_command(cli)
 
-cli.add_typer(
-    auth,
-    name="auth",
-    help="Manage authentication providers.",
-    no_args_is_help=False,
-    rich_help_panel="Auth Management",
-)
+def _print_error(*messages: object) -> None:
+    """Print messages for an error that ends the command to stderr."""
+    from canfar.utils.console import get_console  # noqa: PLC0415
 
-cli.add_typer(
-    auth,
-    name="authentication",
-    help="Alias for auth.",
-    no_args_is_help=False,
-    rich_help_panel="Aliases",
-    hidden=True,
-)
-
-cli.add_typer(
-    server,
-    name="server",
-    help="Manage science platform servers.",
-    no_args_is_help=True,
-    rich_help_panel="Auth Management",
-)
-
-cli.add_typer(
-    create,
-    no_args_is_help=True,
-    rich_help_panel="Session Management",
-)
-
-cli.add_typer(
-    ps,
-    no_args_is_help=False,
-    rich_help_panel="Session Management",
-)
-cli.add_typer(
-    events,
-    no_args_is_help=False,
-    rich_help_panel="Session Management",
-)
-
-cli.add_typer(
-    info,
-    help="Show session info",
-    no_args_is_help=False,
-    rich_help_panel="Session Management",
-)
-
-cli.add_typer(
-    open_command,
-    name="open",
-    help="Open sessions in a browser",
-    no_args_is_help=True,
-    rich_help_panel="Session Management",
-)
-
-cli.add_typer(
-    logs,
-    help="Show session logs",
-    no_args_is_help=False,
-    rich_help_panel="Session Management",
-)
-
-cli.add_typer(
-    delete,
-    no_args_is_help=True,
-    rich_help_panel="Session Management",
-)
-
-cli.add_typer(
-    prune,
-    no_args_is_help=True,
-    rich_help_panel="Session Management",
-)
-
-cli.add_typer(
-    create,
-    name="run | launch",
-    help="Aliases for create.",
-    no_args_is_help=True,
-    rich_help_panel="Aliases",
-)
-
-cli.add_typer(
-    delete,
-    name="del",
-    help="Aliases for delete.",
-    no_args_is_help=True,
-    rich_help_panel="Aliases",
-)
-
-cli.add_typer(
-    stats,
-    help="Show cluster stats",
-    no_args_is_help=False,
-    rich_help_panel="Cluster Information",
-)
-
-cli.add_typer(
-    image,
-    name="image",
-    help="Manage images",
-    no_args_is_help=True,
-    rich_help_panel="Image Management",
-)
-
-cli.add_typer(
-    config,
-    name="config",
-    help="Manage client config",
-    no_args_is_help=True,
-    rich_help_panel="Client Info",
-)
-cli.add_typer(
-    version,
-    name="version",
-    help="View client info",
-    no_args_is_help=False,
-    rich_help_panel="Client Info",
-)
+    console = get_console(stderr=True)
+    for message in messages:
+        console.print(message)
 
 
 def main() -> None:
@@ -264,14 +267,11 @@ def main() -> None:
     try:
         cli()
     except AuthExpiredError as err:
-        get_console(stderr=True).print(err)
-        get_console(stderr=True).print(
-            "Authenticate with [italic cyan]canfar login[/italic cyan]"
-        )
+        _print_error(err, "Authenticate with [italic cyan]canfar login[/italic cyan]")
     except AuthContextError as err:
-        get_console(stderr=True).print(err)
+        _print_error(err)
     except ConfigResetRequiredError as err:
-        get_console(stderr=True).print(err)
+        _print_error(err)
         raise typer.Exit(1) from err
 
 
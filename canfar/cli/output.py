@@ -19,6 +19,7 @@ from canfar.errors import (
     structured_error_to_yaml,
 )
 from canfar.exceptions.context import AuthContextError, AuthExpiredError
+from canfar.utils.circuit import CircuitOpenError
 
 OUTPUT_CONFLICT_EXIT_CODE = 2
 """Exit code for conflicting machine output flags."""
@@ -124,6 +125,8 @@ def boundary_failure(
             message=str(err),
             hint="Check the active Authentication Record and retry.",
         )
+    if isinstance(err, CircuitOpenError):
+        return err.structured
     return StructuredError(
         code=ErrorCode.TRANSPORT_FAILURE,
         message=transport_message,
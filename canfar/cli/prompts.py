@@ -65,6 +65,9 @@ def select_idp(idps: list[IdpInfo]) -> str:
 def select_server(servers: list[Server]) -> Server:
     """Prompt the user to choose a Science Platform Server.
 
+    Servers are listed nearest first, so the default choice is the server with
+    the lowest latency measured during discovery.
+
     Args:
         servers: Known servers scoped to the active Identity Provider.
 
@@ -80,12 +83,15 @@ def select_server(servers: list[Server]) -> Server:
     if len(servers) == 1:
         return servers[0]
 
+    from canfar.server import rank  # noqa: PLC0415
+
     choices = [
         questionary.Choice(
-            title=f"{server.name or server.uri} ({server.uri})",
+            title=f"{server.name or server.uri} ({server.uri})"
+            + ("" if server.latency is None else f" · {server.latency:.0f} ms"),
             value=server,
         )
-        for server in servers
+        for server in rank(servers)
         if server.uri is not None
     ]
     if not choices:
@@ -16,6 +16,8 @@ from canfar.config.migration import ConfigResetRequiredError
 from canfar.errors import ErrorCode, StructuredError
 from canfar.hooks.typer.aliases import AliasGroup
 from canfar.server import (
+    FASTEST,
+    UNREACHABLE,
     ServerDiscoveryError,
     ServerFetchError,
     ServerSelectorError,
@@ -52,6 +54,7 @@ def _render_server_list_table(servers: list[Server]) -> None:
     table.add_column("URI", style="cyan")
     table.add_column("URL", style="blue")
     table.add_column("Version", style="green")
+    table.add_column("Latency", style="yellow", justify="right")
 
     for item in servers:
         table.add_row(
@@ -59,16 +62,26 @@ def _render_server_list_table(servers: list[Server]) -> None:
             str(item.uri) if item.uri is not None else "N/A",
             str(item.url) if item.url is not None else "N/A",
             item.version or "N/A",
+            _latency(item),
         )
     get_console().print(table)
 
 
+def _latency(item: Server) -> str:
+    """Format the discovery latency or reachability of a server."""
+    if item.status == UNREACHABLE:
+        return "unreachable"
+    if item.latency is None:
+        return "N/A"
+    return f"{item.latency:.0f} ms"
+
+
 @server.command("list, ls")
 def server_list_command(
     json_output: JsonOption = False,
     yaml_output: YamlOption = False,
 ) -> None:
-    """List servers for the active Identity Provider."""
+    """List servers for the active Identity Provider, nearest first."""
     mode = resolve_mode(json_output, yaml_output)
 
     try:
@@ -124,11 +137,14 @@ def server_list_command(
 
 @server.command("use")
 def server_use_command(
-    selector: Annotated[str, typer.Argument(help="Server name or URI.")],
+    selector: Annotated[
+        str,
+        typer.Argument(help=f"Server name, URI, or '{FASTEST}' for the nearest."),
+    ],
 ) -> None:
     """Select the active server by name or URI."""
     try:
-        server_use(selector)
+        activated = server_use(selector)
     except ServerSelectorError as exc:
         get_console(stderr=True).print(f"[bold red]{exc}[/bold red]")
         if exc.hint:
@@ -139,5 +155,6 @@ def server_use_command(
         raise typer.Exit(1) from exc
 
     get_console().print(
-        f"[green]✓[/green] Active server set to [bold]{selector}[/bold]"
+        f"[green]✓[/green] Active server set to "
+        f"[bold]{activated.name or selector}[/bold]"
     )
@@ -2,13 +2,21 @@
 
 from __future__ import annotations
 
-import ssl
+import threading
 from datetime import datetime, timezone
 from email.utils import formatdate
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
-from httpx import URL, AsyncClient, Client, Limits, Timeout
+from httpx import (
+    URL,
+    AsyncClient,
+    AsyncHTTPTransport,
+    Client,
+    HTTPTransport,
+    Limits,
+    Timeout,
+)
 from pydantic import (
     AnyHttpUrl,
     Field,
@@ -29,10 +37,15 @@ from canfar.models.auth import (
     X509Credential,
 )
 from canfar.models.config import Configuration
+from canfar.utils import circuit, incluster, ratelimit, retry, tls, transport
+from canfar.utils.limiter import AIMD, MAX_CONCURRENCY, Limiter
 
 if TYPE_CHECKING:
+    import ssl
     from types import TracebackType
 
+    from httpx import AsyncBaseTransport, BaseTransport
+
 log = get_logger(__name__)
 
 
@@ -51,6 +64,10 @@ class HTTPClient(BaseSettings):
         ``authentication_idp`` or ``active.authentication``, plus the active Server
         Selection when no explicit ``url`` is supplied.
 
+    The synchronous client is thread-safe: one instance may be shared by worker
+    threads, which build a single HTTPx client and refresh an expired OIDC
+    token once between them.
+
     Raises:
         ValueError: If configuration is invalid.
     """
@@ -102,26 +119,170 @@ class HTTPClient(BaseSettings):
     concurrency: int = Field(
         32,
         title="HTTP Concurrency",
-        description="Max concurrent connections for async client.",
+        description="Max concurrent requests and connections for bulk operations.",
         ge=1,
         le=128,
     )
+    http2: bool = Field(
+        default=True,
+        title="HTTP/2",
+        description=(
+            "Negotiate HTTP/2 so concurrent requests multiplex over a few connections."
+        ),
+    )
+    adaptive_concurrency: bool = Field(
+        default=False,
+        title="Adaptive Concurrency",
+        description=(
+            "Start async bulk operations at `concurrency` and adapt the limit "
+            "(AIMD) to the server's latency and 429/503/timeout responses."
+        ),
+    )
+    bulk_info_threshold: int = Field(
+        16,
+        title="Bulk Info Threshold",
+        description=(
+            "Resolve session info for more IDs than this with one list request "
+            "instead of one request per ID."
+        ),
+        ge=0,
+    )
+    create_rate: float = Field(
+        0.0,
+        title="Session Create Rate",
+        description=(
+            "Max session create requests per second across replicas, e.g. 5; "
+            "0 (the default) disables the limit."
+        ),
+        ge=0,
+    )
+    create_retries: int = Field(
+        4,
+        title="Session Create Retries",
+        description=(
+            "Retries per replica after 429, 503 or connection errors, with "
+            "exponential backoff and jitter; after 502, 504 or a lost response "
+            "the replica is re-sent only if it is not listed."
+        ),
+        ge=0,
+        le=10,
+    )
+    launch_journal: bool = Field(
+        default=True,
+        title="Launch Journal",
+        description=(
+            "Record session launches under CONFIG_DIR/launches so interrupted "
+            "launches can be resumed."
+        ),
+    )
+    retries: int = Field(
+        0,
+        title="HTTP Retries",
+        description=(
+            "Retries for idempotent requests (GET, HEAD, DELETE) after timeouts, "
+            "network errors, 429 or 502-504, with exponential backoff and jitter; "
+            "0 (the default) disables retrying."
+        ),
+        ge=0,
+        le=10,
+    )
+    retry_budget: float = Field(
+        0.2,
+        title="HTTP Retry Budget",
+        description=(
+            "Long-run fraction of requests that may be retried, beyond a burst "
+            "of 10 retries."
+        ),
+        ge=0,
+        le=1,
+    )
+    rate_budget: float | None = Field(
+        None,
+        title="Job Array Request Budget",
+        description=(
+            "Requests per second for all replicas of a job array together; each "
+            "replica paces itself to its share, staggered by REPLICA_ID."
+        ),
+        gt=0,
+    )
+    breaker_threshold: int = Field(
+        0,
+        title="Circuit Breaker Threshold",
+        description=(
+            "Consecutive requests that fail to connect, or end in a 502, 503 or "
+            "504 after retries, before a server's requests fail fast, e.g. "
+            f"{circuit.THRESHOLD}; 0 (the default) disables the breaker."
+        ),
+        ge=0,
+    )
+    breaker_cooldown: float = Field(
+        circuit.COOLDOWN,
+        title="Circuit Breaker Cooldown",
+        description=(
+            "Seconds an open circuit fails fast before probing the server's "
+            "availability endpoint."
+        ),
+        gt=0,
+    )
+    background_refresh: bool = Field(
+        default=False,
+        title="Background Token Refresh",
+        description=(
+            "Renew OIDC access tokens in the background before they expire, "
+            "instead of on the first request that finds them expired."
+        ),
+    )
+    refresh_fraction: float = Field(
+        auth.FRACTION,
+        title="Background Refresh Point",
+        description=(
+            "Fraction of an access token's lifetime after which the background "
+            "refresher renews it."
+        ),
+        gt=0,
+        lt=1,
+    )
+    in_cluster: bool = Field(
+        default=False,
+        title="In-Cluster Mode",
+        description=(
+            "Build the client from a runtime token or certificate without "
+            "loading the configuration file; detected in headless replicas "
+            "that set CANFAR_URL and a runtime credential."
+        ),
+        exclude=True,
+    )
     raise_http_errors: bool = Field(
         default=True,
         title="Raise HTTP Errors",
         description="Install response hooks that raise HTTP status errors.",
         exclude=True,
     )
+    share_connections: bool = Field(
+        default=True,
+        title="Share Connections",
+        description=(
+            "Reuse the process-wide connection pool for this server and "
+            "credential instead of opening a private one."
+        ),
+        exclude=True,
+    )
     # Composed configuration object
     config: Configuration = Field(
-        default_factory=Configuration,
+        default_factory=Configuration.load,
         title="Configuration Object",
         description="The configuration object for the client.",
     )
 
     # Private attributes
     _client: Client | None = PrivateAttr(default=None)
+    _client_lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
     _asynclient: AsyncClient | None = PrivateAttr(default=None)
+    _limiter: Limiter | None = PrivateAttr(default=None)
+    _retry_budget: retry.RetryBudget | None = PrivateAttr(default=None)
+    _retry_stats: retry.RetryStats = PrivateAttr(default_factory=retry.RetryStats)
+    _refresher: auth.Refresher | None = PrivateAttr(default=None)
+    _arefresher: auth.AsyncRefresher | None = PrivateAttr(default=None)
 
     # Client Properties
     @property
@@ -131,10 +292,14 @@ class HTTPClient(BaseSettings):
         Returns:
             Client: The synchronous HTTPx client.
         """
-        if not self._client:
-            self._client = self._create_sync_client()
-            log.debug("Synchronous HTTPx client created")
-        return self._client
+        client = self._client
+        if client is None:
+            with self._client_lock:
+                if self._client is None:
+                    self._client = self._create_sync_client()
+                    log.debug("Synchronous HTTPx client created")
+                client = self._client
+        return client
 
     @property
     def asynclient(self) -> AsyncClient:
@@ -144,6 +309,33 @@ class HTTPClient(BaseSettings):
             log.debug("Asynchronous HTTPx client created")
         return self._asynclient
 
+    @property
+    def limiter(self) -> Limiter:
+        """Get the limiter shared by all concurrent async requests of this client.
+
+        Bulk methods running side by side on one client share ``concurrency``
+        slots; ``limiter.stats`` reports how long requests queued for one. With
+        ``adaptive_concurrency`` the limit follows the server, and
+        ``limiter.limit`` and ``limiter.latency`` report its current state.
+
+        Returns:
+            Limiter: The shared concurrency limiter.
+        """
+        if not self._limiter:
+            controller = AIMD() if self.adaptive_concurrency else None
+            self._limiter = Limiter(self.concurrency, controller)
+        return self._limiter
+
+    @property
+    def retry_stats(self) -> retry.RetryStats:
+        """Get retry counters for requests sent by this client.
+
+        Returns:
+            retry.RetryStats: Requests, retries, and retries exhausted or
+                denied by the retry budget.
+        """
+        return self._retry_stats
+
     @property
     def uses_runtime_credentials(self) -> bool:
         """Return whether runtime token or certificate credentials are active."""
@@ -165,6 +357,50 @@ class HTTPClient(BaseSettings):
             return None
         return credential
 
+    @model_validator(mode="before")
+    @classmethod
+    def _in_cluster(cls, data: Any) -> Any:
+        """Resolve in-cluster mode before the configuration is loaded.
+
+        In-cluster clients get a runtime credential, a server URL, and an empty
+        configuration, so no file is read and no record is resolved. When the
+        mode was only detected, it applies only if the URL and a runtime token
+        or certificate were given; otherwise the client uses the configuration
+        file. The default URL and the proxy certificate are used only when the
+        mode was requested.
+
+        Raises:
+            ValueError: If in-cluster mode was requested without a credential.
+
+        Returns:
+            Any: Settings with the in-cluster defaults applied.
+        """
+        if not isinstance(data, dict):
+            return data
+        requested = data.get("in_cluster")
+        if not incluster.enabled(requested):
+            return data
+        explicit = requested is not None
+        runtime = incluster.credentials(
+            data.get("token"), data.get("certificate"), proxy=explicit
+        )
+        if not explicit and (runtime is None or not data.get("url")):
+            log.debug(
+                "Replica without CANFAR_URL and a runtime credential, "
+                "loading configuration."
+            )
+            return data
+        if runtime is None:
+            msg = "In-cluster mode needs a runtime token or certificate."
+            raise ValueError(msg)
+        return {
+            **data,
+            **runtime,
+            "in_cluster": True,
+            "url": data.get("url") or incluster.URL,
+            "config": data.get("config") or Configuration.model_construct(),
+        }
+
     @model_validator(mode="after")
     def _validate(self) -> Self:
         """Configure the client based on the provided settings.
@@ -185,7 +421,7 @@ class HTTPClient(BaseSettings):
             msg = "Server URL must be provided when using runtime credentials."
             raise ValueError(msg)
 
-        if self.certificate:
+        if self.certificate and not self.in_cluster:
             info = x509.inspect(self.certificate)
             expiry = datetime.fromtimestamp(info["expiry"], tz=timezone.utc).isoformat()
             msg = f"{self.certificate} valid till {expiry}"
@@ -202,8 +438,31 @@ class HTTPClient(BaseSettings):
         credential = self._resolved_authentication_record()
         kwargs = self._get_client_kwargs(asynchronous=True, credential=credential)
         headers = self._get_http_headers(credential=credential)
+        if self.share_connections:
+            kwargs["transport"] = transport.ashared(
+                self._transport_key(kwargs),
+                verify=kwargs["verify"],
+                limits=kwargs["limits"],
+                http2=kwargs["http2"],
+            )
+        if self.rate_budget or self.breaker_threshold or self.retries:
+            layer: AsyncBaseTransport = kwargs.get("transport") or AsyncHTTPTransport(
+                verify=kwargs["verify"],
+                limits=kwargs["limits"],
+                http2=kwargs["http2"],
+            )
+            if self.rate_budget:
+                bucket = ratelimit.shared(self.rate_budget)
+                layer = ratelimit.AsyncRateLimitTransport(layer, bucket)
+            if self.retries:
+                layer = retry.AsyncRetryTransport(layer, *self._retry_settings())
+            if self.breaker_threshold:
+                layer = circuit.AsyncCircuitTransport(layer, self._breaker(kwargs))
+            kwargs["transport"] = layer
         client = AsyncClient(**kwargs)
         client.headers.update(headers)
+        if self._arefresher is not None:
+            self._arefresher.httpx_client = client
         return client
 
     def _create_sync_client(self) -> Client:
@@ -215,10 +474,66 @@ class HTTPClient(BaseSettings):
         credential = self._resolved_authentication_record()
         kwargs = self._get_client_kwargs(asynchronous=False, credential=credential)
         headers = self._get_http_headers(credential=credential)
+        if self.share_connections:
+            kwargs["transport"] = transport.shared(
+                self._transport_key(kwargs),
+                verify=kwargs["verify"],
+                limits=kwargs["limits"],
+                http2=kwargs["http2"],
+            )
+        if self.rate_budget or self.breaker_threshold or self.retries:
+            layer: BaseTransport = kwargs.get("transport") or HTTPTransport(
+                verify=kwargs["verify"],
+                limits=kwargs["limits"],
+                http2=kwargs["http2"],
+            )
+            if self.rate_budget:
+                bucket = ratelimit.shared(self.rate_budget)
+                layer = ratelimit.RateLimitTransport(layer, bucket)
+            if self.retries:
+                layer = retry.RetryTransport(layer, *self._retry_settings())
+            if self.breaker_threshold:
+                layer = circuit.CircuitTransport(layer, self._breaker(kwargs))
+            kwargs["transport"] = layer
         client = Client(**kwargs)
         client.headers.update(headers)
+        if self._refresher is not None:
+            self._refresher.httpx_client = client
+            self._refresher.start()
         return client
 
+    def _retry_settings(
+        self,
+    ) -> tuple[retry.Backoff, retry.RetryBudget, retry.RetryStats]:
+        """Return the retry policy, budget, and counters shared by both clients."""
+        if self._retry_budget is None:
+            self._retry_budget = retry.RetryBudget(ratio=self.retry_budget)
+        return (
+            retry.Backoff(retries=self.retries),
+            self._retry_budget,
+            self._retry_stats,
+        )
+
+    def _breaker(self, kwargs: dict[str, Any]) -> circuit.Breaker:
+        """Return the process-wide circuit breaker for this client's server."""
+        return circuit.breaker(
+            str(kwargs["base_url"]),
+            threshold=self.breaker_threshold,
+            cooldown=self.breaker_cooldown,
+        )
+
+    def _transport_key(
+        self,
+        kwargs: dict[str, Any],
+    ) -> transport.TransportKey:
+        """Return the shared connection pool identity for this client build."""
+        return transport.key(
+            kwargs["base_url"],
+            verify=kwargs["verify"],
+            limits=kwargs["limits"],
+            http2=kwargs["http2"],
+        )
+
     def _resolved_authentication_record(self) -> AuthenticationCredential | None:
         """Resolve saved Authentication Record once for client construction."""
         if self.uses_runtime_credentials:
@@ -278,16 +593,20 @@ class HTTPClient(BaseSettings):
             checker = expiry.acheck(self) if asynchronous else expiry.check(self)
             request_hooks.append(checker)
         request_hooks.append(req_logger)
+        # An adaptive limiter may grow past ``concurrency``; size the pool for it.
+        connections = MAX_CONCURRENCY if self.adaptive_concurrency else self.concurrency
         kwargs: dict[str, Any] = {
             "timeout": Timeout(self.timeout),
             "event_hooks": {"request": request_hooks, "response": response_hooks},
             "base_url": self._get_base_url(),
+            "verify": tls.default(),
+            "http2": self.http2,
+            "limits": Limits(
+                max_connections=connections,
+                # Keep a warm connection for every slot of the shared limiter.
+                max_keepalive_connections=connections,
+            ),
         }
-        if asynchronous:
-            kwargs["limits"] = Limits(
-                max_connections=self.concurrency,
-                max_keepalive_connections=self.concurrency // 4,
-            )
         if self.token:
             return kwargs
 
@@ -298,8 +617,7 @@ class HTTPClient(BaseSettings):
             return kwargs
 
         if isinstance(credential, OIDCCredential):
-            refresher = auth.arefresh(self) if asynchronous else auth.refresh(self)
-            kwargs["event_hooks"]["request"].insert(0, refresher)
+            kwargs["event_hooks"]["request"].insert(0, self._refresh_hook(asynchronous))
             return kwargs
 
         if isinstance(credential, X509Credential):
@@ -319,6 +637,23 @@ class HTTPClient(BaseSettings):
             return kwargs
         return kwargs
 
+    def _refresh_hook(self, asynchronous: bool) -> Any:
+        """Return the OIDC refresh hook, with a background refresher if enabled.
+
+        Args:
+            asynchronous (bool): Whether the hook is for the asynchronous client.
+
+        Returns:
+            Any: The sync or async refresh hook.
+        """
+        if asynchronous:
+            if self.background_refresh and self._arefresher is None:
+                self._arefresher = auth.AsyncRefresher(self, self.refresh_fraction)
+            return auth.arefresh(self, self._arefresher)
+        if self.background_refresh and self._refresher is None:
+            self._refresher = auth.Refresher(self, self.refresh_fraction)
+        return auth.refresh(self, self._refresher)
+
     def _get_ssl_context(self, source: Path) -> ssl.SSLContext:
         """Get SSL context from certificate file.
 
@@ -328,11 +663,7 @@ class HTTPClient(BaseSettings):
         Returns:
             ssl.SSLContext: SSL context.
         """
-        certfile = source.as_posix()
-        ctx = ssl.create_default_context(ssl.Purpose.SERVER_AUTH)
-        ctx.minimum_version = ssl.TLSVersion.TLSv1_2
-        ctx.load_cert_chain(certfile=certfile)
-        return ctx
+        return tls.certificate(source)
 
     def _get_http_headers(
         self,
@@ -396,6 +727,8 @@ class HTTPClient(BaseSettings):
 
     def _close(self) -> None:
         """Close sync client."""
+        if self._refresher is not None:
+            self._refresher.stop()
         if self._client:
             log.debug("Closing synchronous HTTPx client")
             self._client.close()
@@ -421,6 +754,8 @@ class HTTPClient(BaseSettings):
 
     async def _aclose(self) -> None:
         """Close async client."""
+        if self._arefresher is not None:
+            await self._arefresher.stop()
         if self._asynclient:
             log.debug("Closing asynchronous HTTPx client")
             await self._asynclient.aclose()
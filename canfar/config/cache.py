@@ -0,0 +1,108 @@
+"""Memoized configuration snapshots.
+
+Building ``Configuration`` reads and parses the YAML file and runs every model
+validator. One CLI command needs the configuration in several places (console,
+banner, clients, server selection), so the parsed result is kept and reused for
+as long as the file and the ``CANFAR_*`` environment are unchanged. Callers get
+deep copies of it, which is much cheaper than parsing again.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from typing import TYPE_CHECKING, NamedTuple
+
+if TYPE_CHECKING:
+    from canfar.models.config import Configuration
+
+_Fingerprint = tuple[int, int, int]
+_Key = tuple[str, _Fingerprint | None, tuple[tuple[str, str], ...]]
+
+
+class CacheInfo(NamedTuple):
+    """Snapshot cache statistics.
+
+    Attributes:
+        hits: Snapshots served without parsing.
+        misses: Snapshots that parsed the configuration.
+    """
+
+    hits: int
+    misses: int
+
+
+class _SnapshotCache:
+    """Single-entry cache of the most recently parsed configuration."""
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.entry: tuple[_Key, Configuration] | None = None
+        self.hits = 0
+        self.misses = 0
+
+
+_cache = _SnapshotCache()
+
+
+def _key() -> _Key:
+    """Return the identity of the current configuration sources."""
+    from canfar.models.config import CONFIG_PATH  # noqa: PLC0415
+
+    fingerprint: _Fingerprint | None
+    try:
+        stat = CONFIG_PATH.stat()
+    except OSError:
+        fingerprint = None
+    else:
+        # Saves replace the file, so the inode changes even within one mtime tick.
+        fingerprint = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+    environment = tuple(
+        sorted(
+            (name.upper(), value)
+            for name, value in os.environ.items()
+            if name.upper().startswith("CANFAR_")
+        )
+    )
+    return CONFIG_PATH.as_posix(), fingerprint, environment
+
+
+def snapshot() -> Configuration:
+    """Return the configuration for the current file and environment.
+
+    The parsed configuration is cached; each caller gets its own deep copy, so
+    changes to it never reach other callers or later snapshots.
+
+    Returns:
+        Configuration: Private copy of the parsed configuration.
+
+    Raises:
+        ConfigResetRequiredError: If the configuration file is unsupported.
+        ValidationError: If the configuration is invalid.
+    """
+    from canfar.models.config import Configuration  # noqa: PLC0415
+
+    key = _key()
+    with _cache.lock:
+        if _cache.entry is not None and _cache.entry[0] == key:
+            _cache.hits += 1
+            return _cache.entry[1].model_copy(deep=True)
+    config = Configuration()  # ty: ignore[missing-argument]
+    with _cache.lock:
+        _cache.misses += 1
+        _cache.entry = (key, config)
+    return config.model_copy(deep=True)
+
+
+def info() -> CacheInfo:
+    """Return hit and miss counts for the snapshot cache."""
+    with _cache.lock:
+        return CacheInfo(hits=_cache.hits, misses=_cache.misses)
+
+
+def clear() -> None:
+    """Forget the cached snapshot and reset statistics."""
+    with _cache.lock:
+        _cache.entry = None
+        _cache.hits = 0
+        _cache.misses = 0
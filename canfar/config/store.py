@@ -23,6 +23,12 @@ def _default_config_path() -> Path:
     return CONFIG_PATH
 
 
+def lock_path(path: Path | None = None) -> Path:
+    """Return the lock file serializing token refreshes of a configuration."""
+    target = path or _default_config_path()
+    return target.with_name(f".{target.name}.lock")
+
+
 def _restore_oidc_secrets(config: Configuration, data: dict[str, Any]) -> None:
     """Replace masked ``SecretStr`` placeholders with values for YAML persistence."""
     authentication = data.get("authentication")
@@ -10,6 +10,11 @@ expiry and refresh for different authentication modes:
 The hooks are designed to be used with httpx clients to provide seamless
 authentication management without requiring manual intervention.
 
+With ``HTTPClient(background_refresh=True)`` a :class:`Refresher` thread (or an
+:class:`AsyncRefresher` task) renews OIDC access tokens once ``refresh_fraction``
+of their lifetime has passed, so requests find a fresh token and the hooks only
+read it.
+
 Usage:
     ```python
     from canfar.client import HTTPClient
@@ -30,16 +35,21 @@ Note:
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import threading
+import time
 from typing import TYPE_CHECKING, Any, Callable, cast
 
 from pydantic import SecretStr, ValidationError
 
 from canfar import get_logger
 from canfar.auth import oidc
+from canfar.config import store
 from canfar.models.auth import Expiry, OIDCCredential, Token
+from canfar.utils import filelock
 
 if TYPE_CHECKING:
-    from collections.abc import Awaitable, MutableMapping
+    from collections.abc import Awaitable
 
     import httpx
 
@@ -47,6 +57,12 @@ if TYPE_CHECKING:
 
 log = get_logger(__name__)
 
+FRACTION = 0.8
+"""Fraction of an access token's lifetime after which it is renewed early."""
+
+_RETRY = 30.0
+"""Seconds before a failed background refresh is attempted again."""
+
 
 class AuthenticationError(Exception):
     """Exception raised when authentication refresh fails."""
@@ -60,15 +76,31 @@ def _get_oidc_credential(client: HTTPClient) -> OIDCCredential | None:
     return credential if isinstance(credential, OIDCCredential) else None
 
 
+def _swap_access_header(
+    token: SecretStr,
+    httpx_client: httpx.Client | httpx.AsyncClient,
+) -> str:
+    """Install ``token`` on ``httpx_client`` and return its header value.
+
+    Requests built on other threads copy the client headers, so the headers
+    are replaced as a whole rather than edited in place; a reader sees either
+    the old or the new set. Nothing is written when the token is unchanged.
+    """
+    header = f"Bearer {token.get_secret_value()}"
+    if httpx_client.headers.get("Authorization") != header:
+        headers = httpx_client.headers.copy()
+        headers["Authorization"] = header
+        httpx_client.headers = headers
+    return header
+
+
 def _apply_access_header(
     token: SecretStr,
-    httpx_client_headers: MutableMapping[str, str],
+    httpx_client: httpx.Client | httpx.AsyncClient,
     request: httpx.Request,
 ) -> None:
     """Apply one access token to the active client and outgoing request."""
-    header = f"Bearer {token.get_secret_value()}"
-    httpx_client_headers["Authorization"] = header
-    request.headers["Authorization"] = header
+    request.headers["Authorization"] = _swap_access_header(token, httpx_client)
 
 
 def _refresh_parameters(
@@ -89,14 +121,12 @@ def _refresh_parameters(
     )
 
 
-def _apply_refreshed_token(
+def _store_refreshed_token(
     client: HTTPClient,
     credential: OIDCCredential,
     refreshed: dict[str, Any],
-    httpx_client_headers: MutableMapping[str, str],
-    request: httpx.Request,
-) -> None:
-    """Atomically persist refreshed OIDC state, then update active headers."""
+) -> SecretStr:
+    """Atomically persist refreshed OIDC state and return the new access token."""
     previous_refresh = credential.token.refresh
     previous_refresh_value = (
         previous_refresh.get_secret_value() if previous_refresh is not None else None
@@ -140,21 +170,280 @@ def _apply_refreshed_token(
     candidate.save()
     client.config.update_credential(updated)
     log.debug("Authentication refreshed and configuration saved.")
+    return access_token
 
-    _apply_access_header(access_token, httpx_client_headers, request)
-    log.debug("HTTP request headers updated with new token.")
-    log.info("OIDC Access Token Refreshed.")
 
+def _adopt_persisted(
+    client: HTTPClient, credential: OIDCCredential
+) -> SecretStr | None:
+    """Adopt a newer token another process saved since ``credential`` was read.
+
+    Returns:
+        SecretStr | None: The adopted access token, or None if the saved record
+            is not newer and usable.
+    """
+    from canfar.config.migration import ConfigResetRequiredError  # noqa: PLC0415
+    from canfar.models.config import Configuration  # noqa: PLC0415
+
+    try:
+        persisted = Configuration.load().get_credential(credential.idp)
+    except (KeyError, OSError, ValueError, ConfigResetRequiredError):
+        return None
+    if (
+        not isinstance(persisted, OIDCCredential)
+        or persisted.token.access is None
+        or persisted.expiry.access is None
+        or persisted.expired
+    ):
+        return None
+    current = credential.expiry.access
+    if current is not None and persisted.expiry.access <= current:
+        return None
+    client.config.update_credential(persisted)
+    log.info("Adopted OIDC access token refreshed by another process.")
+    return persisted.token.access
+
+
+def _refresh_once(
+    client: HTTPClient,
+    credential: OIDCCredential,
+    parameters: tuple[str, str, str, str],
+) -> SecretStr:
+    """Refresh ``credential`` at most once across processes sharing its config.
+
+    The refresh runs under an exclusive lock on the configuration. A process
+    that waited for the lock adopts the token the holder saved instead of
+    calling the token endpoint, which would rotate the refresh token again.
+
+    Returns:
+        SecretStr: The new access token.
+    """
+    with filelock.locked(store.lock_path()):
+        adopted = _adopt_persisted(client, credential)
+        if adopted is not None:
+            return adopted
+        url, identity, secret, token = parameters
+        log.debug("Starting synchronous OIDC token refresh.")
+        refreshed = oidc.sync_refresh(
+            url=url, identity=identity, secret=secret, token=token
+        )
+        log.debug("Synchronous OIDC token refresh successful.")
+        return _store_refreshed_token(client, credential, refreshed)
+
+
+async def _arefresh_once(
+    client: HTTPClient,
+    credential: OIDCCredential,
+    parameters: tuple[str, str, str, str],
+) -> SecretStr:
+    """Asynchronous :func:`_refresh_once`.
+
+    Returns:
+        SecretStr: The new access token.
+    """
+    async with filelock.alocked(store.lock_path()):
+        adopted = _adopt_persisted(client, credential)
+        if adopted is not None:
+            return adopted
+        url, identity, secret, token = parameters
+        log.debug("Starting asynchronous OIDC token refresh.")
+        refreshed = await oidc.refresh(
+            url=url, identity=identity, secret=secret, token=token
+        )
+        log.debug("Asynchronous OIDC token refresh successful.")
+        return _store_refreshed_token(client, credential, refreshed)
+
+
+class _Schedule:
+    """Renewal schedule shared by the background refreshers.
+
+    The issue time of a token is not recorded, so the lifetime is measured from
+    when the refresher first sees each access token expiry. Tokens refreshed by
+    a request hook or another process are picked up the same way.
+
+    Args:
+        client (HTTPClient): Client whose OIDC Authentication Record is renewed.
+        fraction (float): Fraction of the lifetime after which to renew.
+    """
+
+    def __init__(self, client: HTTPClient, fraction: float = FRACTION) -> None:
+        self.client = client
+        self.fraction = fraction
+        self.httpx_client: httpx.Client | httpx.AsyncClient | None = None
+        self.renewals = 0
+        self._expires: float | None = None
+        self._seen = time.time()
+
+    def due(self) -> float | None:
+        """Return seconds until the next renewal, or None if it cannot renew."""
+        credential = _get_oidc_credential(self.client)
+        if credential is None or not credential.refreshable:
+            return None
+        expires = credential.expiry.access
+        if expires is None:
+            # Nothing to schedule against: leave renewal to the request hooks
+            # and look again later, in case another refresh records an expiry.
+            return _RETRY
+        now = time.time()
+        if expires != self._expires:
+            self._expires, self._seen = expires, min(now, expires)
+        renew = self._seen + self.fraction * (expires - self._seen)
+        return max(0.0, renew - now)
+
+    def _renewable(self) -> tuple[OIDCCredential, tuple[str, str, str, str]] | None:
+        """Return the record and refresh inputs if a renewal is still due."""
+        if self.due() != 0.0:
+            return None
+        credential = _get_oidc_credential(self.client)
+        if credential is None:
+            return None
+        parameters = _refresh_parameters(credential)
+        return None if parameters is None else (credential, parameters)
+
+    def _renewed(self, access: SecretStr) -> None:
+        if self.httpx_client is not None:
+            _swap_access_header(access, self.httpx_client)
+        self.renewals += 1
+        log.info("OIDC Access Token Refreshed in the background.")
+
+
+class Refresher(_Schedule):
+    """Renew an OIDC access token in a background thread before it expires.
+
+    Args:
+        client (HTTPClient): Client whose OIDC Authentication Record is renewed.
+        fraction (float): Fraction of the lifetime after which to renew.
+            Defaults to ``FRACTION``.
+    """
+
+    def __init__(self, client: HTTPClient, fraction: float = FRACTION) -> None:
+        super().__init__(client, fraction)
+        self.lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        """Start the background thread, unless it is already running."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="canfar-oidc-refresh", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the background thread."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
 
-def refresh(client: HTTPClient) -> Callable[[httpx.Request], None]:
+    def renew(self) -> None:
+        """Refresh the access token now if it is due.
+
+        Raises:
+            ValueError: If the token endpoint rejects the refresh.
+            OSError: If the refreshed configuration cannot be saved.
+        """
+        with self.lock:
+            renewable = self._renewable()
+            if renewable is None:
+                return
+            self._renewed(_refresh_once(self.client, *renewable))
+
+    def _run(self) -> None:
+        while (delay := self.due()) is not None:
+            if self._stop.wait(delay):
+                return
+            try:
+                self.renew()
+            except (ValueError, OSError):
+                log.warning("Background OIDC token refresh failed, retrying.")
+                if self._stop.wait(_RETRY):
+                    return
+        log.debug("OIDC Authentication Record cannot be refreshed in background.")
+
+
+class AsyncRefresher(_Schedule):
+    """Renew an OIDC access token in a background task before it expires.
+
+    The task starts with the first request of the asynchronous client, since
+    it needs a running event loop.
+
+    Args:
+        client (HTTPClient): Client whose OIDC Authentication Record is renewed.
+        fraction (float): Fraction of the lifetime after which to renew.
+            Defaults to ``FRACTION``.
+    """
+
+    def __init__(self, client: HTTPClient, fraction: float = FRACTION) -> None:
+        super().__init__(client, fraction)
+        self.lock = asyncio.Lock()
+        self._task: asyncio.Task[None] | None = None
+
+    def start(self) -> None:
+        """Start the background task, unless it is already running."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        """Cancel the background task and wait for it to finish."""
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+    async def renew(self) -> None:
+        """Refresh the access token now if it is due.
+
+        Raises:
+            ValueError: If the token endpoint rejects the refresh.
+            OSError: If the refreshed configuration cannot be saved.
+        """
+        async with self.lock:
+            renewable = self._renewable()
+            if renewable is None:
+                return
+            self._renewed(await _arefresh_once(self.client, *renewable))
+
+    async def _run(self) -> None:
+        while (delay := self.due()) is not None:
+            await asyncio.sleep(delay)
+            try:
+                await self.renew()
+            except (ValueError, OSError):
+                log.warning("Background OIDC token refresh failed, retrying.")
+                await asyncio.sleep(_RETRY)
+        log.debug("OIDC Authentication Record cannot be refreshed in background.")
+
+
+def _apply_current_token(
+    credential: OIDCCredential,
+    httpx_client: httpx.Client | httpx.AsyncClient,
+    request: httpx.Request,
+) -> None:
+    """Apply the record's unexpired access token, if it has one."""
+    if credential.token.access is not None:
+        _apply_access_header(credential.token.access, httpx_client, request)
+
+
+def refresh(
+    client: HTTPClient,
+    refresher: Refresher | None = None,
+) -> Callable[[httpx.Request], None]:
     """Create an authentication refresh hook for httpx clients.
 
     Args:
         client (HTTPClient): The HTTPClient instance.
+        refresher (Refresher | None): Background refresher whose lock the hook
+            shares, so an expired token is only refreshed once.
 
     Returns:
         Callable[[httpx.Request], None]: The auth hook function.
     """
+    lock = refresher.lock if refresher is not None else threading.Lock()
 
     def hook(request: httpx.Request) -> None:
         """Synchronous refresh hook for httpx clients.
@@ -168,55 +457,53 @@ def refresh(client: HTTPClient) -> Callable[[httpx.Request], None]:
             return
 
         if not credential.expired:
-            if credential.token.access is not None:
-                _apply_access_header(
-                    credential.token.access,
-                    client.client.headers,
-                    request,
-                )
+            _apply_current_token(credential, client.client, request)
             log.debug("Skipping auth refresh, access token is not expired.")
             return
 
-        parameters = _refresh_parameters(credential)
-        if parameters is None:
-            log.warning("OIDC Authentication Record cannot be refreshed.")
-            return
-        token_url, identity, client_secret, refresh_token = parameters
-
-        try:
-            log.debug("Starting synchronous OIDC token refresh.")
-            token = oidc.sync_refresh(
-                url=token_url,
-                identity=identity,
-                secret=client_secret,
-                token=refresh_token,
-            )
-            log.debug("Synchronous OIDC token refresh successful.")
-            _apply_refreshed_token(
-                client,
-                credential,
-                token,
-                client.client.headers,
-                request,
-            )
-
-        except (ValueError, OSError):
-            msg = "Failed to refresh OIDC token"
-            raise AuthenticationError(msg) from None
+        with lock:
+            # The background refresher may have renewed it while we waited.
+            credential = _get_oidc_credential(client)
+            if credential is None:
+                return
+            if not credential.expired:
+                _apply_current_token(credential, client.client, request)
+                return
+
+            parameters = _refresh_parameters(credential)
+            if parameters is None:
+                log.warning("OIDC Authentication Record cannot be refreshed.")
+                return
+
+            try:
+                access = _refresh_once(client, credential, parameters)
+                _apply_access_header(access, client.client, request)
+                log.info("OIDC Access Token Refreshed.")
+            except (ValueError, OSError):
+                msg = "Failed to refresh OIDC token"
+                raise AuthenticationError(msg) from None
 
     return hook
 
 
-def arefresh(client: HTTPClient) -> Callable[[httpx.Request], Awaitable[None]]:
+def arefresh(
+    client: HTTPClient,
+    refresher: AsyncRefresher | None = None,
+) -> Callable[[httpx.Request], Awaitable[None]]:
     """Create an asynchronous authentication refresh hook for httpx clients.
 
+    Requests read a valid access token without taking the lock, so only
+    requests that find the token expired queue behind the refresh.
+
     Args:
         client (HTTPClient): The HTTPClient instance.
+        refresher (AsyncRefresher | None): Background refresher to start with
+            the first request and whose lock the hook shares.
 
     Returns:
         Callable[[httpx.Request], Awaitable[None]]: The async auth hook.
     """
-    lock = asyncio.Lock()
+    lock = refresher.lock if refresher is not None else asyncio.Lock()
 
     async def ahook(request: httpx.Request) -> None:
         """Asynchronous refresh hook for httpx clients.
@@ -224,44 +511,35 @@ def arefresh(client: HTTPClient) -> Callable[[httpx.Request], Awaitable[None]]:
         Args:
             request (httpx.Request): The outgoing HTTP request.
         """
+        credential = _get_oidc_credential(client)
+        if credential is None:
+            log.debug("Skipping auth refresh without a saved OIDC record.")
+            return
+        if refresher is not None:
+            refresher.start()
+
+        if not credential.expired:
+            _apply_current_token(credential, client.asynclient, request)
+            return
+
         async with lock:
+            # Another request or the background refresher may have renewed it.
             credential = _get_oidc_credential(client)
             if credential is None:
-                log.debug("Skipping auth refresh without a saved OIDC record.")
                 return
-
             if not credential.expired:
-                if credential.token.access is not None:
-                    _apply_access_header(
-                        credential.token.access,
-                        client.asynclient.headers,
-                        request,
-                    )
+                _apply_current_token(credential, client.asynclient, request)
                 return
 
             parameters = _refresh_parameters(credential)
             if parameters is None:
                 log.warning("OIDC Authentication Record cannot be refreshed.")
                 return
-            token_url, identity, client_secret, refresh_token = parameters
 
             try:
-                log.debug("Starting asynchronous OIDC token refresh.")
-                token = await oidc.refresh(
-                    url=token_url,
-                    identity=identity,
-                    secret=client_secret,
-                    token=refresh_token,
-                )
-                log.debug("Asynchronous OIDC token refresh successful.")
-                _apply_refreshed_token(
-                    client,
-                    credential,
-                    token,
-                    client.asynclient.headers,
-                    request,
-                )
-
+                access = await _arefresh_once(client, credential, parameters)
+                _apply_access_header(access, client.asynclient, request)
+                log.info("OIDC Access Token Refreshed.")
             except (ValueError, OSError):
                 msg = "Failed to refresh OIDC token"
                 raise AuthenticationError(msg) from None
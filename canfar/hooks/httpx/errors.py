@@ -1,8 +1,10 @@
 """Module for providing httpx event hooks to log error responses.
 
-When using httpx event hooks for 'response' events, the response body is read
-inside the error-handling context so that body-download errors (e.g.
-ReadTimeout during streaming) are warning-logged alongside status errors.
+Error response bodies are read inside the error-handling context so that
+body-download errors (e.g. ReadTimeout) are warning-logged alongside status
+errors. Successful response bodies are left unread: HTTPx reads them after the
+hooks for regular requests, and streamed requests (such as following session
+logs) consume them incrementally.
 """
 
 import contextlib
@@ -114,7 +116,7 @@ def _error_handling() -> Generator[None, None, None]:
 
 
 def catch(response: httpx.Response) -> None:
-    """Read the response body and raise HTTPStatusError for error responses.
+    """Read the body of error responses and raise HTTPStatusError for them.
 
     Args:
         response: An httpx.Response object.
@@ -128,12 +130,13 @@ def catch(response: httpx.Response) -> None:
         httpx.RequestError: for other request errors.
     """
     with _error_handling():
-        response.read()
+        if response.is_error:
+            response.read()
         response.raise_for_status()
 
 
 async def acatch(response: httpx.Response) -> None:
-    """Read the response body and raise HTTPStatusError for error responses (async).
+    """Read the body of error responses and raise HTTPStatusError for them (async).
 
     Args:
         response: An httpx.Response object.
@@ -147,5 +150,6 @@ async def acatch(response: httpx.Response) -> None:
         httpx.RequestError: for other request errors.
     """
     with _error_handling():
-        await response.aread()
+        if response.is_error:
+            await response.aread()
         response.raise_for_status()
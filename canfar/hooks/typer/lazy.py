@@ -0,0 +1,141 @@
+"""Typer group that imports subcommand modules on first use."""
+
+from __future__ import annotations
+
+import importlib
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, ClassVar
+
+import typer
+from typer.core import TyperCommand
+from typer.main import get_command_from_info, get_group_from_info
+from typer.models import CommandInfo, Default, TyperInfo
+
+from canfar.hooks.typer.aliases import AliasGroup
+
+if TYPE_CHECKING:
+    from typer._click.core import Command
+    from typer._click.core import Context as ClickContext
+
+
+@dataclass(frozen=True)
+class LazyCommand:
+    """Subcommand registered by import path instead of by object.
+
+    Attributes:
+        name: Command name, including aliases such as ``"run | launch"``.
+        target: ``"module:attribute"`` naming a ``typer.Typer`` app or a command
+            callback function.
+        help: Help text overriding the target's own, as in ``add_typer``.
+        short_help: Listing text used while the target has not been imported.
+            Defaults to ``help``.
+        rich_help_panel: Help panel the command is listed under.
+        no_args_is_help: Show help when invoked without arguments.
+        hidden: Hide the command from help listings.
+    """
+
+    name: str
+    target: str
+    help: str | None = None
+    short_help: str | None = None
+    rich_help_panel: str | None = None
+    no_args_is_help: bool = False
+    hidden: bool = False
+
+    def load(
+        self,
+        *,
+        pretty_exceptions_short: bool,
+        suggest_commands: bool,
+        rich_markup_mode: Any,
+    ) -> Command:
+        """Import the target and build its Click command.
+
+        Returns:
+            Command: The command Typer would have built for an eager registration.
+        """
+        module, _, attribute = self.target.partition(":")
+        obj = getattr(importlib.import_module(module), attribute)
+        if isinstance(obj, typer.Typer):
+            return get_group_from_info(
+                TyperInfo(
+                    obj,
+                    name=self.name,
+                    help=Default(None) if self.help is None else self.help,
+                    no_args_is_help=self.no_args_is_help,
+                    rich_help_panel=self.rich_help_panel,
+                    hidden=self.hidden,
+                ),
+                pretty_exceptions_short=pretty_exceptions_short,
+                suggest_commands=suggest_commands,
+                rich_markup_mode=rich_markup_mode,
+            )
+        return get_command_from_info(
+            CommandInfo(
+                name=self.name,
+                callback=obj,
+                help=self.help,
+                no_args_is_help=self.no_args_is_help,
+                rich_help_panel=self.rich_help_panel,
+                hidden=self.hidden,
+            ),
+            pretty_exceptions_short=pretty_exceptions_short,
+            rich_markup_mode=rich_markup_mode,
+        )
+
+
+class _Placeholder(TyperCommand):
+    """Help-listing stand-in for a subcommand that has not been imported."""
+
+    def __init__(self, spec: LazyCommand) -> None:
+        super().__init__(
+            name=spec.name,
+            help=spec.help,
+            short_help=spec.short_help or spec.help,
+            hidden=spec.hidden,
+            no_args_is_help=spec.no_args_is_help,
+            rich_help_panel=spec.rich_help_panel,
+        )
+        self.spec = spec
+
+
+class LazyAliasGroup(AliasGroup):
+    """Alias group whose ``lazy_commands`` are imported only when resolved.
+
+    Help listings and completion of command names are served from the
+    ``LazyCommand`` metadata, so ``--help`` and unrelated subcommands never
+    import the modules behind the other commands. Subclasses declare the specs:
+
+    Examples:
+        >>> class Root(LazyAliasGroup):
+        ...     lazy_commands = (LazyCommand("ps", "canfar.cli.ps:ps"),)
+        >>> app = typer.Typer(cls=Root)
+    """
+
+    lazy_commands: ClassVar[tuple[LazyCommand, ...]] = ()
+    pretty_exceptions_short: ClassVar[bool] = True
+
+    def __init__(self, **attrs: Any) -> None:
+        super().__init__(**attrs)
+        eager = dict(self.commands)
+        self.commands = {spec.name: _Placeholder(spec) for spec in self.lazy_commands}
+        self.commands.update(eager)
+
+    def resolve_command(
+        self,
+        ctx: ClickContext,
+        args: list[str],
+    ) -> tuple[str | None, Command | None, list[str]]:
+        """Import the requested subcommand before Click dispatches to it."""
+        if args:
+            self._load(self._group_cmd_name(args[0]))
+        return super().resolve_command(ctx, args)
+
+    def _load(self, name: str) -> None:
+        placeholder = self.commands.get(name)
+        if isinstance(placeholder, _Placeholder):
+            self.commands[name] = placeholder.spec.load(
+                pretty_exceptions_short=self.pretty_exceptions_short,
+                suggest_commands=self.suggest_commands,
+                rich_markup_mode=self.rich_markup_mode,
+            )
@@ -124,16 +124,6 @@ def _oidc_expired(expiry: Expiry) -> bool:
     return expiry.access <= time.time()
 
 
-def _x509_expiry(path: Path | None, expiry: float) -> float | None:
-    """Return the known or certificate-derived X.509 expiry timestamp."""
-    if path is None:
-        return None
-    if math.isclose(expiry, 0.0, abs_tol=1e-9):
-        expiry = x509.expiry(path)
-        log.debug("computed expiry from cert: %s", expiry)
-    return expiry
-
-
 class DeviceAuthorization(BaseModel):
     """OIDC device authorization challenge returned for user approval."""
 
@@ -189,12 +179,17 @@ class X509Credential(BaseModel):
 
     @property
     def expired(self) -> bool:
-        """Return whether this X.509 Authentication Record is expired."""
-        expiry = _x509_expiry(self.path, self.expiry)
-        if expiry is None:
+        """Return whether this X.509 Authentication Record is expired.
+
+        An unknown expiry is read from the certificate once and stored, so
+        later checks only compare the deadline with the current time.
+        """
+        if self.path is None:
             return True
-        self.expiry = expiry
-        return expiry <= time.time()
+        if math.isclose(self.expiry, 0.0, abs_tol=1e-9):
+            self.expiry = x509.expiry(self.path)
+            log.debug("computed expiry from cert: %s", self.expiry)
+        return self.expiry <= time.time()
 
 
 class OIDCCredential(BaseModel):
@@ -260,6 +260,22 @@ class Configuration(BaseSettings):
 
         return self
 
+    @classmethod
+    def snapshot(cls) -> Configuration:
+        """Return the configuration, parsed once per file or env change.
+
+        Each call returns a private deep copy of the cached parse, so callers
+        may modify it without affecting others.
+        """
+        from canfar.config.cache import snapshot  # noqa: PLC0415
+
+        return snapshot()
+
+    @classmethod
+    def load(cls) -> Configuration:
+        """Return a private, mutable copy of the current configuration."""
+        return cls.snapshot()
+
     def save(self) -> None:
         """Save the current configuration to the default YAML file."""
         from canfar.config.store import save_config  # noqa: PLC0415
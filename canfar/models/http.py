@@ -98,3 +98,15 @@ class Server(BaseModel):
             "when known."
         ),
     )
+    latency: float | None = Field(
+        default=None,
+        title="Discovery Round-Trip Time (ms)",
+        description="Median round-trip time measured during the last discovery.",
+        ge=0,
+    )
+    measured: float | None = Field(
+        default=None,
+        title="Latency Measurement Time",
+        description="Unix timestamp of the discovery that measured ``latency``.",
+        ge=0,
+    )
@@ -79,6 +79,8 @@ class Server(BaseModel):
     url: str
     status: int | None = None
     name: str | None = None
+    rtt: float | None = None
+    """Median HEAD round-trip time in seconds, when the endpoint responded."""
 
 
 class ContainerRegistry(BaseModel):
@@ -4,13 +4,13 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from defusedxml import ElementTree
 from httpx import URL
 from pydantic import model_validator
 from typing_extensions import Self
 
 from canfar import get_logger
 from canfar.client import HTTPClient
+from canfar.utils import vosi
 
 if TYPE_CHECKING:
     from httpx import Response
@@ -56,18 +56,9 @@ class Overview(HTTPClient):
         if not data:
             log.error("No data returned from availability endpoint.")
             return False
-        root = ElementTree.fromstring(data)
-        available = root.find(
-            ".//{http://www.ivoa.net/xml/VOSIAvailability/v1.0}available",
-        )
-        availaibility: str | None = available.text if available is not None else None
-
-        note = root.find(
-            ".//{http://www.ivoa.net/xml/VOSIAvailability/v1.0}note",
-        )
-        notify: str | None = note.text if note is not None else None
-        if availaibility is None:
+        available, notify = vosi.availability(data)
+        if available is None:
             log.error("No availability information found in the response.")
             return False
         log.info(notify or "No additional information provided.")
-        return availaibility == "true"
+        return available
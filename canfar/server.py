@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+import time
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Literal
 from xml.etree.ElementTree import ParseError
@@ -25,14 +26,29 @@ from canfar.models.http import (
     Server,
 )
 from canfar.models.registry import IVOARegistrySearch
-from canfar.utils import vosi
-from canfar.utils.discover import Discover
+from canfar.utils import httpcache, transport, vosi
+from canfar.utils.discover import RANK_SAMPLES, RTT_SAMPLES, Discover
 
 log = get_logger(__name__)
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from canfar.client import HTTPClient
     from canfar.models.registry import Server as DiscoveredServer
 
+# Maximum capability requests in flight while enriching discovered servers.
+ENRICH_CONCURRENCY = 8
+
+FASTEST = "fastest"
+"""Selector that activates the reachable server with the lowest latency."""
+
+REACHABLE = "reachable"
+UNREACHABLE = "unreachable"
+
+LATENCY_TTL = 600.0
+"""Seconds a latency measurement is trusted by the ``"fastest"`` selector."""
+
 
 class ServerSelectorError(ValueError):
     """Raised when a server selector is ambiguous or not found."""
@@ -84,7 +100,7 @@ class ServerActivation:
     """Result from activating an Authentication and Server pair."""
 
     server: Server
-    reason: Literal["active", "remembered", "single", "selected"]
+    reason: Literal["active", "remembered", "single", "selected", "fastest"]
 
 
 def discover(
@@ -94,6 +110,7 @@ def discover(
     dev: bool = False,
     timeout: int = 2,
     save: bool = True,
+    samples: int = RTT_SAMPLES,
 ) -> list[Server]:
     """Discover, merge, and optionally persist servers for ``idp``.
 
@@ -103,6 +120,7 @@ def discover(
         dev: Include development registries and endpoints during discovery.
         timeout: HTTP timeout in seconds for discovery requests.
         save: Persist the configuration after merging discovered servers.
+        samples: HEAD requests per endpoint; the median latency is recorded.
 
     Returns:
         list[Server]: Newly discovered server records.
@@ -110,17 +128,19 @@ def discover(
     Raises:
         ServerDiscoveryError: If discovery fails or finds no usable servers.
     """
-    target_config = config or Configuration()  # ty: ignore[missing-argument]
+    target_config = config or Configuration.load()
     discovered = asyncio.run(
         _discover_for_idp(
             idp,
             config=target_config,
             dev=dev,
             timeout=timeout,
+            samples=samples,
         )
     )
     known_servers = dict(target_config.servers)
     canonical: dict[str, Server] = {}
+    unreachable: set[str] = set()
     for server in sorted(
         discovered,
         key=lambda item: (
@@ -133,6 +153,9 @@ def discover(
         name = server.name
         if name is None:
             continue
+        if server.status == UNREACHABLE:
+            unreachable.add(name)
+            continue
         known = canonical.get(name, known_servers.get(name))
         if server.version is None or not server.auths:
             if known is not None and known.version is not None and known.auths:
@@ -144,6 +167,7 @@ def discover(
                 include={"idp", "name", "uri", "url", "version", "auths"},
                 exclude_none=True,
             )
+            updates.update(server.model_dump(include={"status", "latency", "measured"}))
             merged_server = known.model_copy(update=updates, deep=True)
         canonical[name] = merged_server
 
@@ -157,7 +181,17 @@ def discover(
         canonical[name]
         for name in sorted(canonical, key=lambda value: (value.casefold(), value))
     ]
-    target_config.upsert_servers(merged)
+    # Only servers this discovery probed and could not reach are marked;
+    # servers it did not probe, e.g. development ones, keep their records.
+    missing = [
+        known.model_copy(
+            update={"status": UNREACHABLE, "latency": None, "measured": None},
+            deep=True,
+        )
+        for name, known in known_servers.items()
+        if known.idp == idp and name in unreachable and name not in canonical
+    ]
+    target_config.upsert_servers([*merged, *missing])
     if save:
         target_config.save()
     return merged
@@ -178,9 +212,13 @@ def activate(
     single available server. Multiple choices raise ``ServerSelectionRequiredError``
     so the caller can prompt and retry with an explicit selector.
 
+    The ``"fastest"`` selector picks the reachable server with the lowest
+    latency measured by the last discovery, running discovery first when no
+    server for ``idp`` has a measurement younger than ``LATENCY_TTL``.
+
     Args:
         idp: Canonical Identity Provider key.
-        selector: Optional server name, URI, or prompt choice.
+        selector: Optional server name, URI, ``"fastest"``, or prompt choice.
         config: Configuration to update in place. Defaults to loading config.
         dev: Include development registries and endpoints during discovery.
         timeout: HTTP timeout in seconds for discovery and validation requests.
@@ -194,9 +232,12 @@ def activate(
         ServerDiscoveryError: If discovery fails before usable data is produced.
         ServerFetchError: If fetch or validation fails before save.
     """
-    target_config = config or Configuration()  # ty: ignore[missing-argument]
-    reason: Literal["active", "remembered", "single", "selected"]
-    if selector is None:
+    target_config = config or Configuration.load()
+    reason: Literal["active", "remembered", "single", "selected", "fastest"]
+    if selector == FASTEST and _resolve_selector(target_config, FASTEST, idp) is None:
+        selector = _fastest_selector(target_config, idp, dev=dev, timeout=timeout)
+        reason = "fastest"
+    elif selector is None:
         active_server = _active_server_for_idp(target_config, idp)
         if active_server is not None:
             target_config.set_active_selection(idp, active_server)
@@ -263,6 +304,7 @@ def list_servers(
 
     When no servers are saved for the active IDP and ``discover_if_empty`` is
     ``True``, registry discovery runs once and discovered servers are persisted.
+    Servers are ordered by :func:`rank`.
 
     Args:
         discover_if_empty: Whether to discover servers when none are saved.
@@ -270,23 +312,48 @@ def list_servers(
         timeout: HTTP timeout in seconds for discovery requests.
 
     Returns:
-        list[Server]: Saved server records for the active IDP.
+        list[Server]: Saved server records for the active IDP, fastest first.
 
     Raises:
         ServerDiscoveryError: If discovery fails before usable data is produced.
     """
-    config = Configuration()  # ty: ignore[missing-argument]
+    config = Configuration.load()
     active_idp = config.active.authentication
     servers = [server for server in config.servers.values() if server.idp == active_idp]
     if servers or not discover_if_empty:
-        return servers
+        return rank(servers)
 
     discover(active_idp, config=config, dev=dev, timeout=timeout, save=False)
     config.save()
-    return [server for server in config.servers.values() if server.idp == active_idp]
+    return rank(
+        [server for server in config.servers.values() if server.idp == active_idp]
+    )
+
+
+def rank(servers: Iterable[Server]) -> list[Server]:
+    """Order servers by measured latency, nearest first.
+
+    Reachable servers with a latency come first in increasing latency, then
+    servers without a measurement, then servers the last discovery could not
+    reach. The order is otherwise preserved.
+
+    Args:
+        servers: Server records to order.
 
+    Returns:
+        list[Server]: Ranked server records.
+    """
+    return sorted(
+        servers,
+        key=lambda server: (
+            server.status == UNREACHABLE,
+            server.latency is None,
+            server.latency or 0.0,
+        ),
+    )
 
-def use(selector: str, *, dev: bool = False, timeout: int = 2) -> None:
+
+def use(selector: str, *, dev: bool = False, timeout: int = 2) -> Server:
     """Select and persist the active server by name or URI.
 
     Resolves ``selector`` within servers for the active IDP. When no known
@@ -299,18 +366,62 @@ def use(selector: str, *, dev: bool = False, timeout: int = 2) -> None:
         dev: Include development registries and endpoints during discovery.
         timeout: HTTP timeout in seconds for discovery and validation requests.
 
+    Returns:
+        Server: The activated server.
+
     Raises:
         ServerSelectorError: If ``selector`` is ambiguous or still not found.
         ServerDiscoveryError: If discovery fails before usable data is produced.
         ServerFetchError: If fetch or validation fails before save.
     """
-    config = Configuration()  # ty: ignore[missing-argument]
-    activate(
+    config = Configuration.load()
+    return activate(
         config.active.authentication,
         selector,
         config=config,
         dev=dev,
         timeout=timeout,
+    ).server
+
+
+def _fastest_selector(
+    config: Configuration,
+    idp: str,
+    *,
+    dev: bool,
+    timeout: int,
+) -> str:
+    """Return the URI of the nearest reachable server for ``idp``."""
+    servers = _servers_for_idp(config, idp)
+    if not any(_fresh(server) for server in servers):
+        discover(
+            idp,
+            config=config,
+            dev=dev,
+            timeout=timeout,
+            save=False,
+            samples=RANK_SAMPLES,
+        )
+        servers = _servers_for_idp(config, idp)
+    for server in rank(servers):
+        if server.status != UNREACHABLE and server.uri is not None:
+            log.debug(
+                "Fastest server for %s: %s (%s ms)", idp, server.name, server.latency
+            )
+            return str(server.uri)
+    msg = f"No reachable servers found for IDP '{idp}'."
+    raise ServerSelectorError(
+        msg,
+        hint="Run discovery with `canfar server ls` and retry.",
+    )
+
+
+def _fresh(server: Server) -> bool:
+    """Whether ``server`` has a latency measured within ``LATENCY_TTL``."""
+    return (
+        server.latency is not None
+        and server.measured is not None
+        and time.time() - server.measured < LATENCY_TTL
     )
 
 
@@ -381,6 +492,7 @@ async def _discover_for_idp(
     config: Configuration | None = None,
     dev: bool = False,
     timeout: int = 2,
+    samples: int = RTT_SAMPLES,
 ) -> list[Server]:
     """Discover active servers for a single Identity Provider.
 
@@ -389,9 +501,11 @@ async def _discover_for_idp(
         config: Configuration whose Authentication Record authorizes enrichment.
         dev: Include development registries and endpoints.
         timeout: HTTP timeout in seconds for discovery requests.
+        samples: HEAD requests per endpoint.
 
     Returns:
-        list[Server]: Validated HTTP server models for reachable endpoints.
+        list[Server]: Validated HTTP server models for reachable endpoints,
+            and bare ``UNREACHABLE`` records for probed endpoints that failed.
 
     Raises:
         ServerDiscoveryError: If registry retrieval fails.
@@ -419,18 +533,32 @@ async def _discover_for_idp(
             return []
 
         checked = await asyncio.gather(
-            *(discovery.check(endpoint) for endpoint in endpoints)
+            *(discovery.check(endpoint, samples) for endpoint in endpoints)
         )
-        return [
-            _discovered_to_server(
+
+    limit = asyncio.Semaphore(ENRICH_CONCURRENCY)
+
+    async def convert(endpoint: DiscoveredServer) -> Server:
+        async with limit:
+            return await _discovered_to_server(
                 endpoint,
                 idp,
                 config=config,
                 timeout=timeout,
             )
-            for endpoint in checked
-            if endpoint.status == 200
-        ]
+
+    unreachable = [
+        _unreachable(endpoint, idp) for endpoint in checked if endpoint.status != 200
+    ]
+    try:
+        reachable = await asyncio.gather(
+            *(convert(endpoint) for endpoint in checked if endpoint.status == 200)
+        )
+        return [*reachable, *unreachable]
+    finally:
+        # Discovery runs on its own event loop (see ``discover``); release the
+        # connection pools the capability requests opened on it.
+        await transport.aclose()
 
 
 def _host_slug(uri: AnyUrl) -> str | None:
@@ -440,7 +568,19 @@ def _host_slug(uri: AnyUrl) -> str | None:
     return uri.host.replace(".", "-")
 
 
-def _discovered_to_server(
+def _unreachable(endpoint: DiscoveredServer, idp: str) -> Server:
+    """Return a bare record of a discovered endpoint that failed its probe."""
+    uri = AnyUrl(endpoint.uri)
+    return Server(
+        idp=idp,
+        name=endpoint.name or _host_slug(uri),
+        uri=uri,
+        url=AnyHttpUrl(endpoint.url),
+        status=UNREACHABLE,
+    )
+
+
+async def _discovered_to_server(
     endpoint: DiscoveredServer,
     idp: str,
     *,
@@ -467,8 +607,11 @@ def _discovered_to_server(
         name=endpoint.name or _host_slug(uri),
         uri=uri,
         url=AnyHttpUrl(endpoint.url),
+        status=REACHABLE,
+        latency=None if endpoint.rtt is None else round(endpoint.rtt * 1000, 1),
+        measured=None if endpoint.rtt is None else time.time(),
     )
-    return enrich(
+    return await aenrich(
         server,
         config=config,
         strict=False,
@@ -486,6 +629,10 @@ def enrich(
 ) -> Server:
     """Return a validated Server enriched from its VOSI capabilities.
 
+    The capabilities document is read through the on-disk discovery cache
+    (:mod:`canfar.utils.httpcache`), so repeated enrichment within the cache TTL
+    makes no request and later ones revalidate with a conditional GET.
+
     Args:
         server: Server record to enrich.
         config: Configuration whose Authentication Record should authorize the
@@ -505,48 +652,135 @@ def enrich(
         ServerFetchError: If ``strict`` is ``True`` and capabilities cannot
             be retrieved, parsed, or contain no session capabilities.
     """
+    try:
+        with _capabilities_client(
+            server,
+            config=config,
+            authentication_idp=authentication_idp,
+            timeout=timeout,
+        ) as client:
+            request_client = client.client
+            _accept_capabilities(request_client.headers)
+            document = httpcache.fetch(request_client, "capabilities")
+            capabilities = vosi.capabilities(xml=document.text)
+    except _CAPABILITY_ERRORS as exc:
+        return _capabilities_unavailable(server, exc, strict=strict)
+    return _from_capabilities(server, capabilities, strict=strict)
+
+
+async def aenrich(
+    server: Server,
+    *,
+    config: Configuration | None = None,
+    authentication_idp: str | None = None,
+    strict: bool = True,
+    timeout: int = 2,
+) -> Server:
+    """Asynchronously return a Server enriched from its VOSI capabilities.
+
+    Same contract as :func:`enrich`; the capability request goes over the shared
+    async connection pool for the server so many servers can be enriched
+    concurrently.
+
+    Args:
+        server: Server record to enrich.
+        config: Configuration whose Authentication Record should authorize the
+            capability request.
+        authentication_idp: Optional Authentication Record selector.
+        strict: When ``False``, return the original server on failure.
+        timeout: HTTP timeout in seconds for VOSI capabilities requests.
+
+    Returns:
+        Server: Copy with version and auth modes populated when discoverable.
+
+    Raises:
+        ServerFetchError: If ``strict`` is ``True`` and capabilities cannot
+            be retrieved, parsed, or contain no session capabilities.
+    """
+    try:
+        async with _capabilities_client(
+            server,
+            config=config,
+            authentication_idp=authentication_idp,
+            timeout=timeout,
+        ) as client:
+            request_client = client.asynclient
+            _accept_capabilities(request_client.headers)
+            document = await httpcache.afetch(request_client, "capabilities")
+            capabilities = vosi.capabilities(xml=document.text)
+    except _CAPABILITY_ERRORS as exc:
+        return _capabilities_unavailable(server, exc, strict=strict)
+    return _from_capabilities(server, capabilities, strict=strict)
+
+
+_CAPABILITY_ERRORS = (
+    httpx.HTTPError,
+    OSError,
+    AuthContextError,
+    AuthExpiredError,
+    CertificateError,
+    HTTPAuthenticationError,
+    ParseError,
+    DefusedXmlException,
+)
+
+
+def _capabilities_client(
+    server: Server,
+    *,
+    config: Configuration | None,
+    authentication_idp: str | None,
+    timeout: int,
+) -> HTTPClient:
+    """Return an HTTP client authorized to read ``server`` capabilities."""
+    from canfar.client import HTTPClient  # noqa: PLC0415
+
     if server.url is None:
         msg = "Server URL is required to inspect capabilities."
         raise ServerFetchError(msg)
 
-    base_config = config or Configuration()  # ty: ignore[missing-argument]
+    base_config = config or Configuration.load()
     active_idp = authentication_idp or server.idp or base_config.active.authentication
-    try:
-        from canfar.client import HTTPClient  # noqa: PLC0415
+    return HTTPClient(
+        config=base_config,
+        authentication_idp=active_idp,
+        url=server.url,
+        timeout=timeout,
+        raise_http_errors=False,
+    )
 
-        with HTTPClient(
-            config=base_config,
-            authentication_idp=active_idp,
-            url=server.url,
-            timeout=timeout,
-            raise_http_errors=False,
-        ) as client:
-            request_client = client.client
-            request_client.headers["Accept"] = "application/xml"
-            request_client.headers.pop("Content-Type", None)
-            request_client.headers.pop("X-Skaha-Registry-Auth", None)
-            response = request_client.get("capabilities")
-            response.raise_for_status()
-            capabilities = vosi.capabilities(xml=response.text)
-    except (
-        httpx.HTTPError,
-        OSError,
-        AuthContextError,
-        AuthExpiredError,
-        CertificateError,
-        HTTPAuthenticationError,
-        ParseError,
-        DefusedXmlException,
-    ) as exc:
-        return _keep_or_raise(
-            server,
-            strict=strict,
-            error=f"Failed to fetch capabilities for {server.url}: {exc}",
-            cause=exc,
-            debug="Skipping capability enrichment for %s during discovery: %s",
-            args=(server.url, exc),
-        )
 
+def _accept_capabilities(headers: httpx.Headers) -> None:
+    """Turn session API request headers into a VOSI capabilities request."""
+    headers["Accept"] = "application/xml"
+    headers.pop("Content-Type", None)
+    headers.pop("X-Skaha-Registry-Auth", None)
+
+
+def _capabilities_unavailable(
+    server: Server,
+    exc: Exception,
+    *,
+    strict: bool,
+) -> Server:
+    """Handle a capability request that failed to return parseable metadata."""
+    return _keep_or_raise(
+        server,
+        strict=strict,
+        error=f"Failed to fetch capabilities for {server.url}: {exc}",
+        cause=exc,
+        debug="Skipping capability enrichment for %s during discovery: %s",
+        args=(server.url, exc),
+    )
+
+
+def _from_capabilities(
+    server: Server,
+    capabilities: list[vosi.Capability],
+    *,
+    strict: bool,
+) -> Server:
+    """Return ``server`` updated from its primary session capability."""
     primary = next(
         (
             capability
@@ -626,7 +860,7 @@ def _validate_server(
     Raises:
         ServerFetchError: If capability enrichment fails or URL/version are missing.
     """
-    base_config = config or Configuration()  # ty: ignore[missing-argument]
+    base_config = config or Configuration.load()
     active_idp = idp or server.idp or base_config.active.authentication
     enriched = enrich(
         server,
@@ -4,22 +4,66 @@ from __future__ import annotations
 
 import asyncio
 import re
-from typing import TYPE_CHECKING, Any
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import TYPE_CHECKING, Any, Literal, TypeVar
 from webbrowser import open_new_tab
 
-from httpx import HTTPError, Response
+from httpx import (
+    ConnectError,
+    ConnectTimeout,
+    HTTPError,
+    HTTPStatusError,
+    PoolTimeout,
+    ReadError,
+    ReadTimeout,
+    RemoteProtocolError,
+    Response,
+    codes,
+)
 
 from canfar import get_logger
 from canfar.client import HTTPClient
 from canfar.models.session import CreateRequest
-from canfar.utils import build
+from canfar.utils import build, retry
+from canfar.utils.journal import Journal, matches
+from canfar.utils.ratelimit import TokenBucket
 
 if TYPE_CHECKING:
-    from collections.abc import Mapping
+    from collections.abc import (
+        AsyncIterator,
+        Callable,
+        Iterable,
+        Iterator,
+        Mapping,
+        Sequence,
+    )
 
     from canfar.models.types import Kind, Status, View
 log = get_logger(__name__)
 
+_Item = TypeVar("_Item")
+_Result = TypeVar("_Result")
+
+TERMINAL_STATUSES: frozenset[Status] = frozenset(
+    {"Succeeded", "Completed", "Error", "Failed"}
+)
+"""Session statuses after which a Session produces no new log output."""
+
+FOLLOW_INTERVAL = 2.0
+"""Default seconds between log polls in ``AsyncSession.follow_logs``."""
+
+WAIT_INTERVAL = 1.0
+"""Initial seconds between status polls in ``wait``/``watch``."""
+
+WAIT_MAX_INTERVAL = 30.0
+"""Upper bound for the adaptive status poll interval."""
+
+_WAIT_BACKOFF = 1.5
+_WAIT_MISSES = 2
+_CONTENT_RANGE = re.compile(r"bytes (?:(?P<start>\d+)-\d+|\*)/(?P<length>\d+|\*)")
+
 
 def _log_http_task_failure(operation: str, context: object, exc: BaseException) -> None:
     """Log a failed HTTP task with safe caller context.
@@ -30,6 +74,14 @@ def _log_http_task_failure(operation: str, context: object, exc: BaseException)
     log.error("%s: %s (%s)", operation, context, type(exc).__name__)
 
 
+def _attempt(call: Callable[[_Item], _Result], item: _Item) -> _Result | HTTPError:
+    """Run one bulk-method request, returning HTTP failures instead of raising."""
+    try:
+        return call(item)
+    except HTTPError as err:
+        return err
+
+
 def _ids(value: str | list[str]) -> list[str]:
     """Normalize one or many Session identifiers without changing their order."""
     return [value] if isinstance(value, str) else value
@@ -57,6 +109,188 @@ def _matching_session_ids(sessions: list[Any], regex: re.Pattern[str]) -> list[s
     return [session["id"] for session in sessions if regex.search(session["name"])]
 
 
+class _LogTail:
+    """Read position in one Session log across repeated ``view=logs`` requests.
+
+    ``offset`` counts bytes already emitted as complete lines; a trailing
+    partial line is re-read on the next poll rather than held in memory.
+    """
+
+    def __init__(self) -> None:
+        self.offset = 0
+
+    def resumes(self, response: Response) -> bool:
+        """Return whether the reply to a ``Range`` request continues at ``offset``.
+
+        A ``206 Partial Content`` reply must start at ``offset``, and a ``416``
+        reply only means nothing new when the log is ``offset`` bytes long.
+        Otherwise the log is read again in full: from its beginning when the
+        reply shows it shrank (e.g. the container restarted), else past
+        ``offset``.
+
+        Args:
+            response: Reply to a request for the bytes past ``offset``.
+
+        Returns:
+            bool: False if the log must be requested again without ``Range``.
+        """
+        status = response.status_code
+        if status not in {codes.PARTIAL_CONTENT, codes.REQUESTED_RANGE_NOT_SATISFIABLE}:
+            return True
+        match = _CONTENT_RANGE.fullmatch(response.headers.get("Content-Range", ""))
+        if match is None:
+            # Without a Content-Range only a 206 can be taken at its word.
+            return status == codes.PARTIAL_CONTENT
+        start, length = match["start"], match["length"]
+        if start is not None:
+            if int(start) == self.offset:
+                return True
+        elif length == str(self.offset):
+            return True
+        if length != "*" and int(length) < self.offset:
+            log.debug("Log for %s restarted", response.request.url.path)
+            self.offset = 0
+        return False
+
+    async def lines(
+        self,
+        response: Response,
+        *,
+        final: bool,
+    ) -> AsyncIterator[str]:
+        """Yield complete lines past ``offset`` from a streamed log response.
+
+        Args:
+            response: Streamed ``view=logs`` response. A ``206 Partial Content``
+                reply is taken to start at ``offset`` (see :meth:`resumes`).
+            final: Also yield a trailing line without a newline.
+
+        Yields:
+            str: New log lines, without line terminators.
+        """
+        skip = 0 if response.status_code == codes.PARTIAL_CONTENT else self.offset
+        seen = 0
+        pending = bytearray()
+        async for chunk in response.aiter_bytes():
+            start = max(skip - seen, 0)
+            seen += len(chunk)
+            if start >= len(chunk):
+                continue
+            pending += chunk[start:]
+            cut = pending.rfind(b"\n") + 1
+            if cut:
+                for line in _decode(pending[:cut]).splitlines():
+                    yield line
+                self.offset += cut
+                del pending[:cut]
+        if seen < skip:
+            # The log shrank (e.g. the container restarted); start over.
+            log.debug("Log for %s restarted", response.request.url.path)
+            self.offset = 0
+        elif final and pending:
+            yield _decode(pending)
+            self.offset += len(pending)
+
+
+class _Waiter:
+    """Track Sessions until each reaches one of the ``until`` statuses.
+
+    The poll interval starts at ``interval`` and grows by ``_WAIT_BACKOFF`` after
+    every poll in which no pending Session changed status, up to
+    ``max_interval``; any change resets it.
+    """
+
+    def __init__(
+        self,
+        ids: list[str],
+        until: Iterable[str] | str,
+        timeout: float | None,
+        interval: float,
+        max_interval: float,
+    ) -> None:
+        self.pending = dict.fromkeys(ids)
+        self.until = frozenset([until] if isinstance(until, str) else until)
+        self.deadline = None if timeout is None else time.monotonic() + timeout
+        self.interval = interval
+        self.max_interval = max(interval, max_interval)
+        self.delay = interval
+        self.statuses: dict[str, str | None] = {}
+        self.misses: dict[str, int] = {}
+
+    def update(self, sessions: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Consume one Session listing; return Sessions that reached ``until``."""
+        listed = {session.get("id"): session for session in sessions}
+        reached: list[dict[str, Any]] = []
+        changed = False
+        for value in list(self.pending):
+            session = listed.get(value)
+            if session is None:
+                self.misses[value] = self.misses.get(value, 0) + 1
+                if self.misses[value] >= _WAIT_MISSES:
+                    log.warning("Session %s is no longer listed; not waiting", value)
+                    del self.pending[value]
+                continue
+            self.misses.pop(value, None)
+            status = session.get("status")
+            changed |= self.statuses.get(value) != status
+            self.statuses[value] = status
+            if status in self.until:
+                reached.append(session)
+                del self.pending[value]
+        self.delay = (
+            self.interval
+            if changed
+            else min(self.delay * _WAIT_BACKOFF, self.max_interval)
+        )
+        log.debug(
+            "Waiting on %d session(s); %d reached %s; next poll in %.1fs",
+            len(self.pending),
+            len(reached),
+            sorted(self.until),
+            self.delay,
+        )
+        return reached
+
+    def next_delay(self) -> float:
+        """Return seconds until the next poll.
+
+        Raises:
+            TimeoutError: If the deadline has passed with Sessions pending.
+        """
+        if self.deadline is None:
+            return self.delay
+        remaining = self.deadline - time.monotonic()
+        if remaining <= 0:
+            msg = (
+                f"Timed out waiting for {len(self.pending)} session(s) to reach "
+                f"{', '.join(sorted(self.until))}: {', '.join(self.pending)}"
+            )
+            raise TimeoutError(msg)
+        return min(self.delay, remaining)
+
+
+def _index_listing(
+    ids: list[str],
+    sessions: list[dict[str, Any]],
+) -> dict[str, dict[str, Any]]:
+    """Return listed Sessions for ``ids`` and log the lookup path taken."""
+    wanted = set(ids)
+    listed = {
+        session["id"]: session for session in sessions if session.get("id") in wanted
+    }
+    log.debug(
+        "Session info: %d of %d ID(s) resolved from one list request; %d fetched by ID",
+        len(listed),
+        len(wanted),
+        len(wanted - listed.keys()),
+    )
+    return listed
+
+
+def _decode(data: bytes | bytearray) -> str:
+    return data.decode("utf-8", errors="replace")
+
+
 def connection_url(session: Mapping[str, Any]) -> str | None:
     """Return the URL only when a Session is ready for a connection."""
     value = session.get("connectURL")
@@ -65,6 +299,105 @@ def connection_url(session: Mapping[str, Any]) -> str | None:
     return value or None
 
 
+def _create_failure(error: BaseException) -> Literal["refused", "unknown"] | None:
+    """Classify a failed create request.
+
+    Creating a Session is not idempotent. ``429``, ``503`` and failures to
+    connect mean Skaha did not process the request, so it is ``"refused"`` and
+    can be sent again. After a ``502``, a ``504`` or a lost response the Session
+    may have launched, so the outcome is ``"unknown"`` until the Session
+    listing has been checked. Any other failure is final.
+
+    Args:
+        error (BaseException): Failure raised by the create request.
+
+    Returns:
+        Literal["refused", "unknown"] | None: Class of a transient failure, or
+            None if the failure is final.
+    """
+    if isinstance(error, (ConnectError, ConnectTimeout, PoolTimeout)):
+        return "refused"
+    if isinstance(error, (ReadError, ReadTimeout, RemoteProtocolError)):
+        return "unknown"
+    if isinstance(error, HTTPStatusError):
+        status = error.response.status_code
+        if status in {codes.TOO_MANY_REQUESTS, codes.SERVICE_UNAVAILABLE}:
+            return "refused"
+        if status in {codes.BAD_GATEWAY, codes.GATEWAY_TIMEOUT}:
+            return "unknown"
+    return None
+
+
+def _launched(
+    payload: Sequence[tuple[str, Any]],
+    sessions: Iterable[dict[str, Any]],
+    *,
+    since: float,
+    error: HTTPError,
+    replica: str,
+) -> str | None:
+    """Return the ID of a Session launched by a create that seemed to fail.
+
+    Raises:
+        HTTPError: ``error``, if several Sessions match and the outcome is
+            unknown.
+    """
+    found = matches(payload, sessions, since=since)
+    if len(found) > 1:
+        log.warning(
+            "Session create for %s failed with %s and %d sessions match; "
+            "not re-submitting",
+            replica,
+            type(error).__name__,
+            len(found),
+        )
+        raise error
+    if found:
+        log.info(
+            "Session create for %s launched despite %s; not re-submitting",
+            replica,
+            type(error).__name__,
+        )
+        return found[0]
+    return None
+
+
+def _retry_delay(
+    policy: retry.Backoff,
+    attempt: int,
+    error: BaseException,
+    replica: str,
+) -> float | None:
+    """Return the backoff before retrying a create, or ``None`` to give up."""
+    if attempt >= policy.retries or _create_failure(error) is None:
+        return None
+    delay = policy.delay(attempt, retry.retry_after(error))
+    log.info(
+        "Retrying session create for %s in %.1fs (%s)",
+        replica,
+        delay,
+        type(error).__name__,
+    )
+    return delay
+
+
+def _journal(
+    enabled: bool,
+    payloads: list[list[tuple[str, Any]]],
+    *,
+    resume: bool,
+) -> Journal | None:
+    """Open the launch journal of ``payloads``, starting it afresh unless resuming."""
+    if not enabled:
+        if resume:
+            log.warning("Cannot resume a launch with launch_journal disabled.")
+        return None
+    journal = Journal(payloads)
+    if not resume:
+        journal.start()
+    return journal
+
+
 class Session(HTTPClient):
     """CANFAR Session Management Client.
 
@@ -77,10 +410,29 @@ class Session(HTTPClient):
         >>> from canfar.sessions import Session
         >>> session = Session(
                 timeout=120,
-                concurrency=100, # No effect on sync client
+                concurrency=100, # Max parallel requests for bulk methods
             )
     """
 
+    def _fan_out(
+        self,
+        call: Callable[[_Item], _Result],
+        items: Sequence[_Item],
+    ) -> list[_Result | HTTPError]:
+        """Run ``call`` for each item on a worker pool bounded by ``concurrency``.
+
+        Results keep input order, and HTTP failures are returned in place so
+        callers can log them in the same order as a sequential loop.
+        """
+        workers = min(self.concurrency, len(items))
+        if workers <= 1:
+            return [_attempt(call, item) for item in items]
+        with ThreadPoolExecutor(
+            max_workers=workers,
+            thread_name_prefix="canfar-session",
+        ) as pool:
+            return list(pool.map(partial(_attempt, call), items))
+
     def fetch(
         self,
         kind: Kind | None = None,
@@ -143,6 +495,9 @@ class Session(HTTPClient):
     def info(self, ids: list[str] | str) -> list[dict[str, Any]]:
         """Get information about session[s].
 
+        More than ``bulk_info_threshold`` IDs are resolved from one session
+        listing; only IDs missing from it are requested one by one.
+
         Args:
             ids (Union[List[str], str]): Session ID[s].
 
@@ -155,14 +510,109 @@ class Session(HTTPClient):
         """
         ids = _ids(ids)
         results: list[dict[str, Any]] = []
-        for value in ids:
+        listed: dict[str, dict[str, Any]] = {}
+        if len(ids) > self.bulk_info_threshold:
             try:
-                response: Response = self.client.get(url=f"session/{value}")
-                results.append(response.json())
+                listed = _index_listing(ids, self.fetch())
             except HTTPError as err:
-                _log_http_task_failure("failed to fetch session info for", value, err)
+                log.debug("Session listing failed (%s); fetching by ID", err)
+        else:
+            log.debug("Session info: fetching %d ID(s) by ID", len(ids))
+
+        def fetch(value: str) -> dict[str, Any]:
+            response: Response = self.client.get(url=f"session/{value}")
+            data: dict[str, Any] = response.json()
+            return data
+
+        missing = [value for value in dict.fromkeys(ids) if value not in listed]
+        replies = dict(zip(missing, self._fan_out(fetch, missing), strict=True))
+        for value in ids:
+            reply = listed[value] if value in listed else replies[value]
+            if isinstance(reply, HTTPError):
+                _log_http_task_failure("failed to fetch session info for", value, reply)
+            else:
+                results.append(reply)
         return results
 
+    def watch(
+        self,
+        ids: list[str] | str,
+        until: Iterable[Status] | Status = TERMINAL_STATUSES,
+        timeout: float | None = None,
+        interval: float = WAIT_INTERVAL,
+        max_interval: float = WAIT_MAX_INTERVAL,
+    ) -> Iterator[dict[str, Any]]:
+        """Yield session[s] as they reach one of the ``until`` statuses.
+
+        Every poll is a single ``fetch()`` of the user's Sessions, however many
+        IDs are watched. The interval grows while nothing changes and resets
+        when any watched Session changes status. Sessions no longer listed on
+        two consecutive polls are dropped with a warning.
+
+        Args:
+            ids (Union[List[str], str]): Session ID[s].
+            until (Iterable[Status] | Status, optional): Target statuses.
+                Defaults to the terminal statuses. Include terminal statuses
+                when waiting for ``"Running"`` so short jobs cannot be missed.
+            timeout (float | None, optional): Seconds to wait. Defaults to None.
+            interval (float, optional): Initial seconds between polls.
+            max_interval (float, optional): Maximum seconds between polls.
+
+        Yields:
+            dict[str, Any]: Session information when it reaches a target status.
+
+        Raises:
+            TimeoutError: If ``timeout`` expires with Sessions still pending.
+
+        Examples:
+            >>> from canfar.sessions import Session, TERMINAL_STATUSES
+            >>> session = Session()
+            >>> for info in session.watch(ids, until={"Running"} | TERMINAL_STATUSES):
+            ...     print(info["id"], info["status"])
+        """
+        waiter = _Waiter(
+            list(dict.fromkeys(_ids(ids))), until, timeout, interval, max_interval
+        )
+        while waiter.pending:
+            yield from waiter.update(self.fetch())
+            if waiter.pending:
+                time.sleep(waiter.next_delay())
+
+    def wait(
+        self,
+        ids: list[str] | str,
+        until: Iterable[Status] | Status = TERMINAL_STATUSES,
+        timeout: float | None = None,
+        interval: float = WAIT_INTERVAL,
+        max_interval: float = WAIT_MAX_INTERVAL,
+    ) -> dict[str, dict[str, Any]]:
+        """Block until session[s] reach one of the ``until`` statuses.
+
+        Same polling policy as :meth:`watch`.
+
+        Args:
+            ids (Union[List[str], str]): Session ID[s].
+            until (Iterable[Status] | Status, optional): Target statuses.
+                Defaults to the terminal statuses.
+            timeout (float | None, optional): Seconds to wait. Defaults to None.
+            interval (float, optional): Initial seconds between polls.
+            max_interval (float, optional): Maximum seconds between polls.
+
+        Returns:
+            dict[str, dict[str, Any]]: Session information keyed by ID, in the
+                order Sessions reached a target status.
+
+        Raises:
+            TimeoutError: If ``timeout`` expires with Sessions still pending.
+
+        Examples:
+            >>> session.wait(ids, until="Running", timeout=600)
+        """
+        return {
+            info["id"]: info
+            for info in self.watch(ids, until, timeout, interval, max_interval)
+        }
+
     def logs(
         self,
         ids: list[str] | str,
@@ -185,15 +635,18 @@ class Session(HTTPClient):
         parameters: dict[str, str] = {"view": "logs"}
         results: dict[str, str] = {}
 
-        for value in ids:
-            try:
-                response: Response = self.client.get(
-                    url=f"session/{value}",
-                    params=parameters,
-                )
-                results[value] = response.text
-            except HTTPError as err:
-                _log_http_task_failure("failed to fetch logs for session", value, err)
+        def fetch(value: str) -> str:
+            response: Response = self.client.get(
+                url=f"session/{value}",
+                params=parameters,
+            )
+            return response.text
+
+        for value, reply in zip(ids, self._fan_out(fetch, ids), strict=True):
+            if isinstance(reply, HTTPError):
+                _log_http_task_failure("failed to fetch logs for session", value, reply)
+            else:
+                results[value] = reply
 
         if verbose:
             for key, value in results.items():
@@ -215,6 +668,8 @@ class Session(HTTPClient):
         args: str | None = None,
         env: dict[str, Any] | None = None,
         replicas: int = 1,
+        *,
+        resume: bool = False,
     ) -> list[str]:
         """Launch a canfar session.
 
@@ -232,6 +687,9 @@ class Session(HTTPClient):
             env (Optional[Dict[str, Any]], optional): Environment variables to inject.
                 Defaults to None.
             replicas (int, optional): Number of sessions to launch. Defaults to 1.
+            resume (bool, optional): Continue an interrupted launch of the same
+                request, submitting only replicas that are not running yet.
+                Defaults to False.
 
         Notes:
             - If cores and ram are not specified, the session will be created with
@@ -243,7 +701,8 @@ class Session(HTTPClient):
                 * REPLICA_COUNT - The total number of replicas
 
         Returns:
-            List[str]: Session IDs for launched sessions. On HTTP or network failure
+            List[str]: Session IDs for launched sessions, including those launched
+                before a resumed launch was interrupted. On HTTP or network failure
                 for a given attempt, that attempt is omitted; if all attempts fail,
                 returns an empty list. Does not raise for those errors.
 
@@ -278,18 +737,132 @@ class Session(HTTPClient):
         results: list[str] = []
         session_kind = name.kind if isinstance(name, CreateRequest) else kind
         log.debug("Creating %d %s session[s].", len(payloads), session_kind)
-        for replica, payload in enumerate(payloads, start=1):
-            try:
-                response: Response = self.client.post(url="session", params=payload)
-                results.append(response.text.rstrip("\r\n"))
-            except HTTPError as err:
+        for replica, reply in self._submit(payloads, resume=resume).items():
+            if isinstance(reply, HTTPError):
                 _log_http_task_failure(
                     "Failed to create session",
                     f"replica {replica}/{len(payloads)}",
-                    err,
+                    reply,
                 )
+            else:
+                results.append(reply)
         return results
 
+    def submit(
+        self,
+        request: CreateRequest,
+        *,
+        resume: bool = False,
+    ) -> dict[int, str | HTTPError]:
+        """Launch every replica of a request and report each outcome.
+
+        Create requests are paced by a token bucket when ``create_rate`` (per
+        second) is set, and retried up to ``create_retries`` times on 429, 503
+        and connection errors, with exponential backoff and full jitter. A
+        ``Retry-After`` header from the server overrides the computed delay.
+        After a 502, a 504 or a lost response the replica may have launched, so
+        ``fetch()`` is searched for a Session of that name started since the
+        first attempt. The replica is re-submitted only if there is none; if
+        several match, the original error is reported.
+
+        Each launch is recorded in a journal under ``CONFIG_DIR/launches``
+        (unless ``launch_journal`` is disabled). With ``resume=True`` the
+        journal of the same request is reconciled against ``fetch()`` by
+        Session name, and only replicas that are not running are submitted.
+
+        Args:
+            request (CreateRequest): Session launch request.
+            resume (bool): Continue an interrupted launch of the same request.
+
+        Returns:
+            dict[int, str | HTTPError]: Session ID, or the final error, keyed by
+                replica number (``REPLICA_ID``, starting at 1).
+
+        Examples:
+            >>> from canfar.models.session import CreateRequest
+            >>> from canfar.sessions import Session
+            >>> session = Session()
+            >>> session.submit(
+                    CreateRequest(
+                        name="test",
+                        image="images.canfar.net/skaha/terminal:1.1.1",
+                        kind="headless",
+                        replicas=2,
+                    )
+                )
+            >>> {1: "hjko98yghj", 2: HTTPStatusError(...)}
+        """
+        payloads = build.create_parameters(request)
+        log.debug("Submitting %d %s session[s].", len(payloads), request.kind)
+        return self._submit(payloads, resume=resume)
+
+    def _submit(
+        self,
+        payloads: list[list[tuple[str, Any]]],
+        *,
+        resume: bool = False,
+    ) -> dict[int, str | HTTPError]:
+        """POST each replica payload with rate limiting, retries and a journal."""
+        bucket = TokenBucket(self.create_rate) if self.create_rate else None
+        policy = retry.Backoff(retries=self.create_retries)
+        journal = _journal(self.launch_journal, payloads, resume=resume)
+        launched: dict[int, str] = {}
+        replicas = list(range(1, len(payloads) + 1))
+        if journal is not None and resume:
+            launched, replicas = journal.reconcile(self.fetch())
+
+        def post(replica: int) -> str:
+            context = f"replica {replica}/{len(payloads)}"
+            attempt = 0
+            # Sessions started before the first attempt belong to other launches.
+            submitted = time.time()
+            while True:
+                if bucket is not None:
+                    bucket.acquire()
+                try:
+                    response: Response = self.client.post(
+                        url="session", params=payloads[replica - 1]
+                    )
+                except HTTPError as err:
+                    delay = _retry_delay(policy, attempt, err, context)
+                    if delay is not None:
+                        time.sleep(delay)
+                    if _create_failure(err) == "unknown":
+                        try:
+                            sessions = self.fetch()
+                        except HTTPError:
+                            raise err from None
+                        payload = payloads[replica - 1]
+                        session_id = _launched(
+                            payload,
+                            sessions,
+                            since=submitted,
+                            error=err,
+                            replica=context,
+                        )
+                        if session_id is not None:
+                            return session_id
+                    if delay is None:
+                        raise
+                    attempt += 1
+                else:
+                    return response.text.rstrip("\r\n")
+
+        def launch(replica: int) -> str:
+            if journal is None:
+                return post(replica)
+            journal.submitted(replica)
+            try:
+                session_id = post(replica)
+            except HTTPError as err:
+                journal.completed(replica, err)
+                raise
+            journal.completed(replica, session_id)
+            return session_id
+
+        replies = dict(zip(replicas, self._fan_out(launch, replicas), strict=True))
+        return dict(sorted({**launched, **replies}.items()))
+
     def events(
         self,
         ids: str | list[str],
@@ -316,15 +889,23 @@ class Session(HTTPClient):
         ids = _ids(ids)
         results: list[dict[str, str]] = []
         parameters: dict[str, str] = {"view": "events"}
-        for value in ids:
-            try:
-                response: Response = self.client.get(
-                    url=f"session/{value}",
-                    params=parameters,
+
+        def fetch(value: str) -> str:
+            response: Response = self.client.get(
+                url=f"session/{value}",
+                params=parameters,
+            )
+            return response.text
+
+        for value, reply in zip(ids, self._fan_out(fetch, ids), strict=True):
+            if isinstance(reply, HTTPError):
+                _log_http_task_failure(
+                    "Failed to fetch events for session",
+                    value,
+                    reply,
                 )
-                results.append({value: response.text})
-            except HTTPError as err:
-                _log_http_task_failure("Failed to fetch events for session", value, err)
+            else:
+                results.append({value: reply})
         if verbose and results:
             for result in results:
                 for key, value in result.items():
@@ -350,14 +931,17 @@ class Session(HTTPClient):
         """
         ids = _ids(ids)
         results: dict[str, bool] = {}
-        for value in ids:
-            try:
-                self.client.delete(url=f"session/{value}")
-                results[value] = True
-            except HTTPError:
+
+        def delete(value: str) -> None:
+            self.client.delete(url=f"session/{value}")
+
+        for value, reply in zip(ids, self._fan_out(delete, ids), strict=True):
+            if isinstance(reply, HTTPError):
                 msg = f"Failed to destroy session {value}"
-                log.exception(msg)
+                log.error(msg, exc_info=reply)
                 results[value] = False
+            else:
+                results[value] = True
         return results
 
     def destroy_with(
@@ -519,6 +1103,9 @@ class AsyncSession(HTTPClient):
     async def info(self, ids: list[str] | str) -> list[dict[str, Any]]:
         """Get information about session[s].
 
+        More than ``bulk_info_threshold`` IDs are resolved from one session
+        listing; only IDs missing from it are requested one by one.
+
         Args:
             ids (Union[List[str], str]): Session ID[s].
 
@@ -533,17 +1120,27 @@ class AsyncSession(HTTPClient):
         """
         ids = _ids(ids)
         results: list[dict[str, Any]] = []
-        semaphore: asyncio.Semaphore = asyncio.Semaphore(self.concurrency)
+        listed: dict[str, dict[str, Any]] = {}
+        if len(ids) > self.bulk_info_threshold:
+            try:
+                listed = _index_listing(ids, await self.fetch())
+            except HTTPError as err:
+                log.debug("Session listing failed (%s); fetching by ID", err)
+        else:
+            log.debug("Session info: fetching %d ID(s) by ID", len(ids))
 
         async def bounded(value: str) -> dict[str, Any]:
-            async with semaphore:
+            async with self.limiter.slot():
                 response = await self.asynclient.get(url=f"session/{value}")
                 data: dict[str, Any] = response.json()
                 return data
 
-        tasks = [bounded(value) for value in ids]
-        responses = await asyncio.gather(*tasks, return_exceptions=True)
-        for value, reply in zip(ids, responses, strict=True):
+        missing = [value for value in dict.fromkeys(ids) if value not in listed]
+        tasks = [bounded(value) for value in missing]
+        fetched = await asyncio.gather(*tasks, return_exceptions=True)
+        replies = dict(zip(missing, fetched, strict=True))
+        for value in ids:
+            reply = listed[value] if value in listed else replies[value]
             if isinstance(reply, Exception):
                 _log_http_task_failure("failed to fetch session info for", value, reply)
             elif isinstance(reply, dict):
@@ -551,6 +1148,86 @@ class AsyncSession(HTTPClient):
         log.debug("Session info records collected: %s", results)
         return results
 
+    async def watch(
+        self,
+        ids: list[str] | str,
+        until: Iterable[Status] | Status = TERMINAL_STATUSES,
+        timeout: float | None = None,
+        interval: float = WAIT_INTERVAL,
+        max_interval: float = WAIT_MAX_INTERVAL,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Yield session[s] as they reach one of the ``until`` statuses.
+
+        Every poll is a single ``fetch()`` of the user's Sessions, however many
+        IDs are watched. The interval grows while nothing changes and resets
+        when any watched Session changes status. Sessions no longer listed on
+        two consecutive polls are dropped with a warning.
+
+        Args:
+            ids (Union[List[str], str]): Session ID[s].
+            until (Iterable[Status] | Status, optional): Target statuses.
+                Defaults to the terminal statuses. Include terminal statuses
+                when waiting for ``"Running"`` so short jobs cannot be missed.
+            timeout (float | None, optional): Seconds to wait. Defaults to None.
+            interval (float, optional): Initial seconds between polls.
+            max_interval (float, optional): Maximum seconds between polls.
+
+        Yields:
+            dict[str, Any]: Session information when it reaches a target status.
+
+        Raises:
+            TimeoutError: If ``timeout`` expires with Sessions still pending.
+
+        Examples:
+            >>> from canfar.sessions import AsyncSession, TERMINAL_STATUSES
+            >>> async with AsyncSession() as session:
+            ...     async for info in session.watch(ids):
+            ...         print(info["id"], info["status"])
+        """
+        waiter = _Waiter(
+            list(dict.fromkeys(_ids(ids))), until, timeout, interval, max_interval
+        )
+        while waiter.pending:
+            for info in waiter.update(await self.fetch()):
+                yield info
+            if waiter.pending:
+                await asyncio.sleep(waiter.next_delay())
+
+    async def wait(
+        self,
+        ids: list[str] | str,
+        until: Iterable[Status] | Status = TERMINAL_STATUSES,
+        timeout: float | None = None,
+        interval: float = WAIT_INTERVAL,
+        max_interval: float = WAIT_MAX_INTERVAL,
+    ) -> dict[str, dict[str, Any]]:
+        """Wait until session[s] reach one of the ``until`` statuses.
+
+        Same polling policy as :meth:`watch`.
+
+        Args:
+            ids (Union[List[str], str]): Session ID[s].
+            until (Iterable[Status] | Status, optional): Target statuses.
+                Defaults to the terminal statuses.
+            timeout (float | None, optional): Seconds to wait. Defaults to None.
+            interval (float, optional): Initial seconds between polls.
+            max_interval (float, optional): Maximum seconds between polls.
+
+        Returns:
+            dict[str, dict[str, Any]]: Session information keyed by ID, in the
+                order Sessions reached a target status.
+
+        Raises:
+            TimeoutError: If ``timeout`` expires with Sessions still pending.
+
+        Examples:
+            >>> await session.wait(ids, until={"Running"} | TERMINAL_STATUSES)
+        """
+        return {
+            info["id"]: info
+            async for info in self.watch(ids, until, timeout, interval, max_interval)
+        }
+
     async def logs(
         self,
         ids: list[str] | str,
@@ -575,10 +1252,8 @@ class AsyncSession(HTTPClient):
         parameters: dict[str, str] = {"view": "logs"}
         results: dict[str, str] = {}
 
-        semaphore: asyncio.Semaphore = asyncio.Semaphore(self.concurrency)
-
         async def bounded(value: str) -> tuple[str, str]:
-            async with semaphore:
+            async with self.limiter.slot():
                 response = await self.asynclient.get(
                     url=f"session/{value}",
                     params=parameters,
@@ -601,6 +1276,148 @@ class AsyncSession(HTTPClient):
             return None
         return results
 
+    async def follow_logs(
+        self,
+        ids: list[str] | str,
+        interval: float = FOLLOW_INTERVAL,
+    ) -> AsyncIterator[tuple[str, str]]:
+        """Stream new log lines from session[s] until they finish.
+
+        Each Session log is polled every ``interval`` seconds. Responses are
+        streamed and only lines past the last emitted byte offset are yielded;
+        servers that honour ``Range`` requests send only the new bytes. A Session
+        is followed until it reaches a terminal status or disappears, after a
+        final read of its log. Lines from many Sessions are multiplexed in
+        arrival order.
+
+        Args:
+            ids (Union[List[str], str]): Session ID[s].
+            interval (float, optional): Seconds between polls. Defaults to 2.
+
+        Yields:
+            tuple[str, str]: Session ID and one log line without its terminator.
+
+        Examples:
+            >>> from canfar.sessions import AsyncSession
+            >>> async with AsyncSession() as session:
+            ...     async for session_id, line in session.follow_logs(["hjko98yghj"]):
+            ...         print(session_id, line)
+        """
+        ids = list(dict.fromkeys(_ids(ids)))
+        queue: asyncio.Queue[tuple[str, str] | BaseException | None] = asyncio.Queue(
+            maxsize=1024
+        )
+
+        async def follow(value: str) -> None:
+            try:
+                await self._follow(value, queue, interval)
+            except Exception as err:  # noqa: BLE001
+                await queue.put(err)
+            await queue.put(None)
+
+        tasks = [asyncio.create_task(follow(value)) for value in ids]
+        remaining = len(tasks)
+        try:
+            while remaining:
+                item = await queue.get()
+                if item is None:
+                    remaining -= 1
+                elif isinstance(item, BaseException):
+                    raise item
+                else:
+                    yield item
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _follow(
+        self,
+        value: str,
+        queue: asyncio.Queue[tuple[str, str] | BaseException | None],
+        interval: float,
+    ) -> None:
+        """Poll one Session log into ``queue`` until the Session finishes.
+
+        Client errors (e.g. the Session was deleted) stop following it; server
+        and transport errors are retried on the next poll.
+        """
+        tail = _LogTail()
+        while True:
+            lines: list[str] = []
+            done = False
+            try:
+                # Read the status first so the final read includes every line
+                # written before the Session finished.
+                async with self.limiter.slot():
+                    response = await self.asynclient.get(url=f"session/{value}")
+                    response.raise_for_status()
+                status = response.json().get("status")
+                final = status in TERMINAL_STATUSES
+                async with self.limiter.slot():
+                    await self._read_log(value, tail, lines, final=final)
+            except HTTPError as err:
+                code = (
+                    err.response.status_code
+                    if isinstance(err, HTTPStatusError)
+                    else None
+                )
+                if code is not None and code < codes.INTERNAL_SERVER_ERROR:
+                    _log_http_task_failure("stopped following logs for", value, err)
+                    done = True
+                else:
+                    log.warning("Retrying logs for %s (%s)", value, type(err).__name__)
+            else:
+                if final:
+                    log.debug("Session %s finished with status %s", value, status)
+                    done = True
+            # Lines are queued after the slot is released, so a slow consumer
+            # holds neither a slot nor a stream, and its wait is not measured
+            # as request latency.
+            for line in lines:
+                await queue.put((value, line))
+            if done:
+                return
+            await asyncio.sleep(interval)
+
+    async def _read_log(
+        self,
+        value: str,
+        tail: _LogTail,
+        lines: list[str],
+        *,
+        final: bool,
+    ) -> None:
+        """Stream one ``view=logs`` response, collecting lines past ``tail``."""
+        ranged = tail.offset > 0
+        while True:
+            headers = {"Range": f"bytes={tail.offset}-"} if ranged else {}
+            try:
+                async with self.asynclient.stream(
+                    "GET",
+                    f"session/{value}",
+                    params={"view": "logs"},
+                    headers=headers,
+                ) as response:
+                    response.raise_for_status()
+                    if ranged and not tail.resumes(response):
+                        ranged = False
+                        continue
+                    # Append one by one to keep the lines read before an error.
+                    async for line in tail.lines(response, final=final):
+                        lines.append(line)  # noqa: PERF401
+                    return
+            except HTTPStatusError as err:
+                if (
+                    not ranged
+                    or err.response.status_code != codes.REQUESTED_RANGE_NOT_SATISFIABLE
+                ):
+                    raise
+                # A range at the end of the log has nothing new to send.
+                if tail.resumes(err.response):
+                    return
+                ranged = False
+
     async def create(
         self,
         name: str | CreateRequest,
@@ -613,6 +1430,8 @@ class AsyncSession(HTTPClient):
         args: str | None = None,
         env: dict[str, Any] | None = None,
         replicas: int = 1,
+        *,
+        resume: bool = False,
     ) -> list[str]:
         """Launch a canfar session.
 
@@ -630,6 +1449,9 @@ class AsyncSession(HTTPClient):
             env (Optional[Dict[str, Any]], optional): Environment variables to inject.
                 Defaults to None.
             replicas (int, optional): Number of sessions to launch. Defaults to 1.
+            resume (bool, optional): Continue an interrupted launch of the same
+                request, submitting only replicas that are not running yet.
+                Defaults to False.
 
         Notes:
             - If cores and ram are not specified, the session will be created with
@@ -641,7 +1463,8 @@ class AsyncSession(HTTPClient):
                 * REPLICA_COUNT - The total number of replicas
 
         Returns:
-            List[str]: Session IDs for launched sessions. On HTTP or network failure
+            List[str]: Session IDs for launched sessions, including those launched
+                before a resumed launch was interrupted. On HTTP or network failure
                 for a given attempt, that attempt is omitted; if all attempts fail,
                 returns an empty list. Does not raise for those errors.
 
@@ -674,19 +1497,11 @@ class AsyncSession(HTTPClient):
             replicas,
         )
         results: list[str] = []
-        semaphore: asyncio.Semaphore = asyncio.Semaphore(self.concurrency)
-
-        async def bounded(parameters: list[tuple[str, Any]]) -> Any:
-            async with semaphore:
-                response = await self.asynclient.post(url="session", params=parameters)
-                return response.text.rstrip("\r\n")
-
-        tasks = [bounded(payload) for payload in payloads]
         session_kind = name.kind if isinstance(name, CreateRequest) else kind
         msg = f"Creating {len(payloads)} {session_kind} session[s]."
         log.debug(msg)
-        responses = await asyncio.gather(*tasks, return_exceptions=True)
-        for replica, reply in enumerate(responses, start=1):
+        responses = await self._submit(payloads, resume=resume)
+        for replica, reply in responses.items():
             if isinstance(reply, Exception):
                 _log_http_task_failure(
                     "Failed to create session",
@@ -698,6 +1513,125 @@ class AsyncSession(HTTPClient):
         log.debug("Session IDs collected from create: %s", results)
         return results
 
+    async def submit(
+        self,
+        request: CreateRequest,
+        *,
+        resume: bool = False,
+    ) -> dict[int, str | Exception]:
+        """Launch every replica of a request and report each outcome.
+
+        Create requests are paced by a token bucket when ``create_rate`` (per
+        second) is set, and retried up to ``create_retries`` times on 429, 503
+        and connection errors, with exponential backoff and full jitter. A
+        ``Retry-After`` header from the server overrides the computed delay.
+        After a 502, a 504 or a lost response the replica may have launched, so
+        ``fetch()`` is searched for a Session of that name started since the
+        first attempt. The replica is re-submitted only if there is none; if
+        several match, the original error is reported.
+
+        Each launch is recorded in a journal under ``CONFIG_DIR/launches``
+        (unless ``launch_journal`` is disabled). With ``resume=True`` the
+        journal of the same request is reconciled against ``fetch()`` by
+        Session name, and only replicas that are not running are submitted.
+
+        Args:
+            request (CreateRequest): Session launch request.
+            resume (bool): Continue an interrupted launch of the same request.
+
+        Returns:
+            dict[int, str | Exception]: Session ID, or the final error, keyed by
+                replica number (``REPLICA_ID``, starting at 1).
+
+        Examples:
+            >>> from canfar.models.session import CreateRequest
+            >>> from canfar.sessions import AsyncSession
+            >>> session = AsyncSession()
+            >>> await session.submit(
+                    CreateRequest(
+                        name="test",
+                        image="images.canfar.net/skaha/terminal:1.1.1",
+                        kind="headless",
+                        replicas=2,
+                    )
+                )
+            >>> {1: "hjko98yghj", 2: HTTPStatusError(...)}
+        """
+        payloads = build.create_parameters(request)
+        log.debug("Submitting %d %s session[s].", len(payloads), request.kind)
+        return await self._submit(payloads, resume=resume)
+
+    async def _submit(
+        self,
+        payloads: list[list[tuple[str, Any]]],
+        *,
+        resume: bool = False,
+    ) -> dict[int, str | Exception]:
+        """POST each replica payload with rate limiting, retries and a journal."""
+        bucket = TokenBucket(self.create_rate) if self.create_rate else None
+        policy = retry.Backoff(retries=self.create_retries)
+        journal = _journal(self.launch_journal, payloads, resume=resume)
+        launched: dict[int, str] = {}
+        replicas = list(range(1, len(payloads) + 1))
+        if journal is not None and resume:
+            launched, replicas = journal.reconcile(await self.fetch())
+
+        async def post(replica: int) -> str:
+            context = f"replica {replica}/{len(payloads)}"
+            attempt = 0
+            # Sessions started before the first attempt belong to other launches.
+            submitted = time.time()
+            while True:
+                if bucket is not None:
+                    await bucket.aacquire()
+                try:
+                    async with self.limiter.slot():
+                        response = await self.asynclient.post(
+                            url="session", params=payloads[replica - 1]
+                        )
+                except HTTPError as err:
+                    delay = _retry_delay(policy, attempt, err, context)
+                    if delay is not None:
+                        await asyncio.sleep(delay)
+                    if _create_failure(err) == "unknown":
+                        try:
+                            sessions = await self.fetch()
+                        except HTTPError:
+                            raise err from None
+                        payload = payloads[replica - 1]
+                        session_id = _launched(
+                            payload,
+                            sessions,
+                            since=submitted,
+                            error=err,
+                            replica=context,
+                        )
+                        if session_id is not None:
+                            return session_id
+                    if delay is None:
+                        raise
+                    attempt += 1
+                else:
+                    return response.text.rstrip("\r\n")
+
+        async def launch(replica: int) -> str:
+            if journal is None:
+                return await post(replica)
+            journal.submitted(replica)
+            try:
+                session_id = await post(replica)
+            except Exception as err:
+                journal.completed(replica, err)
+                raise
+            journal.completed(replica, session_id)
+            return session_id
+
+        replies = await asyncio.gather(
+            *(launch(replica) for replica in replicas), return_exceptions=True
+        )
+        launched_now = dict(zip(replicas, replies, strict=True))
+        return dict(sorted({**launched, **launched_now}.items()))
+
     async def events(
         self,
         ids: str | list[str],
@@ -724,10 +1658,9 @@ class AsyncSession(HTTPClient):
         ids = _ids(ids)
         results: list[dict[str, str]] = []
         parameters: dict[str, str] = {"view": "events"}
-        semaphore: asyncio.Semaphore = asyncio.Semaphore(self.concurrency)
 
         async def bounded(value: str) -> dict[str, str]:
-            async with semaphore:
+            async with self.limiter.slot():
                 response = await self.asynclient.get(
                     url=f"session/{value}",
                     params=parameters,
@@ -772,24 +1705,21 @@ class AsyncSession(HTTPClient):
         """
         ids = _ids(ids)
         results: dict[str, bool] = {}
-        semaphore: asyncio.Semaphore = asyncio.Semaphore(self.concurrency)
 
-        async def bounded(value: str) -> tuple[str, bool]:
-            async with semaphore:
-                try:
-                    await self.asynclient.delete(url=f"session/{value}")
-                except HTTPError as err:
-                    msg = f"Failed to destroy session {value}: {err}"
-                    log.exception(msg)
-                    return value, False
-                else:
-                    return value, True
+        async def bounded(value: str) -> None:
+            # Errors leave the slot so the adaptive limiter sees them.
+            async with self.limiter.slot():
+                await self.asynclient.delete(url=f"session/{value}")
 
         tasks = [bounded(value) for value in ids]
         responses = await asyncio.gather(*tasks, return_exceptions=True)
-        for reply in responses:
-            if isinstance(reply, tuple):
-                results[reply[0]] = reply[1]
+        for value, reply in zip(ids, responses, strict=True):
+            if isinstance(reply, HTTPError):
+                msg = f"Failed to destroy session {value}"
+                log.error(msg, exc_info=reply)
+                results[value] = False
+            elif not isinstance(reply, BaseException):
+                results[value] = True
         log.debug(results)
         return results
 
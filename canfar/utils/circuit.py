@@ -0,0 +1,299 @@
+"""Per-server circuit breakers for CANFAR clients.
+
+When a Science Platform Server is down, every request would otherwise wait for
+the full client ``timeout``, and bulk methods would wait that long per item.
+A :class:`Breaker` per base URL and settings, shared by every client in the
+process, counts consecutive failures (connection errors, and ``502``, ``503``
+and ``504`` responses). Clients place it above their retry layer, so each
+logical request counts once, with the outcome of its last attempt:
+
+- *closed*: requests pass; ``threshold`` consecutive failures open the circuit;
+- *open*: requests fail immediately with :class:`CircuitOpenError` until
+  ``cooldown`` seconds have passed;
+- *half-open*: one request first probes the VOSI ``availability`` endpoint; if
+  the server reports itself available the circuit closes, otherwise it stays
+  open for another ``cooldown``.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Literal
+
+import httpx
+
+from canfar import get_logger
+from canfar.errors import ErrorCode, StructuredError
+from canfar.utils import vosi
+
+log = get_logger(__name__)
+
+THRESHOLD = 5
+"""Consecutive failures that open a circuit."""
+
+COOLDOWN = 30.0
+"""Seconds an open circuit fails fast before probing the server."""
+
+_FAILURES = (httpx.ConnectError, httpx.ConnectTimeout)
+_FAILURE_STATUSES = frozenset(
+    {
+        httpx.codes.BAD_GATEWAY,
+        httpx.codes.SERVICE_UNAVAILABLE,
+        httpx.codes.GATEWAY_TIMEOUT,
+    }
+)
+
+
+class CircuitOpenError(httpx.TransportError):
+    """Raised instead of sending a request to a server with an open circuit."""
+
+    def __init__(self, url: str, retry_in: float, request: httpx.Request) -> None:
+        message = (
+            f"Science Platform Server {url} is unavailable after repeated "
+            f"failures; not sending requests for {retry_in:.0f}s."
+        )
+        super().__init__(message, request=request)
+        self.code = ErrorCode.SERVER_UNAVAILABLE
+        self.structured = StructuredError(
+            code=self.code,
+            message=message,
+            hint="Retry later, or select another server with `canfar server use`.",
+        )
+
+
+class Breaker:
+    """Circuit breaker state for one base URL.
+
+    Args:
+        url (str): Base URL the breaker guards.
+        threshold (int): Consecutive failures that open the circuit.
+        cooldown (float): Seconds the circuit stays open before a probe.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        threshold: int = THRESHOLD,
+        cooldown: float = COOLDOWN,
+    ) -> None:
+        self.url = url
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self.availability = vosi.availability_url(url)
+        self.failures = 0
+        self._opened: float | None = None
+        self._probing = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> Literal["closed", "open", "half-open"]:
+        """Current circuit state."""
+        if self._opened is None:
+            return "closed"
+        if self._probing or time.monotonic() - self._opened >= self.cooldown:
+            return "half-open"
+        return "open"
+
+    def admit(self, request: httpx.Request) -> bool:
+        """Admit ``request`` or fail fast.
+
+        Args:
+            request (httpx.Request): Request about to be sent.
+
+        Returns:
+            bool: True if the caller must probe the server before sending.
+
+        Raises:
+            CircuitOpenError: If the circuit is open, or another request is
+                already probing.
+        """
+        with self._lock:
+            if self._opened is None:
+                return False
+            remaining = self._opened + self.cooldown - time.monotonic()
+            if remaining > 0 or self._probing:
+                raise CircuitOpenError(self.url, max(remaining, 0.0), request)
+            self._probing = True
+            return True
+
+    def record(self, success: bool) -> None:
+        """Count the outcome of a request sent through a closed circuit."""
+        with self._lock:
+            if success:
+                self.failures = 0
+                return
+            self.failures += 1
+            if self._opened is None and self.failures >= self.threshold:
+                self._opened = time.monotonic()
+                log.warning(
+                    "Circuit opened for %s after %d consecutive failures",
+                    self.url,
+                    self.failures,
+                )
+
+    def settle(self, available: bool) -> None:
+        """Close the circuit after a successful probe, or re-open it."""
+        with self._lock:
+            self._probing = False
+            if available:
+                self.failures = 0
+                self._opened = None
+                log.info("Circuit closed for %s", self.url)
+            else:
+                self._opened = time.monotonic()
+                log.warning("Circuit still open for %s", self.url)
+
+
+_breakers: dict[tuple[str, int, float], Breaker] = {}
+_lock = threading.Lock()
+
+
+def breaker(
+    url: str,
+    threshold: int = THRESHOLD,
+    cooldown: float = COOLDOWN,
+) -> Breaker:
+    """Return the process-wide breaker for ``url`` and these settings.
+
+    Clients of one server with different settings get separate breakers, so a
+    client's ``threshold`` and ``cooldown`` always apply to its own requests.
+
+    Args:
+        url (str): Client base URL.
+        threshold (int): Failures that open the circuit.
+        cooldown (float): Seconds open before probing.
+
+    Returns:
+        Breaker: Shared breaker.
+    """
+    key = (url.rstrip("/"), threshold, cooldown)
+    with _lock:
+        existing = _breakers.get(key)
+        if existing is None:
+            existing = _breakers[key] = Breaker(*key)
+        return existing
+
+
+def reset() -> None:
+    """Forget every breaker, closing all circuits."""
+    with _lock:
+        _breakers.clear()
+
+
+def _available(response: httpx.Response) -> bool:
+    if response.status_code != httpx.codes.OK:
+        return False
+    try:
+        return vosi.availability(response.text)[0] is True
+    except Exception:  # noqa: BLE001
+        return False
+
+
+def _probe_request(breaker: Breaker, request: httpx.Request) -> httpx.Request:
+    """Return the availability probe sent on behalf of ``request``."""
+    extensions = {}
+    if "timeout" in request.extensions:
+        # Without it the probe would wait forever on a server that hangs.
+        extensions["timeout"] = request.extensions["timeout"]
+    return httpx.Request("GET", breaker.availability, extensions=extensions)
+
+
+def _failed(response: httpx.Response) -> bool:
+    return response.status_code in _FAILURE_STATUSES
+
+
+class CircuitTransport(httpx.BaseTransport):
+    """Sync transport that fails fast while its server's circuit is open.
+
+    Args:
+        transport (httpx.BaseTransport): Transport that sends requests.
+        breaker (Breaker): Circuit breaker of the client's base URL.
+    """
+
+    def __init__(self, transport: httpx.BaseTransport, breaker: Breaker) -> None:
+        self.transport = transport
+        self.breaker = breaker
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        """Send ``request`` unless the circuit is open."""
+        if self.breaker.admit(request):
+            self._probe(request)
+        try:
+            response = self.transport.handle_request(request)
+        except _FAILURES:
+            self.breaker.record(success=False)
+            raise
+        self.breaker.record(success=not _failed(response))
+        return response
+
+    def _probe(self, request: httpx.Request) -> None:
+        available = False
+        try:
+            response = self.transport.handle_request(
+                _probe_request(self.breaker, request)
+            )
+            try:
+                response.read()
+                available = _available(response)
+            finally:
+                response.close()
+        except httpx.HTTPError:
+            pass
+        finally:
+            # Any exception, even a cancellation, ends the probe.
+            self.breaker.settle(available)
+        if not available:
+            raise CircuitOpenError(self.breaker.url, self.breaker.cooldown, request)
+
+    def close(self) -> None:
+        """Close the wrapped transport."""
+        self.transport.close()
+
+
+class AsyncCircuitTransport(httpx.AsyncBaseTransport):
+    """Async transport that fails fast while its server's circuit is open.
+
+    Args:
+        transport (httpx.AsyncBaseTransport): Transport that sends requests.
+        breaker (Breaker): Circuit breaker of the client's base URL.
+    """
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, breaker: Breaker) -> None:
+        self.transport = transport
+        self.breaker = breaker
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """Send ``request`` unless the circuit is open."""
+        if self.breaker.admit(request):
+            await self._probe(request)
+        try:
+            response = await self.transport.handle_async_request(request)
+        except _FAILURES:
+            self.breaker.record(success=False)
+            raise
+        self.breaker.record(success=not _failed(response))
+        return response
+
+    async def _probe(self, request: httpx.Request) -> None:
+        available = False
+        try:
+            response = await self.transport.handle_async_request(
+                _probe_request(self.breaker, request)
+            )
+            try:
+                await response.aread()
+                available = _available(response)
+            finally:
+                await response.aclose()
+        except httpx.HTTPError:
+            pass
+        finally:
+            # Any exception, even a cancellation, ends the probe.
+            self.breaker.settle(available)
+        if not available:
+            raise CircuitOpenError(self.breaker.url, self.breaker.cooldown, request)
+
+    async def aclose(self) -> None:
+        """Close the wrapped transport."""
+        await self.transport.aclose()
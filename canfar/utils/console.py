@@ -19,13 +19,13 @@ def get_console(*, stderr: bool = False) -> Console:
     Returns:
         Rich console instance sized from user configuration.
     """
-    width = Configuration().console.width  # ty: ignore[missing-argument]
+    width = Configuration.snapshot().console.width
     return Console(width=width, stderr=stderr)
 
 
 def emit_active_server_banner() -> None:
     """Print the active Server Selection when configured for human output."""
-    cfg = Configuration()  # ty: ignore[missing-argument]
+    cfg = Configuration.snapshot()
     if not cfg.console.banner:
         return
     try:
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import statistics
 import time
 
 import httpx
@@ -12,15 +13,35 @@ from canfar.models.registry import (
     IVOARegistrySearch,
     Server,
 )
+from canfar.utils import httpcache
 from canfar.utils.console import get_console
 
+RTT_SAMPLES = 1
+"""HEAD requests per endpoint in a plain discovery."""
+
+RANK_SAMPLES = 3
+"""HEAD requests per endpoint when picking the fastest server by latency."""
+
 
 class Discover:
     """Optimized server discovery with single HTTP client and Pydantic models."""
 
-    def __init__(self, config: IVOARegistrySearch, timeout: int = 2) -> None:
-        """Initialize registry discovery."""
+    def __init__(
+        self,
+        config: IVOARegistrySearch,
+        timeout: int = 2,
+        ttl: float = httpcache.DEFAULT_TTL,
+    ) -> None:
+        """Initialize registry discovery.
+
+        Args:
+            config: Registry search configuration.
+            timeout: HTTP timeout in seconds.
+            ttl: Seconds a cached registry document is used without
+                revalidation.
+        """
         self.config = config
+        self.ttl = ttl
         self.client = httpx.AsyncClient(
             timeout=httpx.Timeout(timeout),
             http2=True,
@@ -51,7 +72,7 @@ class Discover:
         await self.client.aclose()
 
     async def fetch(self, url: str, name: str) -> IVOARegistry:
-        """Fetch registry contents.
+        """Fetch registry contents through the discovery cache.
 
         Args:
             url (str): Registry URL.
@@ -62,14 +83,14 @@ class Discover:
         """
         try:
             start_time = time.time()
-            response = await self.client.get(url)
-            response.raise_for_status()
+            document = await httpcache.afetch(self.client, url, ttl=self.ttl)
             elapsed = time.time() - start_time
+            cached = "" if document.source == "network" else " (cached)"
             get_console(stderr=True).print(
-                f"[dim]Fetched {name} in {elapsed:.2f}s[/dim]"
+                f"[dim]Fetched {name} in {elapsed:.2f}s{cached}[/dim]"
             )
 
-            return IVOARegistry(name=name, content=response.text, success=True)
+            return IVOARegistry(name=name, content=document.text, success=True)
         except httpx.HTTPError as error:
             error_msg = str(error)
             return IVOARegistry(name=name, content="", success=False, error=error_msg)
@@ -111,11 +132,29 @@ class Discover:
 
         return endpoints
 
-    async def check(self, endpoint: Server) -> Server:
-        """Check endpoint status using HEAD request."""
-        try:
-            response = await self.client.head(endpoint.url)
+    async def check(self, endpoint: Server, samples: int = RTT_SAMPLES) -> Server:
+        """Check endpoint status and round-trip time using HEAD requests.
+
+        The first request pays for connection setup, so callers that compare
+        latencies take several samples over the same connection; their median
+        is recorded.
+
+        Args:
+            endpoint: Endpoint to check; updated in place.
+            samples: Number of HEAD requests to send.
+
+        Returns:
+            Server: The endpoint with ``status`` and ``rtt`` set.
+        """
+        rtts: list[float] = []
+        endpoint.status = None
+        for _ in range(max(samples, 1)):
+            try:
+                start = time.perf_counter()
+                response = await self.client.head(endpoint.url)
+            except httpx.HTTPError:
+                break
+            rtts.append(time.perf_counter() - start)
             endpoint.status = response.status_code
-        except httpx.HTTPError:
-            endpoint.status = None
+        endpoint.rtt = statistics.median(rtts) if rtts else None
         return endpoint
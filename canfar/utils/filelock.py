@@ -0,0 +1,69 @@
+"""Advisory inter-process file locks.
+
+Locks are POSIX ``flock`` locks on a dedicated lock file. They are held per
+open file, so they exclude other processes as well as other threads and clients
+of the same process, and are released when the holder exits for any reason.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import fcntl
+import os
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Iterator
+    from pathlib import Path
+
+POLL = 0.05
+"""Seconds between attempts of an asynchronous lock acquisition."""
+
+
+def _open(path: Path) -> int:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    return os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+
+
+@contextlib.contextmanager
+def locked(path: Path) -> Iterator[None]:
+    """Hold an exclusive lock on ``path`` for the duration of the block.
+
+    Args:
+        path (Path): Lock file, created if missing.
+
+    Yields:
+        None: Once the lock is held.
+    """
+    descriptor = _open(path)
+    try:
+        fcntl.flock(descriptor, fcntl.LOCK_EX)
+        yield
+    finally:
+        # Closing the descriptor releases the lock.
+        os.close(descriptor)
+
+
+@contextlib.asynccontextmanager
+async def alocked(path: Path, poll: float = POLL) -> AsyncIterator[None]:
+    """Hold an exclusive lock on ``path`` without blocking the event loop.
+
+    Args:
+        path (Path): Lock file, created if missing.
+        poll (float): Seconds between attempts. Defaults to ``POLL``.
+
+    Yields:
+        None: Once the lock is held.
+    """
+    descriptor = _open(path)
+    try:
+        while True:
+            try:
+                fcntl.flock(descriptor, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                break
+            except BlockingIOError:
+                await asyncio.sleep(poll)
+        yield
+    finally:
+        os.close(descriptor)
@@ -0,0 +1,234 @@
+"""Persistent cache for server discovery documents.
+
+Discovery downloads the same registry ``resource-caps`` documents and VOSI
+``/capabilities`` XML on every run, and activating a server can fetch them
+several times. Responses are kept under ``CONFIG_DIR/cache/http`` together with
+their ``ETag`` and ``Last-Modified`` validators:
+
+- within the TTL the stored body is returned without any request;
+- after the TTL a conditional GET (``If-None-Match`` / ``If-Modified-Since``)
+  revalidates it, and a ``304 Not Modified`` reuses the stored body.
+
+Unreadable cache files are treated as misses; the cache never turns a
+successful network response into an error.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import json
+import os
+import tempfile
+import time
+from http import HTTPStatus
+from pathlib import Path
+from typing import TYPE_CHECKING, Literal, NamedTuple
+
+from canfar import get_logger
+
+if TYPE_CHECKING:
+    import httpx
+
+log = get_logger(__name__)
+
+DEFAULT_TTL = 3600.0
+"""Seconds a cached document is served without revalidation."""
+
+DIRECTORY: Path | None = None
+"""Cache directory override; ``None`` means ``CONFIG_DIR/cache/http``."""
+
+
+class Entry(NamedTuple):
+    """Cached response body and its validators.
+
+    Attributes:
+        url: Absolute request URL.
+        text: Decoded response body.
+        etag: ``ETag`` response header, if any.
+        last_modified: ``Last-Modified`` response header, if any.
+        fetched: Unix time the body was last downloaded or revalidated.
+    """
+
+    url: str
+    text: str
+    etag: str | None
+    last_modified: str | None
+    fetched: float
+
+
+class Document(NamedTuple):
+    """Body returned by :func:`fetch` and :func:`afetch`.
+
+    Attributes:
+        text: Response body.
+        source: ``"cache"`` when served without a request, ``"revalidated"``
+            after a ``304 Not Modified``, ``"network"`` after a full download.
+    """
+
+    text: str
+    source: Literal["cache", "revalidated", "network"]
+
+
+def directory() -> Path:
+    """Return the directory holding cached documents."""
+    if DIRECTORY is not None:
+        return DIRECTORY
+    from canfar import CONFIG_DIR  # noqa: PLC0415
+
+    return CONFIG_DIR / "cache" / "http"
+
+
+def _path(url: str) -> Path:
+    return directory() / f"{hashlib.sha256(url.encode()).hexdigest()}.json"
+
+
+def load(url: str) -> Entry | None:
+    """Return the cached entry for ``url``, or ``None`` if absent or unreadable.
+
+    Args:
+        url (str): Absolute request URL.
+
+    Returns:
+        Entry | None: Cached entry.
+    """
+    try:
+        data = json.loads(_path(url).read_text(encoding="utf-8"))
+        entry = Entry(**data)
+    except (OSError, ValueError, TypeError):
+        return None
+    return entry if entry.url == url else None
+
+
+def store(entry: Entry) -> None:
+    """Atomically write ``entry`` to the cache; failures are logged and ignored.
+
+    Args:
+        entry (Entry): Entry to persist.
+    """
+    destination = _path(entry.url)
+    try:
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        descriptor, name = tempfile.mkstemp(
+            dir=destination.parent, prefix=".", suffix=".tmp"
+        )
+    except OSError as error:
+        log.debug("Could not cache %s: %s", entry.url, error)
+        return
+    temporary = Path(name)
+    try:
+        with os.fdopen(descriptor, "w", encoding="utf-8") as stream:
+            json.dump(entry._asdict(), stream)
+        temporary.replace(destination)
+    except OSError as error:
+        log.debug("Could not cache %s: %s", entry.url, error)
+        with contextlib.suppress(OSError):
+            temporary.unlink()
+
+
+def clear() -> None:
+    """Remove every cached document."""
+    for path in directory().glob("*.json"):
+        with contextlib.suppress(OSError):
+            path.unlink()
+
+
+def fetch(
+    client: httpx.Client,
+    url: str,
+    *,
+    ttl: float = DEFAULT_TTL,
+) -> Document:
+    """GET ``url`` through the cache.
+
+    The request is built by ``client``, so its base URL, headers, auth and event
+    hooks apply; a relative ``url`` is resolved against the client base URL.
+
+    Args:
+        client (httpx.Client): Client used for network requests.
+        url (str): Request URL.
+        ttl (float): Seconds a cached body is served without revalidation.
+            ``0`` always revalidates.
+
+    Returns:
+        Document: Response body and where it came from.
+
+    Raises:
+        httpx.HTTPError: If the request fails or returns a non-success status.
+    """
+    request = client.build_request("GET", url)
+    cached = _lookup(request, ttl)
+    if isinstance(cached, Document):
+        return cached
+    return _settle(client.send(request), str(request.url), cached)
+
+
+async def afetch(
+    client: httpx.AsyncClient,
+    url: str,
+    *,
+    ttl: float = DEFAULT_TTL,
+) -> Document:
+    """Asynchronously GET ``url`` through the cache.
+
+    Same contract as :func:`fetch`.
+
+    Args:
+        client (httpx.AsyncClient): Client used for network requests.
+        url (str): Request URL.
+        ttl (float): Seconds a cached body is served without revalidation.
+
+    Returns:
+        Document: Response body and where it came from.
+
+    Raises:
+        httpx.HTTPError: If the request fails or returns a non-success status.
+    """
+    request = client.build_request("GET", url)
+    cached = _lookup(request, ttl)
+    if isinstance(cached, Document):
+        return cached
+    return _settle(await client.send(request), str(request.url), cached)
+
+
+def _lookup(request: httpx.Request, ttl: float) -> Document | Entry | None:
+    """Serve a fresh entry, or add validators of a stale one to ``request``."""
+    entry = load(str(request.url))
+    if entry is None:
+        return None
+    if time.time() - entry.fetched < ttl:
+        log.debug("Serving %s from cache", entry.url)
+        return Document(entry.text, "cache")
+    if entry.etag:
+        request.headers["If-None-Match"] = entry.etag
+    if entry.last_modified:
+        request.headers["If-Modified-Since"] = entry.last_modified
+    return entry
+
+
+def _settle(response: httpx.Response, url: str, entry: Entry | None) -> Document:
+    """Turn a network response into a document, updating the cache."""
+    if response.status_code == HTTPStatus.NOT_MODIFIED and entry is not None:
+        log.debug("Revalidated cached %s", url)
+        store(
+            entry._replace(
+                etag=response.headers.get("ETag", entry.etag),
+                last_modified=response.headers.get(
+                    "Last-Modified", entry.last_modified
+                ),
+                fetched=time.time(),
+            )
+        )
+        return Document(entry.text, "revalidated")
+    response.raise_for_status()
+    if "no-store" not in response.headers.get("Cache-Control", "").lower():
+        store(
+            Entry(
+                url=url,
+                text=response.text,
+                etag=response.headers.get("ETag"),
+                last_modified=response.headers.get("Last-Modified"),
+                fetched=time.time(),
+            )
+        )
+    return Document(response.text, "network")
@@ -0,0 +1,77 @@
+"""In-cluster client construction for code running inside CANFAR sessions.
+
+A client normally loads ``~/.canfar/config.yaml``, resolves the active
+Authentication Record and Server Selection, and inspects its credential. Inside
+a headless replica that work is repeated by every replica at once, although
+the credential and server are already known. In-cluster mode builds clients
+from a runtime token or X.509 certificate and a server URL alone.
+
+It is enabled with ``CANFAR_IN_CLUSTER=true`` (or ``in_cluster=True``). The
+credential is ``CANFAR_TOKEN``, else ``CANFAR_CERTIFICATE``, else the proxy
+certificate at ``~/.ssl/cadcproxy.pem``. The server is ``CANFAR_URL``, else the
+default CANFAR Science Platform.
+
+The mode is also detected in headless replicas, which receive ``REPLICA_ID``
+and ``REPLICA_COUNT`` from the platform. A detected mode has no defaults: it
+applies only when ``CANFAR_URL`` and ``CANFAR_TOKEN`` or ``CANFAR_CERTIFICATE``
+are set, so a replica never silently switches away from the server and
+Authentication Record in the user's configuration.
+"""
+
+from __future__ import annotations
+
+import os
+from typing import Any
+
+from pydantic import TypeAdapter
+
+from canfar import CERT_PATH
+
+URL = "https://ws-uv.canfar.net/skaha/v1"
+"""Server used when in-cluster mode is requested without a ``url``."""
+
+_BOOL = TypeAdapter(bool)
+
+
+def detected() -> bool:
+    """Whether this process runs in a CANFAR headless replica."""
+    return "REPLICA_ID" in os.environ and "REPLICA_COUNT" in os.environ
+
+
+def enabled(value: Any) -> bool:
+    """Resolve an ``in_cluster`` setting, detecting replicas when it is unset.
+
+    Args:
+        value (Any): Setting from arguments or ``CANFAR_IN_CLUSTER``, if any.
+
+    Returns:
+        bool: Whether in-cluster mode applies.
+    """
+    return detected() if value is None else _BOOL.validate_python(value)
+
+
+def credentials(
+    token: Any,
+    certificate: Any,
+    *,
+    proxy: bool = True,
+) -> dict[str, Any] | None:
+    """Return the runtime credential to use in-cluster.
+
+    Args:
+        token (Any): Runtime token, if given.
+        certificate (Any): Runtime certificate path, if given.
+        proxy (bool): Fall back to the session's proxy certificate.
+            Defaults to True.
+
+    Returns:
+        dict[str, Any] | None: ``token`` or ``certificate`` setting, or None if
+            no credential is available without the configuration file.
+    """
+    if token:
+        return {"token": token}
+    if certificate:
+        return {"certificate": certificate}
+    if proxy and CERT_PATH.is_file():
+        return {"certificate": CERT_PATH}
+    return None
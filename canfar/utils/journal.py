@@ -0,0 +1,284 @@
+"""Local journal of session launches, for resuming interrupted job arrays.
+
+Every launch appends JSON lines to ``CONFIG_DIR/launches/<fingerprint>.jsonl``,
+where the fingerprint is a hash of the replica payloads, so re-running the same
+``create`` call finds the same journal:
+
+- ``{"event": "submit", "replica": 3, "name": "batch-3",
+  "submitted": 1700000000.0}`` before the replica is POSTed;
+- ``{"event": "result", "replica": 3, "id": "abc123"}`` once it launched, or
+  ``{"event": "result", "replica": 3, "error": "HTTPStatusError"}`` if it failed.
+
+A replica with a ``submit`` record but no session ID may still have launched
+(the process died, or the response was lost), so :meth:`Journal.reconcile`
+matches such replicas against the live Session listing by name and start time
+before anything is re-submitted. Journals hold only replica numbers, Session
+names and IDs; payloads, which can include secrets in environment variables,
+are never written, and only identify the journal through its fingerprint.
+Journals are written with owner-only permissions.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import json
+import os
+import threading
+import time
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from canfar import get_logger
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+    from pathlib import Path
+
+log = get_logger(__name__)
+
+RETENTION = 7 * 24 * 3600.0
+"""Seconds after its last write before a journal is pruned."""
+
+DIRECTORY: Path | None = None
+"""Journal directory override; ``None`` means ``CONFIG_DIR/launches``."""
+
+CLOCK_SKEW = 2.0
+"""Seconds a listed ``startTime`` may precede the local submit time and match.
+
+``startTime`` has one-second resolution and is read from the server's clock.
+"""
+
+
+class Replica(NamedTuple):
+    """Journaled state of one replica.
+
+    Attributes:
+        name: Session name submitted for the replica.
+        submitted: Unix time of the latest submission, if it was ever submitted.
+        id: Session ID, if the launch is known to have succeeded.
+    """
+
+    name: str
+    submitted: float | None
+    id: str | None
+
+
+def directory() -> Path:
+    """Return the directory holding launch journals."""
+    if DIRECTORY is not None:
+        return DIRECTORY
+    from canfar import CONFIG_DIR  # noqa: PLC0415
+
+    return CONFIG_DIR / "launches"
+
+
+def fingerprint(payloads: Sequence[Sequence[tuple[str, Any]]]) -> str:
+    """Return a stable identifier for a set of replica payloads."""
+    encoded = json.dumps(payloads, separators=(",", ":"), default=str)
+    return hashlib.sha256(encoded.encode()).hexdigest()[:16]
+
+
+def _name(payload: Iterable[tuple[str, Any]]) -> str:
+    return str(dict(payload).get("name", ""))
+
+
+def _started(session: dict[str, Any]) -> float | None:
+    value = session.get("startTime")
+    if not isinstance(value, str):
+        return None
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp()
+    except ValueError:
+        return None
+
+
+def _matches(
+    name: str,
+    sessions: Iterable[dict[str, Any]],
+    since: float,
+) -> list[str]:
+    matched: list[str] = []
+    for session in sessions:
+        started = _started(session)
+        if (
+            session.get("id")
+            and session.get("name") == name
+            and started is not None
+            and started >= since - CLOCK_SKEW
+        ):
+            matched.append(str(session["id"]))
+    return matched
+
+
+def matches(
+    payload: Iterable[tuple[str, Any]],
+    sessions: Iterable[dict[str, Any]],
+    *,
+    since: float,
+) -> list[str]:
+    """Return the IDs of listed sessions that ``payload`` may have launched.
+
+    Replica names are deterministic, so sessions of earlier launches can share
+    the name. Only sessions with the name that started at or after ``since``
+    (less ``CLOCK_SKEW``) match; sessions without a ``startTime`` never do.
+    More than one match means the outcome cannot be decided.
+
+    Args:
+        payload: Replica payload, as built by
+            :func:`canfar.utils.build.create_parameters`.
+        sessions: Session listing of the user, as returned by ``Session.fetch``.
+        since: Unix time the replica was first submitted.
+
+    Returns:
+        list[str]: IDs of the matching sessions.
+    """
+    return _matches(_name(payload), sessions, since)
+
+
+def prune(retention: float = RETENTION) -> None:
+    """Remove journals not written to within ``retention`` seconds."""
+    cutoff = time.time() - retention
+    for path in directory().glob("*.jsonl"):
+        with contextlib.suppress(OSError):
+            if path.stat().st_mtime < cutoff:
+                path.unlink()
+
+
+class Journal:
+    """Append-only launch journal for one set of replica payloads.
+
+    Writes are serialized with a lock so bulk launches on worker threads can
+    record results concurrently. Failures to write are logged and ignored; the
+    journal never turns a launch into an error.
+
+    Args:
+        payloads: One payload per replica, as built by
+            :func:`canfar.utils.build.create_parameters`.
+    """
+
+    def __init__(self, payloads: Sequence[Sequence[tuple[str, Any]]]) -> None:
+        self.payloads = payloads
+        self.path = directory() / f"{fingerprint(payloads)}.jsonl"
+        self._lock = threading.Lock()
+
+    def start(self) -> None:
+        """Begin a fresh journal, discarding any previous record of this launch."""
+        prune()
+        with contextlib.suppress(OSError):
+            self.path.unlink()
+
+    def submitted(self, replica: int) -> None:
+        """Record that ``replica`` (1-based) is about to be POSTed."""
+        self._append(
+            {
+                "event": "submit",
+                "replica": replica,
+                "name": _name(self.payloads[replica - 1]),
+                "submitted": time.time(),
+            }
+        )
+
+    def completed(self, replica: int, outcome: str | BaseException) -> None:
+        """Record the session ID or the failure of ``replica``."""
+        record: dict[str, Any] = {"event": "result", "replica": replica}
+        if isinstance(outcome, str):
+            record["id"] = outcome
+        else:
+            record["error"] = type(outcome).__name__
+        self._append(record)
+
+    def load(self) -> dict[int, Replica]:
+        """Return the journaled state of every replica.
+
+        Unreadable lines, such as one cut short by a crash, are skipped.
+
+        Returns:
+            dict[int, Replica]: State keyed by replica number.
+        """
+        state = {
+            replica: Replica(_name(payload), None, None)
+            for replica, payload in enumerate(self.payloads, start=1)
+        }
+        try:
+            lines = self.path.read_text(encoding="utf-8").splitlines()
+        except OSError:
+            return state
+        for line in lines:
+            try:
+                record = json.loads(line)
+                current = state[record["replica"]]
+            except (ValueError, KeyError, TypeError):
+                continue
+            if record.get("event") == "submit":
+                state[record["replica"]] = current._replace(
+                    submitted=record.get("submitted"), id=None
+                )
+            elif record.get("id"):
+                state[record["replica"]] = current._replace(id=record["id"])
+        return state
+
+    def reconcile(
+        self,
+        sessions: Iterable[dict[str, Any]],
+    ) -> tuple[dict[int, str], list[int]]:
+        """Split replicas into launched and still-missing ones.
+
+        Replicas without a journaled session ID are matched against
+        ``sessions`` (the output of ``Session.fetch``) by name and by their
+        journaled submit time, as in :func:`matches`, so sessions of earlier
+        launches with the same name are ignored. Matches are recorded so later
+        resumes do not need the listing again. Replicas that match several
+        sessions are logged and left out of both results, since submitting
+        them again could duplicate a launch.
+
+        Args:
+            sessions: Session listing of the user.
+
+        Returns:
+            tuple[dict[int, str], list[int]]: Session IDs keyed by replica, and
+                the replica numbers that must be (re-)submitted.
+        """
+        listed = list(sessions)
+        launched: dict[int, str] = {}
+        missing: list[int] = []
+        for replica, state in self.load().items():
+            if state.id is not None:
+                launched[replica] = state.id
+                continue
+            found = (
+                []
+                if state.submitted is None
+                else _matches(state.name, listed, state.submitted)
+            )
+            if len(found) == 1:
+                launched[replica] = found[0]
+                self.completed(replica, found[0])
+            elif found:
+                log.warning(
+                    "Not resuming replica %d: %d sessions named %s match",
+                    replica,
+                    len(found),
+                    state.name,
+                )
+            else:
+                missing.append(replica)
+        log.info(
+            "Resuming launch: %d replica(s) already running, %d to submit",
+            len(launched),
+            len(missing),
+        )
+        return launched, missing
+
+    def _append(self, record: dict[str, Any]) -> None:
+        line = json.dumps(record, default=str) + "\n"
+        with self._lock:
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                descriptor = os.open(
+                    self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o600
+                )
+                with os.fdopen(descriptor, "a", encoding="utf-8") as stream:
+                    stream.write(line)
+            except OSError as error:
+                log.debug("Could not write launch journal %s: %s", self.path, error)
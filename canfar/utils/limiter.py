@@ -0,0 +1,264 @@
+"""Shared concurrency limiter for asynchronous CANFAR clients.
+
+One :class:`Limiter` belongs to each client and bounds *all* of its concurrent
+bulk requests, so running ``logs()`` and ``info()`` side by side on the same
+client never exceeds ``concurrency`` requests in flight. Waiters are admitted
+first come, first served, and the time each one spends queued is recorded in
+:class:`LimiterStats`.
+
+An optional :class:`AIMD` controller adapts the limit to the server: it adds
+one slot per window of fast, successful requests and halves the limit when the
+server pushes back with ``429``/``503`` or requests time out.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+import httpx
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+MAX_CONCURRENCY = 128
+"""Upper bound for adaptive concurrency limits."""
+
+_OVERLOAD_STATUSES = frozenset(
+    {httpx.codes.TOO_MANY_REQUESTS, httpx.codes.SERVICE_UNAVAILABLE}
+)
+
+
+@dataclass
+class LimiterStats:
+    """Queue metrics of a :class:`Limiter`.
+
+    Attributes:
+        acquired: Slots handed out.
+        queued: Acquisitions that had to wait for a free slot.
+        wait_total: Seconds spent waiting, summed over all acquisitions.
+        wait_max: Longest single wait in seconds.
+    """
+
+    acquired: int = 0
+    queued: int = 0
+    wait_total: float = 0.0
+    wait_max: float = 0.0
+
+    @property
+    def wait_mean(self) -> float:
+        """Mean seconds an acquisition waited, including those that did not."""
+        return self.wait_total / self.acquired if self.acquired else 0.0
+
+    def record(self, wait: float) -> None:
+        """Account for one acquisition that waited ``wait`` seconds."""
+        self.acquired += 1
+        if wait > 0:
+            self.queued += 1
+            self.wait_total += wait
+            self.wait_max = max(self.wait_max, wait)
+
+
+def overloaded(error: BaseException | None) -> bool:
+    """Whether ``error`` means the server is shedding load."""
+    if isinstance(error, httpx.TimeoutException):
+        return True
+    return (
+        isinstance(error, httpx.HTTPStatusError)
+        and error.response.status_code in _OVERLOAD_STATUSES
+    )
+
+
+class AIMD:
+    """Additive-increase/multiplicative-decrease concurrency controller.
+
+    The controller keeps a smoothed latency estimate and a slowly rising
+    baseline (the fastest recent latency). While requests succeed and latency
+    stays within ``tolerance`` times the baseline, the limit grows by one every
+    ``limit`` successes. Latency beyond that gradient shrinks it by one, and
+    overload signals multiply it by ``backoff``, at most once per latency
+    window so a burst of rejections counts as one signal.
+
+    Args:
+        minimum (int): Lowest limit. Defaults to 1.
+        maximum (int): Highest limit. Defaults to ``MAX_CONCURRENCY``.
+        backoff (float): Factor applied on overload. Defaults to 0.5.
+        tolerance (float): Accepted latency growth over the baseline.
+            Defaults to 2.
+        smoothing (float): EWMA weight of each new latency sample.
+            Defaults to 0.2.
+    """
+
+    def __init__(
+        self,
+        minimum: int = 1,
+        maximum: int = MAX_CONCURRENCY,
+        backoff: float = 0.5,
+        tolerance: float = 2.0,
+        smoothing: float = 0.2,
+    ) -> None:
+        self.minimum = minimum
+        self.maximum = maximum
+        self.backoff = backoff
+        self.tolerance = tolerance
+        self.smoothing = smoothing
+        self.latency: float | None = None
+        self.baseline: float | None = None
+        self._successes = 0
+        self._decreased = float("-inf")
+
+    def update(self, limit: int, latency: float, error: BaseException | None) -> int:
+        """Return the new limit after one request finished.
+
+        Args:
+            limit (int): Current limit.
+            latency (float): Seconds the request held its slot.
+            error (BaseException | None): Failure raised by the request, if any.
+
+        Returns:
+            int: New limit.
+        """
+        now = time.monotonic()
+        if overloaded(error):
+            self._successes = 0
+            if now - self._decreased < (self.latency or 0.0):
+                return limit
+            self._decreased = now
+            return max(self.minimum, int(limit * self.backoff))
+        if error is not None:
+            return limit
+        self.latency = (
+            latency
+            if self.latency is None
+            else self.smoothing * latency + (1 - self.smoothing) * self.latency
+        )
+        # Let the baseline drift up so a permanently slower server is relearned.
+        self.baseline = (
+            latency if self.baseline is None else min(latency, self.baseline * 1.01)
+        )
+        if self.latency > self.tolerance * self.baseline:
+            self._successes = 0
+            return max(self.minimum, limit - 1)
+        self._successes += 1
+        if self._successes >= limit:
+            self._successes = 0
+            return min(self.maximum, limit + 1)
+        return limit
+
+
+class Limiter:
+    """FIFO async concurrency limiter with an adjustable limit.
+
+    Use ``async with limiter.slot():`` around one request. Unlike
+    :class:`asyncio.Semaphore` the limit can be changed while requests are in
+    flight: raising it admits waiters immediately, lowering it lets in-flight
+    requests drain before new ones start.
+
+    Args:
+        limit (int): Maximum concurrent holders. Must be at least 1.
+        controller (AIMD | None): Adapts the limit to observed latency and
+            errors. Defaults to None, i.e. a fixed limit.
+
+    Examples:
+        >>> limiter = Limiter(32)
+        >>> async with limiter.slot():
+        ...     await client.get("session")
+        >>> limiter.stats.wait_mean
+    """
+
+    def __init__(self, limit: int, controller: AIMD | None = None) -> None:
+        if limit < 1:
+            msg = f"limit must be at least 1, got {limit}"
+            raise ValueError(msg)
+        self.controller = controller
+        self._limit = limit
+        self._active = 0
+        self._waiters: deque[asyncio.Future[None]] = deque()
+        self.stats = LimiterStats()
+
+    @property
+    def limit(self) -> int:
+        """Maximum concurrent holders."""
+        return self._limit
+
+    @limit.setter
+    def limit(self, value: int) -> None:
+        self._limit = max(1, value)
+        self._wake()
+
+    @property
+    def latency(self) -> float | None:
+        """Smoothed request latency in seconds, when adaptive."""
+        return self.controller.latency if self.controller else None
+
+    @property
+    def active(self) -> int:
+        """Slots currently held."""
+        return self._active
+
+    @property
+    def waiting(self) -> int:
+        """Acquisitions currently queued."""
+        return sum(not waiter.done() for waiter in self._waiters)
+
+    async def acquire(self) -> None:
+        """Wait for a free slot, in arrival order."""
+        if self._active < self._limit and not self._waiters:
+            self._active += 1
+            self.stats.record(0.0)
+            return
+        start = time.perf_counter()
+        waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # The slot was granted just as the caller was cancelled.
+                self.release()
+            else:
+                with contextlib.suppress(ValueError):
+                    self._waiters.remove(waiter)
+            raise
+        self.stats.record(time.perf_counter() - start)
+
+    def release(self) -> None:
+        """Return a slot and admit the next waiter, if any."""
+        self._active -= 1
+        self._wake()
+
+    def _wake(self) -> None:
+        while self._waiters and self._active < self._limit:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self._active += 1
+                waiter.set_result(None)
+
+    @contextlib.asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """Hold one slot for the duration of the block.
+
+        With a controller, the time the slot was held and the exception that
+        left the block, if any, adjust the limit.
+
+        Yields:
+            None: Once a slot is held.
+        """
+        await self.acquire()
+        start = time.perf_counter()
+        error: BaseException | None = None
+        try:
+            yield
+        except BaseException as err:
+            error = err
+            raise
+        finally:
+            self.release()
+            if self.controller is not None:
+                self.limit = self.controller.update(
+                    self._limit, time.perf_counter() - start, error
+                )
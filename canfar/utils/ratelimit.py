@@ -0,0 +1,209 @@
+"""Token-bucket rate limiting for bursts of API requests.
+
+A :class:`TokenBucket` admits ``rate`` requests per second on average and lets
+up to ``capacity`` through back to back. Callers *reserve* a token and sleep
+for the returned delay, so one bucket paces worker threads and asyncio tasks
+alike without holding a lock while waiting.
+
+:func:`replica_bucket` shares a request budget between the replicas of a job
+array without any coordination: each replica paces itself to ``budget /
+REPLICA_COUNT`` requests per second, and its schedule is shifted by its
+``REPLICA_ID``, so replicas starting together interleave instead of bursting.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import threading
+import time
+
+import httpx
+
+from canfar import get_logger
+
+log = get_logger(__name__)
+
+
+class TokenBucket:
+    """Thread-safe token bucket.
+
+    Args:
+        rate (float): Tokens added per second. Must be positive.
+        capacity (float | None): Maximum stored tokens, i.e. the burst size.
+            Defaults to ``max(1, rate)``.
+        offset (float): Seconds by which the schedule is delayed; the bucket
+            starts with ``offset * rate`` fewer tokens. Defaults to 0.
+
+    Examples:
+        >>> bucket = TokenBucket(rate=5)
+        >>> bucket.acquire()  # returns immediately while tokens remain
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float | None = None,
+        offset: float = 0.0,
+    ) -> None:
+        if rate <= 0:
+            msg = f"rate must be positive, got {rate}"
+            raise ValueError(msg)
+        self.rate = rate
+        self.capacity = max(1.0, rate) if capacity is None else capacity
+        self._tokens = self.capacity - offset * rate
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Take one token and return the seconds to wait before using it.
+
+        Tokens may be borrowed ahead of time; each reservation queues behind the
+        previous ones, so concurrent callers are spaced ``1 / rate`` apart.
+
+        Returns:
+            float: Delay in seconds, ``0.0`` when a token was available.
+        """
+        with self._lock:
+            now = time.monotonic()
+            elapsed = now - self._updated
+            self._updated = now
+            self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+            self._tokens -= 1
+            return max(0.0, -self._tokens / self.rate)
+
+    def acquire(self) -> None:
+        """Block the calling thread until a token is available."""
+        delay = self.reserve()
+        if delay:
+            time.sleep(delay)
+
+    async def aacquire(self) -> None:
+        """Wait without blocking the event loop until a token is available."""
+        delay = self.reserve()
+        if delay:
+            await asyncio.sleep(delay)
+
+
+def replica_bucket(
+    budget: float,
+    replica: int | None = None,
+    total: int | None = None,
+) -> TokenBucket:
+    """Return this replica's share of a job array's request budget.
+
+    Every replica gets ``budget / total`` requests per second without bursts,
+    and replica ``n`` gets its first request ``(n - 1) / budget`` seconds after
+    start-up. Together the replicas send one request every ``1 / budget``
+    seconds at most, however many call the API at once. A missing or invalid
+    ``total`` counts as 1, and a replica number outside ``1..total`` as 1,
+    with a warning.
+
+    Args:
+        budget (float): Requests per second for the whole job array.
+        replica (int | None): Replica number, from 1. Defaults to ``REPLICA_ID``.
+        total (int | None): Number of replicas. Defaults to ``REPLICA_COUNT``.
+
+    Returns:
+        TokenBucket: Bucket pacing this replica.
+
+    Examples:
+        >>> bucket = replica_bucket(50, replica=3, total=256)
+        >>> bucket.rate
+        0.1953125
+    """
+    total = _count("REPLICA_COUNT", total)
+    if total is None or total < 1:
+        log.warning("REPLICA_COUNT must be a positive integer; using 1.")
+        total = 1
+    replica = _count("REPLICA_ID", replica)
+    if replica is None or not 1 <= replica <= total:
+        # REPLICA_ID=0 would otherwise share the last replica's slot.
+        log.warning("REPLICA_ID must be an integer from 1 to %d; using 1.", total)
+        replica = 1
+    return TokenBucket(budget / total, capacity=1.0, offset=(replica - 1) / budget)
+
+
+def _count(name: str, value: int | None) -> int | None:
+    """Return ``value``, else environment variable ``name`` (default 1) or None."""
+    if value is not None:
+        return value
+    try:
+        return int(os.environ.get(name, "1"))
+    except ValueError:
+        return None
+
+
+_buckets: dict[float, TokenBucket] = {}
+_lock = threading.Lock()
+
+
+def shared(budget: float) -> TokenBucket:
+    """Return the process-wide :func:`replica_bucket` for ``budget``.
+
+    All clients in one replica draw from the same share, however many the
+    process builds.
+
+    Args:
+        budget (float): Requests per second for the whole job array.
+
+    Returns:
+        TokenBucket: Shared bucket.
+    """
+    with _lock:
+        bucket = _buckets.get(budget)
+        if bucket is None:
+            bucket = _buckets[budget] = replica_bucket(budget)
+        return bucket
+
+
+def reset() -> None:
+    """Forget every shared bucket."""
+    with _lock:
+        _buckets.clear()
+
+
+class RateLimitTransport(httpx.BaseTransport):
+    """Sync transport that takes a token before sending each request.
+
+    Args:
+        transport (httpx.BaseTransport): Transport that sends requests.
+        bucket (TokenBucket): Bucket pacing the requests.
+    """
+
+    def __init__(self, transport: httpx.BaseTransport, bucket: TokenBucket) -> None:
+        self.transport = transport
+        self.bucket = bucket
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        """Wait for a token, then send ``request``."""
+        self.bucket.acquire()
+        return self.transport.handle_request(request)
+
+    def close(self) -> None:
+        """Close the wrapped transport."""
+        self.transport.close()
+
+
+class AsyncRateLimitTransport(httpx.AsyncBaseTransport):
+    """Async transport that takes a token before sending each request.
+
+    Args:
+        transport (httpx.AsyncBaseTransport): Transport that sends requests.
+        bucket (TokenBucket): Bucket pacing the requests.
+    """
+
+    def __init__(
+        self, transport: httpx.AsyncBaseTransport, bucket: TokenBucket
+    ) -> None:
+        self.transport = transport
+        self.bucket = bucket
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """Wait for a token, then send ``request``."""
+        await self.bucket.aacquire()
+        return await self.transport.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        """Close the wrapped transport."""
+        await self.transport.aclose()
@@ -0,0 +1,361 @@
+"""Retry policy for transient HTTP failures.
+
+Delays grow exponentially with *full jitter* (a uniform draw between zero and
+the exponential ceiling) so that many clients retrying at once spread out
+instead of hammering the server in lock-step. A ``Retry-After`` header sent by
+the server takes precedence over the computed delay.
+
+:class:`RetryTransport` and :class:`AsyncRetryTransport` apply the policy below
+``HTTPClient`` to idempotent requests (``GET``, ``HEAD``, ``DELETE``, and
+requests marked with the :data:`SAFE` extension). A :class:`RetryBudget`
+limits retries to a fraction of traffic so that retries cannot multiply the
+load on a server that is already failing.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import random
+import threading
+import time
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+
+import httpx
+
+from canfar import get_logger
+
+log = get_logger(__name__)
+
+RETRYABLE_STATUSES: frozenset[int] = frozenset(
+    {
+        httpx.codes.TOO_MANY_REQUESTS,
+        httpx.codes.BAD_GATEWAY,
+        httpx.codes.SERVICE_UNAVAILABLE,
+        httpx.codes.GATEWAY_TIMEOUT,
+    }
+)
+"""Status codes that signal a temporary condition worth retrying."""
+
+IDEMPOTENT_METHODS: frozenset[str] = frozenset({"GET", "HEAD", "DELETE"})
+"""Methods the retry transports repeat without being asked to."""
+
+SAFE = "canfar.retry"
+"""Request extension that marks a non-idempotent request safe to retry.
+
+Example: ``client.post(url, extensions={SAFE: True})``.
+"""
+
+_TRANSIENT = (httpx.TimeoutException, httpx.NetworkError, httpx.RemoteProtocolError)
+
+
+@dataclass(frozen=True)
+class Backoff:
+    """Exponential backoff with full jitter.
+
+    Attributes:
+        retries: Retries after the first attempt; ``0`` disables retrying.
+        base: Ceiling in seconds of the first delay.
+        cap: Upper bound in seconds for any delay, including ``Retry-After``.
+    """
+
+    retries: int = 4
+    base: float = 0.5
+    cap: float = 30.0
+
+    def delay(self, attempt: int, retry_after: float | None = None) -> float:
+        """Return the seconds to wait before retry number ``attempt + 1``.
+
+        Args:
+            attempt (int): Zero-based number of the failed attempt.
+            retry_after (float | None): Server-requested delay, if any.
+
+        Returns:
+            float: Delay in seconds.
+        """
+        if retry_after is not None:
+            return min(self.cap, max(0.0, retry_after))
+        ceiling = min(self.cap, self.base * 2**attempt)
+        return random.uniform(0, ceiling)  # noqa: S311
+
+
+def retryable(error: BaseException) -> bool:
+    """Whether ``error`` is transient and the request was safe to repeat.
+
+    Connection-establishment failures never reached the server. ``429`` and
+    ``502`` to ``504`` mean the request was refused or not processed. Other
+    statuses, including ``500``, are treated as final since retrying a
+    non-idempotent request after an internal error could duplicate it.
+
+    Args:
+        error (BaseException): Failure raised by a request.
+
+    Returns:
+        bool: True if the request should be retried.
+    """
+    if isinstance(error, (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)):
+        return True
+    if isinstance(error, httpx.HTTPStatusError):
+        return error.response.status_code in RETRYABLE_STATUSES
+    return False
+
+
+def retry_after(error: BaseException) -> float | None:
+    """Parse the ``Retry-After`` header of a failed response.
+
+    Args:
+        error (BaseException): Failure raised by a request.
+
+    Returns:
+        float | None: Seconds to wait, or ``None`` if absent or malformed.
+    """
+    if not isinstance(error, httpx.HTTPStatusError):
+        return None
+    return parse_retry_after(error.response.headers.get("Retry-After"))
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Parse a ``Retry-After`` value in seconds or as an HTTP date.
+
+    Args:
+        value (str | None): Header value.
+
+    Returns:
+        float | None: Seconds to wait, or ``None`` if absent or malformed.
+    """
+    value = (value or "").strip()
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        moment = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, moment.timestamp() - time.time())
+
+
+@dataclass
+class RetryStats:
+    """Retry counters of one client.
+
+    Attributes:
+        requests: Requests sent through the retry transport.
+        retries: Retries performed.
+        exhausted: Requests that still failed after their last retry.
+        denied: Retries skipped because the retry budget was spent.
+    """
+
+    requests: int = 0
+    retries: int = 0
+    exhausted: int = 0
+    denied: int = 0
+
+
+class RetryBudget:
+    """Token bucket that caps retries at a fraction of requests.
+
+    Every request deposits ``ratio`` tokens and every retry spends one. The
+    balance starts at, and is capped by, ``minimum``, so a quiet client can
+    always retry a few times while a busy one retries at most ``ratio`` of its
+    traffic.
+
+    Args:
+        ratio (float): Retries allowed per request in the long run.
+        minimum (float): Retries always allowed in a burst.
+    """
+
+    def __init__(self, ratio: float = 0.2, minimum: float = 10.0) -> None:
+        self.ratio = ratio
+        self.minimum = minimum
+        self._balance = minimum
+        self._lock = threading.Lock()
+
+    def deposit(self) -> None:
+        """Credit one request."""
+        with self._lock:
+            self._balance = min(self.minimum, self._balance + self.ratio)
+
+    def withdraw(self) -> bool:
+        """Spend one retry if the budget allows it."""
+        with self._lock:
+            if self._balance < 1:
+                return False
+            self._balance -= 1
+            return True
+
+
+class _Retrying:
+    """Retry decisions shared by the sync and async transports."""
+
+    def __init__(
+        self,
+        policy: Backoff,
+        budget: RetryBudget | None = None,
+        stats: RetryStats | None = None,
+    ) -> None:
+        self.policy = policy
+        self.budget = budget or RetryBudget()
+        self.stats = stats or RetryStats()
+        self._lock = threading.Lock()
+
+    def _begin(self, request: httpx.Request) -> bool:
+        """Count ``request`` and return whether it may be retried at all."""
+        self.budget.deposit()
+        with self._lock:
+            self.stats.requests += 1
+        return (
+            request.method in IDEMPOTENT_METHODS or bool(request.extensions.get(SAFE))
+        ) and isinstance(request.stream, httpx.ByteStream)
+
+    def _delay(
+        self,
+        request: httpx.Request,
+        attempt: int,
+        reason: str,
+        retry_after: float | None = None,
+    ) -> float | None:
+        """Return the backoff before the next attempt, or ``None`` to give up."""
+        if attempt >= self.policy.retries:
+            with self._lock:
+                self.stats.exhausted += 1
+            log.warning(
+                "%s %s failed after %d retries (%s)",
+                request.method,
+                request.url.path,
+                attempt,
+                reason,
+            )
+            return None
+        if not self.budget.withdraw():
+            with self._lock:
+                self.stats.denied += 1
+            log.warning(
+                "Not retrying %s %s (%s): retry budget spent",
+                request.method,
+                request.url.path,
+                reason,
+            )
+            return None
+        delay = self.policy.delay(attempt, retry_after)
+        with self._lock:
+            self.stats.retries += 1
+        log.info(
+            "Retrying %s %s in %.2fs (retry %d/%d, %s)",
+            request.method,
+            request.url.path,
+            delay,
+            attempt + 1,
+            self.policy.retries,
+            reason,
+        )
+        return delay
+
+
+def _status_reason(response: httpx.Response) -> tuple[str, float | None]:
+    return (
+        f"HTTP {response.status_code}",
+        parse_retry_after(response.headers.get("Retry-After")),
+    )
+
+
+class RetryTransport(_Retrying, httpx.BaseTransport):
+    """Sync transport that retries transient failures of idempotent requests.
+
+    Args:
+        transport (httpx.BaseTransport): Transport that sends each attempt.
+        policy (Backoff): Retry count and backoff.
+        budget (RetryBudget | None): Shared retry budget.
+        stats (RetryStats | None): Counters to update.
+    """
+
+    def __init__(
+        self,
+        transport: httpx.BaseTransport,
+        policy: Backoff,
+        budget: RetryBudget | None = None,
+        stats: RetryStats | None = None,
+    ) -> None:
+        super().__init__(policy, budget, stats)
+        self.transport = transport
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        """Send ``request``, retrying transient failures."""
+        retryable = self._begin(request)
+        attempt = 0
+        while True:
+            try:
+                response = self.transport.handle_request(request)
+            except _TRANSIENT as err:
+                delay = (
+                    self._delay(request, attempt, type(err).__name__)
+                    if retryable
+                    else None
+                )
+                if delay is None:
+                    raise
+            else:
+                if not retryable or response.status_code not in RETRYABLE_STATUSES:
+                    return response
+                delay = self._delay(request, attempt, *_status_reason(response))
+                if delay is None:
+                    return response
+                response.close()
+            time.sleep(delay)
+            attempt += 1
+
+    def close(self) -> None:
+        """Close the wrapped transport."""
+        self.transport.close()
+
+
+class AsyncRetryTransport(_Retrying, httpx.AsyncBaseTransport):
+    """Async transport that retries transient failures of idempotent requests.
+
+    Args:
+        transport (httpx.AsyncBaseTransport): Transport that sends each attempt.
+        policy (Backoff): Retry count and backoff.
+        budget (RetryBudget | None): Shared retry budget.
+        stats (RetryStats | None): Counters to update.
+    """
+
+    def __init__(
+        self,
+        transport: httpx.AsyncBaseTransport,
+        policy: Backoff,
+        budget: RetryBudget | None = None,
+        stats: RetryStats | None = None,
+    ) -> None:
+        super().__init__(policy, budget, stats)
+        self.transport = transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """Send ``request``, retrying transient failures."""
+        retryable = self._begin(request)
+        attempt = 0
+        while True:
+            try:
+                response = await self.transport.handle_async_request(request)
+            except _TRANSIENT as err:
+                delay = (
+                    self._delay(request, attempt, type(err).__name__)
+                    if retryable
+                    else None
+                )
+                if delay is None:
+                    raise
+            else:
+                if not retryable or response.status_code not in RETRYABLE_STATUSES:
+                    return response
+                delay = self._delay(request, attempt, *_status_reason(response))
+                if delay is None:
+                    return response
+                await response.aclose()
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def aclose(self) -> None:
+        """Close the wrapped transport."""
+        await self.transport.aclose()
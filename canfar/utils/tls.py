@@ -0,0 +1,217 @@
+"""Cached client TLS contexts with session resumption.
+
+Creating an ``SSLContext`` loads a CA bundle and, for X.509 Authentication
+Records, the client certificate chain. Both are done once per CA bundle and per
+certificate file version, and the resulting context is shared by every client.
+
+Shared contexts also remember the last TLS session negotiated with each server
+hostname and offer it on the next connection, so new connections to a server
+that was already contacted resume the session instead of running a full
+handshake.
+"""
+
+from __future__ import annotations
+
+import os
+import ssl
+import sys
+import threading
+from typing import TYPE_CHECKING
+
+import certifi
+
+from canfar import get_logger
+
+if TYPE_CHECKING:
+    import socket
+    from pathlib import Path
+
+log = get_logger(__name__)
+
+_Fingerprint = tuple[int, int, int]
+
+
+class _SessionSocket(ssl.SSLSocket):
+    """TLS socket that hands its session back to its context on close."""
+
+    def close(self) -> None:
+        """Record the final session, then close the socket."""
+        if isinstance(self.context, SessionContext):
+            self.context.remember(self)
+        super().close()
+
+
+class SessionContext(ssl.SSLContext):
+    """Client ``SSLContext`` that resumes TLS sessions per server hostname.
+
+    The most recent connection to each hostname is remembered; its session is
+    offered when the next connection to that hostname is opened. Sessions are
+    read as late as possible because TLS 1.3 tickets arrive after the handshake.
+    """
+
+    sslsocket_class = _SessionSocket
+
+    def __init__(self, protocol: int = ssl.PROTOCOL_TLS_CLIENT) -> None:
+        # ``SSLContext.__new__`` consumes ``protocol``; there is no base __init__.
+        del protocol
+        self._sessions_lock = threading.Lock()
+        self._latest: dict[str, ssl.SSLSocket | ssl.SSLObject] = {}
+        self._sessions: dict[str, ssl.SSLSession] = {}
+
+    def wrap_socket(
+        self,
+        sock: socket.socket,
+        server_side: bool = False,
+        do_handshake_on_connect: bool = True,
+        suppress_ragged_eofs: bool = True,
+        server_hostname: str | bytes | None = None,
+        session: ssl.SSLSession | None = None,
+    ) -> ssl.SSLSocket:
+        """Wrap ``sock``, offering the last session for ``server_hostname``."""
+        if session is None and not server_side:
+            session = self._resume(server_hostname)
+        wrapped = super().wrap_socket(
+            sock,
+            server_side=server_side,
+            do_handshake_on_connect=do_handshake_on_connect,
+            suppress_ragged_eofs=suppress_ragged_eofs,
+            server_hostname=server_hostname,
+            session=session,
+        )
+        self._track(wrapped)
+        return wrapped
+
+    def wrap_bio(
+        self,
+        incoming: ssl.MemoryBIO,
+        outgoing: ssl.MemoryBIO,
+        server_side: bool = False,
+        server_hostname: str | bytes | None = None,
+        session: ssl.SSLSession | None = None,
+    ) -> ssl.SSLObject:
+        """Wrap memory BIOs, offering the last session for ``server_hostname``."""
+        if session is None and not server_side:
+            session = self._resume(server_hostname)
+        wrapped = super().wrap_bio(
+            incoming,
+            outgoing,
+            server_side=server_side,
+            server_hostname=server_hostname,
+            session=session,
+        )
+        self._track(wrapped)
+        return wrapped
+
+    def remember(self, wrapped: ssl.SSLSocket | ssl.SSLObject) -> None:
+        """Store the current session of ``wrapped`` for its server hostname."""
+        hostname, session = wrapped.server_hostname, wrapped.session
+        if wrapped.server_side or hostname is None or session is None:
+            return
+        with self._sessions_lock:
+            self._sessions[hostname] = session
+
+    def _resume(self, hostname: str | bytes | None) -> ssl.SSLSession | None:
+        if hostname is None:
+            return None
+        key = hostname.decode() if isinstance(hostname, bytes) else hostname
+        with self._sessions_lock:
+            latest = self._latest.get(key)
+        if latest is not None:
+            self.remember(latest)
+        with self._sessions_lock:
+            return self._sessions.get(key)
+
+    def _track(self, wrapped: ssl.SSLSocket | ssl.SSLObject) -> None:
+        hostname = wrapped.server_hostname
+        if wrapped.server_side or hostname is None:
+            return
+        with self._sessions_lock:
+            self._latest[hostname] = wrapped
+
+
+def _create(*, cafile: str | None = None, capath: str | None = None) -> SessionContext:
+    """Create a context configured like ``ssl.create_default_context``."""
+    context = SessionContext(ssl.PROTOCOL_TLS_CLIENT)
+    if sys.version_info >= (3, 13):
+        context.verify_flags |= ssl.VERIFY_X509_PARTIAL_CHAIN | ssl.VERIFY_X509_STRICT
+    if cafile or capath:
+        context.load_verify_locations(cafile=cafile, capath=capath)
+    else:
+        context.load_default_certs(ssl.Purpose.SERVER_AUTH)
+    return context
+
+
+class _Contexts:
+    """Thread-safe cache of shared client contexts."""
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.default: tuple[tuple[str | None, str | None], SessionContext] | None = None
+        self.certificates: dict[str, tuple[_Fingerprint, SessionContext]] = {}
+
+
+_contexts = _Contexts()
+
+
+def default() -> ssl.SSLContext:
+    """Return the shared context used when no client certificate is configured.
+
+    Mirrors HTTPx's ``verify=True``: ``SSL_CERT_FILE`` or ``SSL_CERT_DIR`` when
+    set, otherwise the ``certifi`` CA bundle.
+
+    Returns:
+        ssl.SSLContext: Shared client context.
+    """
+    key = (os.environ.get("SSL_CERT_FILE"), os.environ.get("SSL_CERT_DIR"))
+    with _contexts.lock:
+        if _contexts.default is None or _contexts.default[0] != key:
+            cafile, capath = key
+            if cafile:
+                context = _create(cafile=cafile)
+            elif capath:
+                context = _create(capath=capath)
+            else:
+                context = _create(cafile=certifi.where())
+            _contexts.default = (key, context)
+        return _contexts.default[1]
+
+
+def certificate(path: Path) -> ssl.SSLContext:
+    """Return the shared context presenting the X.509 certificate at ``path``.
+
+    The certificate chain is loaded once per file version; a renewed certificate
+    (new mtime, size or inode) gets a fresh context.
+
+    Args:
+        path (Path): Path to the PEM certificate and private key.
+
+    Returns:
+        ssl.SSLContext: Shared client context with the certificate chain loaded.
+
+    Raises:
+        OSError: If the certificate file cannot be read.
+        ssl.SSLError: If the certificate chain cannot be loaded.
+    """
+    destination = path.resolve(strict=True)
+    stat = destination.stat()
+    fingerprint = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+    key = destination.as_posix()
+    with _contexts.lock:
+        cached = _contexts.certificates.get(key)
+    if cached is not None and cached[0] == fingerprint:
+        return cached[1]
+
+    context = _create()
+    context.minimum_version = ssl.TLSVersion.TLSv1_2
+    context.load_cert_chain(certfile=key)
+    log.debug("Loaded client certificate chain from %s", key)
+    with _contexts.lock:
+        _contexts.certificates[key] = (fingerprint, context)
+    return context
+
+
+def clear() -> None:
+    """Forget every cached context and the TLS sessions they hold."""
+    with _contexts.lock:
+        _contexts.default = None
+        _contexts.certificates.clear()
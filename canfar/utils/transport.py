@@ -0,0 +1,182 @@
+"""Process-wide shared HTTPx transports for CANFAR clients.
+
+Every ``HTTPClient`` subclass builds its own ``httpx.Client``; without sharing,
+each one opens its own TCP+TLS connections to the same Science Platform Server.
+This module keeps one connection pool per origin and credential identity and
+hands clients a non-owning view of it, so closing a client leaves the pool warm
+for the next one.
+
+Pools live until :func:`close` (or :func:`aclose` for the current event loop)
+is called, and sync pools are closed at interpreter exit.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import atexit
+import ssl
+import threading
+import weakref
+from typing import TYPE_CHECKING, Any, Callable, Generic, TypeVar
+
+import httpx
+
+from canfar import get_logger
+
+if TYPE_CHECKING:
+    from httpx import URL
+
+log = get_logger(__name__)
+
+_Transport = TypeVar("_Transport", httpx.HTTPTransport, httpx.AsyncHTTPTransport)
+TransportKey = tuple[str, ssl.SSLContext, int, int, bool]
+
+
+class SharedTransport(httpx.BaseTransport):
+    """Non-owning view of a pooled sync transport; ``close`` is a no-op."""
+
+    def __init__(self, transport: httpx.HTTPTransport) -> None:
+        self.transport = transport
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        """Send ``request`` over the shared connection pool."""
+        return self.transport.handle_request(request)
+
+    def close(self) -> None:
+        """Leave the shared pool open for other clients."""
+
+
+class AsyncSharedTransport(httpx.AsyncBaseTransport):
+    """Non-owning view of a pooled async transport; ``aclose`` is a no-op."""
+
+    def __init__(self, transport: httpx.AsyncHTTPTransport) -> None:
+        self.transport = transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """Send ``request`` over the shared connection pool."""
+        return await self.transport.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        """Leave the shared pool open for other clients."""
+
+
+class _Pools(Generic[_Transport]):
+    """Thread-safe mapping of transport keys to owned transports."""
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.transports: dict[TransportKey, _Transport] = {}
+
+    def get(self, key: TransportKey, factory: Callable[[], _Transport]) -> _Transport:
+        with self.lock:
+            transport = self.transports.get(key)
+            if transport is None:
+                transport = factory()
+                self.transports[key] = transport
+                log.debug("Created shared HTTPx transport for %s", key[0])
+            return transport
+
+    def drain(self) -> list[_Transport]:
+        with self.lock:
+            transports = list(self.transports.values())
+            self.transports.clear()
+        return transports
+
+
+_sync = _Pools[httpx.HTTPTransport]()
+# Async pools are bound to the event loop that opened their connections.
+_async: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop,
+    _Pools[httpx.AsyncHTTPTransport],
+] = weakref.WeakKeyDictionary()
+_async_lock = threading.Lock()
+
+
+def key(
+    base_url: URL,
+    *,
+    verify: ssl.SSLContext,
+    limits: httpx.Limits,
+    http2: bool = False,
+) -> TransportKey:
+    """Return the registry key for a client.
+
+    Clients share a pool per origin and TLS context. Contexts are cached per
+    client certificate file version (see :mod:`canfar.utils.tls`), so X.509
+    clients get a pool per certificate, and a renewed certificate a new pool,
+    because the client certificate is bound to the TLS connection itself.
+    HTTP/2 pools are kept apart from HTTP/1.1 pools since the protocol is
+    negotiated (ALPN) when a connection is opened.
+
+    Args:
+        base_url: Client base URL; only the origin is used.
+        verify: TLS context the pool's connections are opened with.
+        limits: Connection limits the pool is created with.
+        http2: Whether the pool negotiates HTTP/2.
+
+    Returns:
+        TransportKey: Hashable pool identity.
+    """
+    origin = f"{base_url.scheme}://{base_url.netloc.decode('ascii')}"
+    return (
+        origin,
+        verify,
+        limits.max_connections or 0,
+        limits.max_keepalive_connections or 0,
+        http2,
+    )
+
+
+def shared(pool_key: TransportKey, **kwargs: Any) -> SharedTransport:
+    """Return a non-owning view of the sync pool for ``pool_key``.
+
+    Args:
+        pool_key: Identity from :func:`key`.
+        **kwargs: ``httpx.HTTPTransport`` arguments used if the pool is new.
+
+    Returns:
+        SharedTransport: Transport to pass to ``httpx.Client``.
+    """
+    return SharedTransport(_sync.get(pool_key, lambda: httpx.HTTPTransport(**kwargs)))
+
+
+def ashared(pool_key: TransportKey, **kwargs: Any) -> httpx.AsyncBaseTransport:
+    """Return a view of the async pool for ``pool_key`` on the running loop.
+
+    Outside a running event loop there is no loop to bind connections to, so a
+    private transport owned by the calling client is returned instead.
+
+    Args:
+        pool_key: Identity from :func:`key`.
+        **kwargs: ``httpx.AsyncHTTPTransport`` arguments used if the pool is new.
+
+    Returns:
+        httpx.AsyncBaseTransport: Transport to pass to ``httpx.AsyncClient``.
+    """
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return httpx.AsyncHTTPTransport(**kwargs)
+    with _async_lock:
+        pools = _async.setdefault(loop, _Pools[httpx.AsyncHTTPTransport]())
+    transport = pools.get(pool_key, lambda: httpx.AsyncHTTPTransport(**kwargs))
+    return AsyncSharedTransport(transport)
+
+
+def close() -> None:
+    """Close every shared sync connection pool."""
+    for transport in _sync.drain():
+        transport.close()
+
+
+async def aclose() -> None:
+    """Close every shared async connection pool bound to the running loop."""
+    with _async_lock:
+        pools = _async.pop(asyncio.get_running_loop(), None)
+    if pools is None:
+        return
+    for transport in pools.drain():
+        await transport.aclose()
+
+
+atexit.register(close)
@@ -24,6 +24,8 @@ AUTH_PRIORITY = {
 
 _VSEG_RE = re.compile(r"/(v[0-9]+(?:\.[0-9]+)*)\b")
 
+AVAILABILITY_NS = "http://www.ivoa.net/xml/VOSIAvailability/v1.0"
+
 
 class Capability(TypedDict):
     """Parsed Sessions capability family entry."""
@@ -67,6 +69,39 @@ def _split_base_and_version_from_url(url: str) -> tuple[str, str | None]:
     return base, version
 
 
+def availability_url(url: str) -> str:
+    """Return the VOSI ``availability`` endpoint of a (versioned) service URL.
+
+    Args:
+        url: Service URL such as ``https://host/skaha/v1``.
+
+    Returns:
+        str: Endpoint such as ``https://host/skaha/availability``.
+    """
+    base, _ = _split_base_and_version_from_url(url)
+    return f"{base}/availability"
+
+
+def availability(document: str) -> tuple[bool | None, str | None]:
+    """Parse a VOSI availability document.
+
+    Args:
+        document: XML returned by the ``availability`` endpoint.
+
+    Returns:
+        A tuple of (available, note); ``available`` is None when the document
+        does not say.
+    """
+    root = ElementTree.fromstring(document)
+    available = root.find(f".//{{{AVAILABILITY_NS}}}available")
+    note = root.find(f".//{{{AVAILABILITY_NS}}}note")
+    state = available.text if available is not None else None
+    return (
+        None if state is None else state.strip() == "true",
+        note.text if note is not None else None,
+    )
+
+
 def _major_from_standard_id(std_id: str | None) -> str | None:
     """Infer a major version label (e.g., 'v0', 'v1', 'v2') from a capability ID.
 
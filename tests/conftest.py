@@ -29,3 +29,33 @@ def isolate_canfar_environment(monkeypatch: pytest.MonkeyPatch) -> None:
     for key in list(os.environ):
         if key.startswith("CANFAR_") and key != "CANFAR_TEST_HOME":
             monkeypatch.delenv(key, raising=False)
+
+
+@pytest.fixture(autouse=True)
+def isolate_discovery_cache(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    """Give each test an empty discovery cache."""
+    monkeypatch.setattr(
+        "canfar.utils.httpcache.DIRECTORY", tmp_path / "discovery-cache"
+    )
+
+
+@pytest.fixture(autouse=True)
+def isolate_launch_journal(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    """Give each test an empty launch journal directory."""
+    monkeypatch.setattr("canfar.utils.journal.DIRECTORY", tmp_path / "launches")
+
+
+@pytest.fixture(autouse=True)
+def isolate_circuit_breakers() -> None:
+    """Start each test with every circuit closed."""
+    from canfar.utils import circuit  # noqa: PLC0415
+
+    circuit.reset()
+
+
+@pytest.fixture(autouse=True)
+def isolate_rate_budgets() -> None:
+    """Start each test without shared job array rate limits."""
+    from canfar.utils import ratelimit  # noqa: PLC0415
+
+    ratelimit.reset()
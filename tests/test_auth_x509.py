@@ -4,8 +4,10 @@ from __future__ import annotations
 
 import datetime
 import math
+import os
 import tempfile
 from pathlib import Path
+from typing import TYPE_CHECKING
 from unittest.mock import patch
 
 import pytest
@@ -17,6 +19,9 @@ from cryptography.x509.oid import NameOID
 from canfar.auth import x509 as x509_auth
 from canfar.models.auth import X509Credential
 
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
 
 # Helper function to generate a self-signed certificate for testing
 def generate_cert(
@@ -177,6 +182,58 @@ def test_expiry_handles_missing_not_valid_before_utc(monkeypatch, tmp_path) -> N
     assert isinstance(expiry_ts, float)
 
 
+# --- Tests for canfar.auth.x509.validity --- #
+
+
+@pytest.fixture
+def parses(monkeypatch: pytest.MonkeyPatch) -> Iterator[list[bytes]]:
+    """Record every PEM parse on a cold validity cache."""
+    calls: list[bytes] = []
+    original_loader = x509_auth.x509.load_pem_x509_certificate
+
+    def counting_loader(data: bytes, backend) -> x509.Certificate:  # type: ignore[override]
+        calls.append(data)
+        return original_loader(data, backend)
+
+    x509_auth.clear_cache()
+    monkeypatch.setattr(x509_auth.x509, "load_pem_x509_certificate", counting_loader)
+    yield calls
+    x509_auth.clear_cache()
+
+
+def test_validity_parses_each_file_version_once(tmp_path, parses) -> None:
+    """Unchanged files are served from cache; rewritten files are re-parsed."""
+    cert_path = tmp_path / "cert.pem"
+    generate_cert(cert_path, valid_for_days=1)
+
+    first = x509_auth.validity(cert_path)
+    assert x509_auth.validity(cert_path) is first
+    assert x509_auth.expiry(cert_path) == first.end
+    assert len(parses) == 1
+
+    generate_cert(cert_path, valid_for_days=5)
+    mtime = cert_path.stat().st_mtime_ns + 1_000_000_000
+    os.utime(cert_path, ns=(mtime, mtime))
+
+    second = x509_auth.validity(cert_path)
+    assert len(parses) == 2
+    assert second.end > first.end
+    assert second.path == cert_path.resolve()
+
+
+def test_expired_parses_certificate_once(tmp_path, parses) -> None:
+    """Per-request expiry checks reduce to comparing a stored deadline."""
+    cert_path = tmp_path / "cert.pem"
+    generate_cert(cert_path, valid_for_days=1)
+    credential = X509Credential(idp="cadc", path=cert_path, expiry=0.0)
+
+    for _ in range(5):
+        assert credential.expired is False
+
+    assert len(parses) == 1
+    assert credential.expiry == x509_auth.validity(cert_path).end
+
+
 # --- Tests for canfar.auth.x509.inspect --- #
 
 
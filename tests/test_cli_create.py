@@ -67,7 +67,22 @@ class TestCreateCLI:
                 replicas=2,
             ),
         )
-        assert mock_session.create.await_args.kwargs == {}
+        assert mock_session.create.await_args.kwargs == {"resume": False}
+
+    @patch("canfar.cli.create.AsyncSession")
+    def test_create_command_resume(self, mock_session_cls):
+        """``--resume`` continues the journaled launch of the same request."""
+        mock_session = AsyncMock()
+        mock_session_cls.return_value.__aenter__.return_value = mock_session
+        mock_session.create.return_value = ["id-1", "id-2"]
+
+        result = runner.invoke(
+            create,
+            ["headless", "skaha/worker:v1", "-n", "batch", "-r", "2", "--resume"],
+        )
+
+        assert result.exit_code == 0
+        assert mock_session.create.await_args.kwargs == {"resume": True}
 
     @patch("canfar.cli.create.AsyncSession")
     def test_create_command_single_keeps_human_success_message(
@@ -49,3 +49,27 @@ def test_logs_reports_fetch_error() -> None:
     assert "boom" not in result.stdout
     assert "Could not fetch logs" in result.stderr
     assert "boom" in result.stderr
+
+
+def test_logs_follow_prefixes_lines_from_many_sessions() -> None:
+    """``logs -f`` prints streamed lines, prefixed when following many sessions."""
+
+    async def follow_logs(ids: list[str]):
+        for session_id in ids:
+            yield session_id, f"[{session_id}] ready"
+
+    with patch("canfar.cli.logs.AsyncSession") as session_cls:
+        session = _mock_async_session(session_cls)
+        session.follow_logs = follow_logs
+        result = runner.invoke(logs, ["-f", "abc", "def"])
+
+    assert result.exit_code == 0
+    assert result.stdout.splitlines() == ["abc | [abc] ready", "def | [def] ready"]
+    session.logs.assert_not_called()
+
+    with patch("canfar.cli.logs.AsyncSession") as session_cls:
+        session = _mock_async_session(session_cls)
+        session.follow_logs = follow_logs
+        result = runner.invoke(logs, ["--follow", "abc"])
+
+    assert result.stdout.splitlines() == ["[abc] ready"]
@@ -76,6 +76,33 @@ def test_server_ls_lists_active_idp_servers(tmp_path: Path) -> None:
     list_.assert_called_once_with()
 
 
+def test_server_ls_shows_discovery_latency(tmp_path: Path) -> None:
+    """``server ls`` shows measured latency and unreachable servers."""
+    config_path = tmp_path / "config.yaml"
+    _write_config(config_path)
+    near = Server(
+        idp="cadc",
+        name="Near",
+        uri=AnyUrl(_CADC_URI),
+        url=AnyHttpUrl("https://ws-uv.canfar.net/skaha"),
+        latency=42.4,
+        status="reachable",
+    )
+    down = near.model_copy(update={"name": "Down", "status": "unreachable"})
+
+    with (
+        _patch_config(config_path),
+        patch("canfar.cli.server.auth_show"),
+        patch("canfar.cli.server.server_list", return_value=[near, down]),
+    ):
+        result = runner.invoke(cli, ["server", "ls"], terminal_width=200)
+
+    assert result.exit_code == 0
+    assert "Latency" in result.stdout
+    assert "42 ms" in result.stdout
+    assert "unreachable" in result.stdout
+
+
 def test_server_use_selects_by_uri(tmp_path: Path) -> None:
     """``server use`` accepts a server URI selector."""
     config_path = tmp_path / "config.yaml"
@@ -153,9 +180,12 @@ def test_server_ls_json_output(tmp_path: Path) -> None:
         "ram",
         "gpus",
         "status",
+        "latency",
+        "measured",
     }
     assert server["uri"] == _CADC_URI
     assert server["status"] is None
+    assert server["latency"] is None
 
 
 def test_server_ls_machine_output_includes_server_name(tmp_path: Path) -> None:
@@ -77,7 +77,7 @@ def _async_client_factory(
 ) -> Callable[..., httpx.AsyncClient]:
     """Return the real HTTPX async client bound to a test transport."""
     client_type = httpx.AsyncClient
-    return lambda **kwargs: client_type(transport=transport, **kwargs)
+    return lambda **kwargs: client_type(**{**kwargs, "transport": transport})
 
 
 def _client_factory(
@@ -85,7 +85,7 @@ def _client_factory(
 ) -> Callable[..., httpx.Client]:
     """Return the real HTTPX client bound to a test transport."""
     client_type = httpx.Client
-    return lambda **kwargs: client_type(transport=transport, **kwargs)
+    return lambda **kwargs: client_type(**{**kwargs, "transport": transport})
 
 
 @pytest.mark.parametrize(
@@ -275,8 +275,8 @@ def test_fresh_server_discovery_keeps_progress_out_of_machine_payload(
         _config_path(config_path),
         patch("canfar.utils.discover.httpx", discovery_httpx),
         patch(
-            "canfar.client.Client",
-            side_effect=_client_factory(httpx.MockTransport(capability_response)),
+            "canfar.client.AsyncClient",
+            side_effect=_async_client_factory(httpx.MockTransport(capability_response)),
         ),
     ):
         result = runner.invoke(cli, ["server", "ls", flag])
@@ -543,7 +543,8 @@ class TestHTTPClientCreationAndHeaders:
         assert "timeout" in sync_kwargs
         # httpx.Timeout doesn't have a .timeout attribute, it's the object itself
         assert isinstance(sync_kwargs["timeout"], httpx.Timeout)
-        assert "limits" not in sync_kwargs  # Only for async
+        assert "limits" in sync_kwargs
+        assert sync_kwargs["limits"].max_connections == 16
 
         # Test async client kwargs
         async_kwargs = client._get_client_kwargs(
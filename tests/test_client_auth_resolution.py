@@ -101,13 +101,15 @@ def _enter_clients(
     stack.enter_context(
         patch(
             "canfar.client.Client",
-            side_effect=lambda **kwargs: sync(transport=platform, **kwargs),
+            side_effect=lambda **kwargs: sync(**{**kwargs, "transport": platform}),
         )
     )
     stack.enter_context(
         patch(
             "canfar.client.AsyncClient",
-            side_effect=lambda **kwargs: async_client(transport=platform, **kwargs),
+            side_effect=lambda **kwargs: async_client(
+                **{**kwargs, "transport": platform}
+            ),
         )
     )
     if token is None:
@@ -116,7 +118,7 @@ def _enter_clients(
         patch(
             "authlib.integrations.httpx_client.OAuth2Client",
             side_effect=lambda *args, **kwargs: OAuth2Client(
-                *args, transport=token, **kwargs
+                *args, **{**kwargs, "transport": token}
             ),
         )
     )
@@ -124,7 +126,7 @@ def _enter_clients(
         patch(
             "authlib.integrations.httpx_client.AsyncOAuth2Client",
             side_effect=lambda *args, **kwargs: AsyncOAuth2Client(
-                *args, transport=token, **kwargs
+                *args, **{**kwargs, "transport": token}
             ),
         )
     )
@@ -212,7 +214,7 @@ class TestRequestAuthenticationResolution:
             patch(
                 "canfar.client.Client",
                 side_effect=lambda **kwargs: httpx.Client(
-                    transport=platform_transport, **kwargs
+                    **{**kwargs, "transport": platform_transport}
                 ),
             ),
             patch(
@@ -404,7 +406,7 @@ class TestRequestAuthenticationResolution:
             patch(
                 "canfar.client.AsyncClient",
                 side_effect=lambda **kwargs: httpx.AsyncClient(
-                    transport=platform_transport, **kwargs
+                    **{**kwargs, "transport": platform_transport}
                 ),
             ),
             patch(
@@ -479,13 +481,13 @@ class TestRequestAuthenticationResolution:
             patch(
                 "canfar.client.Client",
                 side_effect=lambda **kwargs: httpx.Client(
-                    transport=platform_transport, **kwargs
+                    **{**kwargs, "transport": platform_transport}
                 ),
             ),
             patch(
                 "canfar.client.AsyncClient",
                 side_effect=lambda **kwargs: httpx.AsyncClient(
-                    transport=platform_transport, **kwargs
+                    **{**kwargs, "transport": platform_transport}
                 ),
             ),
             patch(
@@ -585,7 +587,7 @@ class TestRequestAuthenticationResolution:
             patch(
                 "canfar.client.Client",
                 side_effect=lambda **kwargs: httpx.Client(
-                    transport=platform_transport, **kwargs
+                    **{**kwargs, "transport": platform_transport}
                 ),
             ),
             patch(
@@ -0,0 +1,160 @@
+"""HTTP/2 multiplexing for Session API clients against a local stand-in server."""
+
+from __future__ import annotations
+
+import asyncio
+import ssl
+import time
+from typing import TYPE_CHECKING
+
+import pytest
+from h2.config import H2Configuration
+from h2.connection import H2Connection
+from h2.events import ConnectionTerminated, RequestReceived
+from pydantic import SecretStr
+from typing_extensions import Self
+
+from canfar.client import HTTPClient
+from canfar.sessions import AsyncSession
+from tests.test_utils_tls import _server_certificate
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+_DELAY = 0.005
+_BODY = b"log line\n"
+
+
+class _StandIn:
+    """Skaha stand-in speaking HTTP/1.1 and HTTP/2 (ALPN) over TLS."""
+
+    def __init__(self, pem: Path) -> None:
+        self.pem = pem
+        self.connections: dict[str, int] = {"h2": 0, "http/1.1": 0}
+        self.port = 0
+        self._server: asyncio.Server | None = None
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    async def __aenter__(self) -> Self:
+        context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+        context.load_cert_chain(self.pem)
+        context.set_alpn_protocols(["h2", "http/1.1"])
+        self._server = await asyncio.start_server(
+            self._serve, "localhost", 0, ssl=context
+        )
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self
+
+    async def __aexit__(self, *_: object) -> None:
+        assert self._server is not None
+        self._server.close()
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    async def _serve(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        protocol = writer.get_extra_info("ssl_object").selected_alpn_protocol()
+        protocol = protocol or "http/1.1"
+        self.connections[protocol] += 1
+        serve = self._h2 if protocol == "h2" else self._h1
+        try:
+            await serve(reader, writer)
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def _h1(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        while True:
+            await reader.readuntil(b"\r\n\r\n")
+            await asyncio.sleep(_DELAY)
+            writer.write(
+                b"HTTP/1.1 200 OK\r\nContent-Type: text/plain\r\n"
+                b"Content-Length: %d\r\n\r\n%s" % (len(_BODY), _BODY)
+            )
+            await writer.drain()
+
+    async def _h2(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        connection = H2Connection(H2Configuration(client_side=False))
+        connection.initiate_connection()
+        writer.write(connection.data_to_send())
+
+        async def respond(stream: int) -> None:
+            await asyncio.sleep(_DELAY)
+            connection.send_headers(
+                stream,
+                [
+                    (":status", "200"),
+                    ("content-type", "text/plain"),
+                    ("content-length", str(len(_BODY))),
+                ],
+            )
+            connection.send_data(stream, _BODY, end_stream=True)
+            writer.write(connection.data_to_send())
+
+        while data := await reader.read(65535):
+            for event in connection.receive_data(data):
+                if isinstance(event, RequestReceived):
+                    task = asyncio.create_task(respond(event.stream_id))
+                    self._tasks.add(task)
+                    task.add_done_callback(self._tasks.discard)
+                elif isinstance(event, ConnectionTerminated):
+                    return
+            writer.write(connection.data_to_send())
+            await writer.drain()
+
+
+async def _fan_out(port: int, *, http2: bool, requests: int) -> float:
+    """Fetch ``requests`` logs concurrently; return requests per second."""
+    ids = [f"session-{index}" for index in range(requests)]
+    async with AsyncSession(
+        token=SecretStr("token"),
+        url=f"https://localhost:{port}/skaha/v1/",
+        concurrency=32,
+        http2=http2,
+        share_connections=False,
+    ) as session:
+        start = time.perf_counter()
+        logs = await session.logs(ids)
+        elapsed = time.perf_counter() - start
+    assert logs == dict.fromkeys(ids, _BODY.decode())
+    return requests / elapsed
+
+
+def test_http2_is_enabled_when_h2_is_installed() -> None:
+    """The setting defaults on here, since ``h2`` ships with ``httpx[http2]``."""
+    client = HTTPClient(token=SecretStr("a"), url="https://example.test/skaha/v1/")
+
+    assert client.http2
+    assert client._get_client_kwargs(asynchronous=True, credential=None)["http2"]  # noqa: SLF001
+
+
+@pytest.mark.asyncio
+async def test_benchmark_http2_multiplexes_fan_out_over_one_connection(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """HTTP/2 serves a 32-wide fan-out over one connection instead of 32.
+
+    Over HTTP/1.1 every concurrent request needs its own TCP+TLS connection;
+    with HTTP/2 they are streams on a single one, so the handshakes disappear
+    while throughput stays comparable.
+    """
+    pem = _server_certificate(tmp_path)
+    context = ssl.create_default_context(cafile=str(pem))
+    monkeypatch.setattr("canfar.client.tls.default", lambda: context)
+
+    async with _StandIn(pem) as http1_server:
+        http1_rate = await _fan_out(http1_server.port, http2=False, requests=128)
+    async with _StandIn(pem) as http2_server:
+        http2_rate = await _fan_out(http2_server.port, http2=True, requests=128)
+
+    assert http1_server.connections == {"h2": 0, "http/1.1": 32}
+    assert http2_server.connections == {"h2": 1, "http/1.1": 0}
+    assert http2_rate > http1_rate / 2, (http1_rate, http2_rate)
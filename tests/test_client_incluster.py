@@ -0,0 +1,109 @@
+"""In-cluster client construction inside CANFAR headless replicas."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from canfar.client import HTTPClient
+from canfar.sessions import Session
+from canfar.utils import incluster
+from tests.test_auth_x509 import generate_cert
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+@pytest.fixture
+def replica(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Run as replica 3 of 8 of a headless job."""
+    monkeypatch.setenv("REPLICA_ID", "3")
+    monkeypatch.setenv("REPLICA_COUNT", "8")
+
+
+@pytest.fixture
+def no_configuration():
+    """Fail if the client reads the configuration or inspects a certificate."""
+    with (
+        patch(
+            "canfar.models.config.Configuration.load",
+            side_effect=AssertionError("configuration loaded"),
+        ),
+        patch(
+            "canfar.auth.x509.inspect",
+            side_effect=AssertionError("certificate inspected"),
+        ),
+    ):
+        yield
+
+
+@pytest.mark.usefixtures("replica", "no_configuration")
+def test_replica_builds_token_client_without_configuration(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A replica with ``CANFAR_URL`` and ``CANFAR_TOKEN`` skips the file."""
+    monkeypatch.setenv("CANFAR_URL", "https://example.test/skaha/v1")
+    monkeypatch.setenv("CANFAR_TOKEN", "replica-token")
+
+    session = Session()
+
+    assert session.in_cluster
+    assert str(session.client.base_url) == "https://example.test/skaha/v1/"
+    assert session.client.headers["Authorization"] == "Bearer replica-token"
+
+
+@pytest.mark.usefixtures("no_configuration")
+def test_requested_mode_uses_the_session_proxy_certificate(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Requested without a credential or URL, the mode uses the defaults."""
+    certificate = tmp_path / "cadcproxy.pem"
+    generate_cert(certificate)
+    monkeypatch.setattr("canfar.utils.incluster.CERT_PATH", certificate)
+
+    client = HTTPClient(in_cluster=True)
+
+    assert client.certificate == certificate
+    assert client.client.headers["X-Skaha-Authentication-Type"] == "RUNTIME-X509"
+    assert str(client.client.base_url) == f"{incluster.URL}/"
+
+
+@pytest.mark.usefixtures("replica")
+def test_detected_mode_needs_a_url_and_a_runtime_credential(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Replicas keep their configuration unless both were given explicitly."""
+    certificate = tmp_path / "cadcproxy.pem"
+    generate_cert(certificate)
+    monkeypatch.setattr("canfar.utils.incluster.CERT_PATH", certificate)
+
+    monkeypatch.setenv("CANFAR_URL", "https://example.test/skaha/v1")
+    assert not HTTPClient().in_cluster
+    monkeypatch.delenv("CANFAR_URL")
+    monkeypatch.setenv("CANFAR_TOKEN", "replica-token")
+    with pytest.raises(ValueError, match="Server URL must be provided"):
+        HTTPClient()
+
+    monkeypatch.delenv("CANFAR_TOKEN")
+    monkeypatch.setattr("canfar.utils.incluster.CERT_PATH", tmp_path / "missing.pem")
+    with pytest.raises(ValueError, match="runtime token or certificate"):
+        HTTPClient(in_cluster=True)
+
+
+def test_mode_is_opt_in_outside_replicas(monkeypatch: pytest.MonkeyPatch) -> None:
+    """``CANFAR_IN_CLUSTER`` enables the mode; it is off otherwise."""
+    monkeypatch.delenv("REPLICA_ID", raising=False)
+    assert not HTTPClient(token="t", url="https://example.test/skaha/v1").in_cluster
+
+    monkeypatch.setenv("CANFAR_IN_CLUSTER", "true")
+    monkeypatch.setenv("CANFAR_TOKEN", "cluster-token")
+    with patch(
+        "canfar.client.transport.shared",
+        return_value=httpx.MockTransport(lambda _: httpx.Response(200, json=[])),
+    ):
+        assert Session().fetch() == []
@@ -0,0 +1,141 @@
+"""Tests for memoized Configuration snapshots."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+import pytest
+import yaml
+from typer.testing import CliRunner
+
+from canfar.cli.main import cli
+from canfar.config import cache, migration
+from canfar.models.config import Configuration
+from canfar.utils.console import get_console
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+_CADC_URI = "ivo://cadc.nrc.ca/skaha"
+
+
+@pytest.fixture(autouse=True)
+def config_path(tmp_path: Path) -> Iterator[Path]:
+    """Point configuration at an empty temporary file with a cold cache."""
+    path = tmp_path / "config.yaml"
+    cache.clear()
+    get_console.cache_clear()
+    with patch("canfar.models.config.CONFIG_PATH", path):
+        yield path
+    cache.clear()
+    get_console.cache_clear()
+
+
+def _write_config(path: Path, width: int = 120) -> None:
+    data = {
+        "version": 1,
+        "active": {"authentication": "cadc", "server": "CADC-CANFAR"},
+        "authentication": {
+            "cadc": {"mode": "x509", "path": "/saved/cadc.pem", "expiry": 123.0}
+        },
+        "servers": {
+            "CADC-CANFAR": {
+                "idp": "cadc",
+                "uri": _CADC_URI,
+                "url": "https://ws-uv.canfar.net/skaha",
+                "version": "v1",
+                "auths": ["x509"],
+            }
+        },
+        "console": {"width": width},
+    }
+    path.write_text(yaml.dump(data), encoding="utf-8")
+
+
+def test_snapshot_is_parsed_once_until_the_file_changes(config_path: Path) -> None:
+    """Unchanged sources reuse one parse; saving the file invalidates it."""
+    _write_config(config_path, width=80)
+
+    first = Configuration.snapshot()
+    assert Configuration.snapshot() == first
+    assert cache.info() == cache.CacheInfo(hits=1, misses=1)
+
+    updated = Configuration.load()
+    updated.console.width = 100
+    updated.save()
+
+    assert Configuration.snapshot().console.width == 100
+    assert cache.info().misses == 2
+
+
+def test_snapshot_tracks_canfar_environment(
+    config_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A changed ``CANFAR_*`` variable produces a fresh snapshot."""
+    _write_config(config_path)
+    first = Configuration.snapshot()
+
+    monkeypatch.setenv("CANFAR_CONSOLE__WIDTH", "64")
+
+    second = Configuration.snapshot()
+    assert second is not first
+    assert second.console.width == 64
+
+
+def test_load_returns_a_private_copy(config_path: Path) -> None:
+    """Mutating a loaded configuration never changes the shared snapshot."""
+    _write_config(config_path)
+    loaded = Configuration.load()
+    loaded.console.width = 42
+
+    assert Configuration.snapshot().console.width == 120
+    assert loaded is not Configuration.snapshot()
+
+
+def test_mutating_a_snapshot_does_not_leak(config_path: Path) -> None:
+    """Every snapshot is a private copy of the cached parse."""
+    _write_config(config_path)
+    snapshot = Configuration.snapshot()
+    snapshot.console.width = 42
+    snapshot.authentication["cadc"].expiry = 0.0
+
+    later = Configuration.snapshot()
+    assert later.console.width == 120
+    assert later.authentication["cadc"].expiry == 123.0
+    assert cache.info() == cache.CacheInfo(hits=1, misses=1)
+
+
+def test_invalid_configuration_is_not_cached(config_path: Path) -> None:
+    """Failed parses raise every time rather than serving stale data."""
+    config_path.write_text("version: 9\n", encoding="utf-8")
+
+    for _ in range(2):
+        with pytest.raises(migration.ConfigResetRequiredError):
+            Configuration.snapshot()
+    assert cache.info().misses == 0
+
+
+def test_benchmark_server_ls_parses_configuration_once(config_path: Path) -> None:
+    """``canfar server ls`` parses the YAML configuration once per command.
+
+    Before snapshots the banner, console, ``auth_show`` and ``list_servers`` each
+    built their own ``Configuration``, parsing the file four times.
+    """
+    _write_config(config_path)
+    parses = 0
+    original = migration.ensure_current_config
+
+    def counted(path: Path) -> None:
+        nonlocal parses
+        parses += 1
+        original(path)
+
+    with patch.object(migration, "ensure_current_config", counted):
+        result = CliRunner().invoke(cli, ["server", "ls"])
+
+    assert result.exit_code == 0, result.output
+    assert "CADC-CANFAR" in result.stdout
+    assert parses == 1
@@ -29,6 +29,7 @@ class TestErrorCode:
             "SERVER_REQUIRED": "server.required",
             "SERVER_DISCOVERY_FAILED": "server.discovery_failed",
             "SERVER_NONE_AVAILABLE": "server.none_available",
+            "SERVER_UNAVAILABLE": "server.unavailable",
             "CONFIG_INVALID": "config.invalid",
             "CONFIG_LOGIN_REQUIRED_AFTER_RESET": "config.login_required_after_reset",
             "LOGGING_INVALID_ENV_VALUE": "logging.invalid_env_value",
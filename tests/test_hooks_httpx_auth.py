@@ -1,6 +1,12 @@
 """Tests for the refactored HTTPx authentication hooks."""
 
+import asyncio
+import multiprocessing
+import os
 import time
+from concurrent.futures import ThreadPoolExecutor
+from multiprocessing import Queue
+from pathlib import Path
 from unittest.mock import Mock, patch
 
 import httpx
@@ -8,8 +14,9 @@ import pytest
 from pydantic import SecretStr
 
 from canfar.client import HTTPClient
-from canfar.hooks.httpx.auth import AuthenticationError, arefresh, refresh
+from canfar.hooks.httpx.auth import AuthenticationError, Refresher, arefresh, refresh
 from canfar.models.auth import OIDCCredential
+from canfar.models.config import Configuration
 from tests.helpers.config import oidc_config, x509_config
 from tests.test_auth_x509 import generate_cert
 
@@ -261,3 +268,210 @@ class TestSyncAsyncParity:
 
         await arefresh(client)(request)
         mock_async_refresh.assert_not_called()
+
+
+class TestBackgroundRefresh:
+    """Tests for the opt-in background refreshers."""
+
+    @staticmethod
+    def _client(lifetime: float, fraction: float) -> HTTPClient:
+        config = oidc_config(
+            idp="testoidc",
+            access="current-token",
+            refresh="valid-refresh-token",
+            access_expiry=time.time() + lifetime,
+            refresh_expiry=time.time() + 3600,
+        )
+        return HTTPClient(
+            config=config, background_refresh=True, refresh_fraction=fraction
+        )
+
+    @staticmethod
+    def _renewed() -> dict[str, object]:
+        return {"access_token": "renewed-token", "expires_at": time.time() + 3600}
+
+    def test_renewal_is_due_at_the_configured_fraction(self) -> None:
+        """A token is renewed after ``fraction`` of its remaining lifetime."""
+        refresher = Refresher(self._client(100, 0.8), fraction=0.8)
+
+        assert refresher.due() == pytest.approx(80, abs=1)
+
+    @patch("canfar.models.config.Configuration.save")
+    def test_sync_refresher_renews_before_expiry(self, mock_save) -> None:
+        """The thread swaps in a new token; requests then only read it."""
+        client = self._client(lifetime=10, fraction=0.01)
+        with patch(
+            "canfar.auth.oidc.sync_refresh", return_value=self._renewed()
+        ) as mock_refresh:
+            http = client.client
+            deadline = time.monotonic() + 5
+            while client._refresher.renewals == 0 and time.monotonic() < deadline:  # noqa: SLF001
+                time.sleep(0.01)
+            client._close()  # noqa: SLF001
+
+        mock_refresh.assert_called_once()
+        mock_save.assert_called_once()
+        assert http.headers["Authorization"] == "Bearer renewed-token"
+        request = httpx.Request("GET", "/")
+        with patch("canfar.auth.oidc.sync_refresh") as mock_hook_refresh:
+            refresh(client, client._refresher)(request)  # noqa: SLF001
+        mock_hook_refresh.assert_not_called()
+        assert request.headers["Authorization"] == "Bearer renewed-token"
+
+    @patch("canfar.models.config.Configuration.save")
+    def test_refresh_without_expiry_does_not_loop(self, mock_save) -> None:
+        """A token response without ``expires_at`` is not renewed again at once."""
+        client = self._client(lifetime=10, fraction=0.01)
+        with patch(
+            "canfar.auth.oidc.sync_refresh",
+            return_value={"access_token": "renewed-token"},
+        ) as mock_refresh:
+            _ = client.client
+            deadline = time.monotonic() + 5
+            while client._refresher.renewals == 0 and time.monotonic() < deadline:  # noqa: SLF001
+                time.sleep(0.01)
+            time.sleep(0.2)
+            due = client._refresher.due()  # noqa: SLF001
+            client._close()  # noqa: SLF001
+
+        mock_refresh.assert_called_once()
+        mock_save.assert_called_once()
+        assert due is not None
+        assert due > 0
+
+    @patch("canfar.models.config.Configuration.save")
+    async def test_async_refresher_starts_with_first_request(self, mock_save) -> None:
+        """The task starts on the first request and renews in the background."""
+        client = self._client(lifetime=10, fraction=0.01)
+        with (
+            patch(
+                "canfar.client.transport.ashared",
+                return_value=httpx.MockTransport(lambda _: httpx.Response(200)),
+            ),
+            patch(
+                "canfar.auth.oidc.refresh", return_value=self._renewed()
+            ) as mock_refresh,
+        ):
+            sent = await client.asynclient.get("session")
+            assert sent.request.headers["Authorization"] == "Bearer current-token"
+            deadline = time.monotonic() + 5
+            while client._arefresher.renewals == 0 and time.monotonic() < deadline:  # noqa: ASYNC110, SLF001
+                await asyncio.sleep(0.01)
+            sent = await client.asynclient.get("session")
+            await client._aclose()  # noqa: SLF001
+
+        mock_refresh.assert_called_once()
+        mock_save.assert_called_once()
+        assert sent.request.headers["Authorization"] == "Bearer renewed-token"
+
+
+def _refresh_in_process(config_path: Path, calls: Path, results: Queue) -> None:
+    """Run the sync hook in a child process against a shared config file."""
+
+    def token_endpoint(**_: object) -> dict[str, object]:
+        with calls.open("a") as handle:
+            handle.write(f"{os.getpid()}\n")
+        time.sleep(0.2)
+        return {
+            "access_token": f"token-{os.getpid()}",
+            "refresh_token": f"rotated-{os.getpid()}",
+            "expires_at": time.time() + 3600,
+        }
+
+    with (
+        patch("canfar.models.config.CONFIG_PATH", config_path),
+        patch("canfar.auth.oidc.sync_refresh", side_effect=token_endpoint),
+    ):
+        client = HTTPClient(config=Configuration.load())
+        client._client = Mock(spec=httpx.Client, headers={})  # noqa: SLF001
+        request = httpx.Request("GET", "/")
+        refresh(client)(request)
+    results.put(request.headers["Authorization"])
+
+
+class TestSingleFlightRefresh:
+    """Processes sharing one configuration refresh an expired token once."""
+
+    def test_parallel_processes_refresh_once(self, tmp_path: Path) -> None:
+        """Waiting processes adopt the saved token instead of refreshing."""
+        config_path = tmp_path / "config.yaml"
+        calls = tmp_path / "calls"
+        with patch("canfar.models.config.CONFIG_PATH", config_path):
+            oidc_config(
+                idp="testoidc",
+                access="expired-token",
+                refresh="valid-refresh-token",
+                access_expiry=time.time() - 60,
+                refresh_expiry=time.time() + 3600,
+            ).save()
+
+        context = multiprocessing.get_context("fork")
+        results = context.Queue()
+        processes = [
+            context.Process(
+                target=_refresh_in_process, args=(config_path, calls, results)
+            )
+            for _ in range(4)
+        ]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join(timeout=30)
+            assert process.exitcode == 0
+
+        (caller,) = calls.read_text().split()
+        headers = {results.get(timeout=5) for _ in processes}
+        assert headers == {f"Bearer token-{caller}"}
+        with patch("canfar.models.config.CONFIG_PATH", config_path):
+            saved = Configuration.load().get_credential("testoidc")
+        assert isinstance(saved, OIDCCredential)
+        assert saved.token.refresh is not None
+        assert saved.token.refresh.get_secret_value() == f"rotated-{caller}"
+
+
+class TestThreadSafety:
+    """One sync client shared by worker threads."""
+
+    @patch("canfar.models.config.Configuration.save")
+    def test_threads_share_one_client_and_one_refresh(self, mock_save) -> None:
+        """Concurrent requests with an expired token refresh it exactly once."""
+        config = oidc_config(
+            idp="testoidc",
+            access="expired-token",
+            refresh="valid-refresh-token",
+            access_expiry=time.time() - 60,
+            refresh_expiry=time.time() + 3600,
+        )
+        sent: list[str] = []
+
+        def token_endpoint(**_: object) -> dict[str, object]:
+            time.sleep(0.1)
+            return {"access_token": "fresh-token", "expires_at": time.time() + 3600}
+
+        def respond(request: httpx.Request) -> httpx.Response:
+            sent.append(request.headers["Authorization"])
+            return httpx.Response(200)
+
+        client = HTTPClient(config=config)
+        with (
+            patch(
+                "canfar.client.transport.shared",
+                return_value=httpx.MockTransport(respond),
+            ),
+            patch(
+                "canfar.auth.oidc.sync_refresh", side_effect=token_endpoint
+            ) as mock_refresh,
+            patch.object(
+                HTTPClient,
+                "_create_sync_client",
+                wraps=client._create_sync_client,  # noqa: SLF001
+            ) as build,
+            ThreadPoolExecutor(max_workers=16) as pool,
+        ):
+            list(pool.map(lambda _: client.client.get("session"), range(64)))
+
+        build.assert_called_once()
+        mock_refresh.assert_called_once()
+        mock_save.assert_called_once()
+        assert sent == ["Bearer fresh-token"] * 64
+        assert client.client.headers["Authorization"] == "Bearer fresh-token"
@@ -33,13 +33,14 @@ async def test_http_debug_hooks_log_url_and_response(
     with (
         patch(
             "canfar.client.Client",
-            side_effect=lambda **kwargs: real_client(transport=transport, **kwargs),
+            side_effect=lambda **kwargs: real_client(
+                **{**kwargs, "transport": transport}
+            ),
         ),
         patch(
             "canfar.client.AsyncClient",
             side_effect=lambda **kwargs: real_async_client(
-                transport=transport,
-                **kwargs,
+                **{**kwargs, "transport": transport},
             ),
         ),
         caplog.at_level(logging.DEBUG, logger="canfar.hooks.httpx.debug"),
@@ -15,14 +15,14 @@ class TestCatch:
         """Test catch with successful response."""
         # Create mock response that doesn't raise an error
         mock_response = Mock(spec=httpx.Response)
-        mock_response.read.return_value = b"success"
+        mock_response.is_error = False
         mock_response.raise_for_status.return_value = None
 
         # Should not raise any exception
         catch(mock_response)
 
-        # Verify response.read() was called
-        mock_response.read.assert_called_once()
+        # Successful bodies are left for the caller (or a stream) to read
+        mock_response.read.assert_not_called()
         mock_response.raise_for_status.assert_called_once()
 
     def test_catch_http_error_response(self) -> None:
@@ -90,6 +90,25 @@ class TestCatch:
         mock_response.read.assert_called_once()
         mock_response.raise_for_status.assert_called_once()
 
+    def test_catch_leaves_streamed_success_bodies_unread(self) -> None:
+        """Streamed successful responses are not buffered by the hook."""
+
+        def chunks():
+            yield b"first\n"
+            yield b"second\n"
+
+        transport = httpx.MockTransport(
+            lambda request: httpx.Response(200, content=chunks(), request=request)
+        )
+        with (
+            httpx.Client(
+                transport=transport, event_hooks={"response": [catch]}
+            ) as client,
+            client.stream("GET", "https://example.test/logs") as response,
+        ):
+            assert not response.is_stream_consumed
+            assert list(response.iter_lines()) == ["first", "second"]
+
     def test_catch_read_raises_warning_logged(self) -> None:
         """ReadTimeout from response.read() during body download is warning-logged.
 
@@ -118,14 +137,15 @@ class TestACatch:
         """Test acatch with successful response."""
         # Create mock response that doesn't raise an error
         mock_response = Mock(spec=httpx.Response)
+        mock_response.is_error = False
         mock_response.aread = AsyncMock(return_value=b"success")
         mock_response.raise_for_status.return_value = None
 
         # Should not raise any exception
         await acatch(mock_response)
 
-        # Verify response.aread() was called
-        mock_response.aread.assert_called_once()
+        # Successful bodies are left for the caller (or a stream) to read
+        mock_response.aread.assert_not_called()
         mock_response.raise_for_status.assert_called_once()
 
     @pytest.mark.asyncio
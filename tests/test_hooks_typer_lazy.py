@@ -0,0 +1,109 @@
+"""Tests for lazily imported Typer subcommands."""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+
+import typer
+from click.testing import CliRunner
+
+from canfar.cli.main import CanfarGroup
+from canfar.hooks.typer.lazy import LazyAliasGroup, LazyCommand
+
+runner = CliRunner()
+
+_SUBCOMMAND_MODULES = {
+    spec.target.partition(":")[0] for spec in CanfarGroup.lazy_commands
+}
+
+_HEAVY_PACKAGES = {"httpx", "cryptography", "pydantic_settings", "cadcutils"}
+"""Dependencies of the clients and configuration that ``--help`` must not load."""
+
+
+class _Root(LazyAliasGroup):
+    lazy_commands = (
+        LazyCommand(
+            "version | about",
+            "canfar.cli.version:version",
+            help="View client info",
+            rich_help_panel="Client Info",
+        ),
+        LazyCommand("secret", "canfar.cli.version:version", hidden=True),
+    )
+
+
+def _app() -> typer.Typer:
+    app = typer.Typer(cls=_Root, invoke_without_command=True)
+
+    @app.callback()
+    def root() -> None:
+        """Lazy root."""
+
+    @app.command("eager")
+    def eager() -> None:
+        typer.echo("eager ran")
+
+    return app
+
+
+def test_help_lists_lazy_commands_without_loading_them() -> None:
+    """Help is rendered from metadata; hidden specs stay hidden."""
+    group = typer.main.get_command(_app())
+    assert isinstance(group, _Root)
+
+    result = runner.invoke(group, ["--help"])
+
+    assert result.exit_code == 0, result.output
+    assert "version | about" in result.stdout
+    assert "View client info" in result.stdout
+    assert "secret" not in result.stdout
+    assert list(group.commands) == ["version | about", "secret", "eager"]
+    assert not isinstance(group.commands["version | about"], typer.core.TyperGroup)
+
+
+def test_alias_invocation_loads_the_real_command() -> None:
+    """Resolving any alias swaps the placeholder for the built Typer group."""
+    group = typer.main.get_command(_app())
+
+    result = runner.invoke(group, ["about", "--help"])
+
+    assert result.exit_code == 0, result.output
+    assert "View client info" in result.stdout
+    assert isinstance(group.commands["version | about"], typer.core.TyperGroup)
+    assert runner.invoke(group, ["eager"]).stdout == "eager ran\n"
+
+
+def test_benchmark_cli_help_imports_no_subcommand_modules() -> None:
+    """``canfar --help`` and ``canfar version`` import only what they run.
+
+    Before lazy loading, importing the CLI pulled in every subcommand module and
+    their dependencies, whichever command was requested. Help must not load the
+    HTTP client or the configuration models either.
+    """
+    script = """
+import sys
+from canfar.cli.main import cli
+
+for args in (["--help"], ["version"]):
+    try:
+        cli(args, prog_name="canfar")
+    except SystemExit:
+        pass
+    print("modules:", *sorted(sys.modules))
+"""
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", script],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+
+    after_help, after_version = (
+        set(line.split()[1:])
+        for line in result.stdout.splitlines()
+        if line.startswith("modules:")
+    )
+    assert not after_help & _SUBCOMMAND_MODULES
+    assert not after_help & _HEAVY_PACKAGES
+    assert after_version & _SUBCOMMAND_MODULES == {"canfar.cli.version"}
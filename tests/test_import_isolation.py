@@ -165,3 +165,29 @@ import canfar.models.config  # noqa: F401
         check=False,
     )
     assert result.returncode == 0, result.stderr
+
+
+def test_lightweight_helpers_do_not_import_the_client_stack() -> None:
+    """``import canfar`` defers the client, auth and logging stacks to first use."""
+    script = """
+import sys
+
+from canfar.helpers import distributed  # noqa: F401
+
+heavy = ("canfar.authentication", "canfar.server", "canfar.client", "httpx",
+         "cryptography", "pydantic", "rich")
+print(*sorted(name for name in heavy if name in sys.modules))
+
+import canfar
+
+assert canfar.login is canfar.authentication.login
+assert canfar.server.__name__ == "canfar.server"
+"""
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", script],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    assert result.returncode == 0, result.stderr
+    assert result.stdout == "\n"
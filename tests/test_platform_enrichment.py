@@ -41,12 +41,26 @@ _CONTEXT_PAYLOAD = {
 }
 
 
+_ASYNC_CLIENT = httpx.AsyncClient
+
+
 def _http_client_factory(
     transport: httpx.BaseTransport,
 ) -> Callable[..., httpx.Client]:
     """Return an HTTPX client factory bound to a test transport."""
     client_type = httpx.Client
-    return lambda **kwargs: client_type(transport=transport, **kwargs)
+    return lambda **kwargs: client_type(**{**kwargs, "transport": transport})
+
+
+def _async_client_factory(
+    transport: httpx.AsyncBaseTransport,
+) -> Callable[..., httpx.AsyncClient]:
+    """Return an async HTTPX client factory bound to a test transport.
+
+    Registry mocks patch ``httpx.AsyncClient`` itself, so the real class is
+    captured at import.
+    """
+    return lambda **kwargs: _ASYNC_CLIENT(**{**kwargs, "transport": transport})
 
 
 def _server(**updates: object) -> Server:
@@ -491,7 +505,7 @@ class TestPlatformEnrichment:
             patch(
                 "canfar.client.Client",
                 side_effect=lambda **kwargs: httpx.Client(
-                    transport=httpx.MockTransport(platform_response), **kwargs
+                    **{**kwargs, "transport": httpx.MockTransport(platform_response)}
                 ),
             ),
             patch(
@@ -563,13 +577,15 @@ class TestPlatformEnrichment:
             patch(
                 "canfar.client.Client",
                 side_effect=lambda **kwargs: httpx.Client(
-                    transport=httpx.MockTransport(
-                        lambda request: (
-                            platform_requests.append(request)
-                            or httpx.Response(200, request=request)
-                        )
-                    ),
-                    **kwargs,
+                    **{
+                        **kwargs,
+                        "transport": httpx.MockTransport(
+                            lambda request: (
+                                platform_requests.append(request)
+                                or httpx.Response(200, request=request)
+                            )
+                        ),
+                    }
                 ),
             ),
             patch(
@@ -628,8 +644,8 @@ class TestPlatformEnrichment:
             patch("canfar.models.config.CONFIG_PATH", config_path),
             patch("canfar.utils.discover.httpx.AsyncClient", _RegistryAsyncClient),
             patch(
-                "canfar.client.Client",
-                side_effect=_http_client_factory(httpx.MockTransport(unavailable)),
+                "canfar.client.AsyncClient",
+                side_effect=_async_client_factory(httpx.MockTransport(unavailable)),
             ),
         ):
             config = _anonymous_config()
@@ -690,3 +706,47 @@ class TestPlatformEnrichment:
             )
             with pytest.raises(raises, match=match):
                 platform.enrich(server, config=_anonymous_config(), strict=strict)
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("body", "strict", "version"),
+        [
+            (_capabilities(_CADC_URL, version="v1"), True, "v1"),
+            ("<capabilities>", False, None),
+            ("<capabilities>", True, None),
+        ],
+        ids=["complete", "malformed-keep", "malformed-strict"],
+    )
+    async def test_aenrich_matches_enrich_outcomes(
+        self,
+        tmp_path: Path,
+        body: str,
+        strict: bool,
+        version: str | None,
+    ) -> None:
+        """The async path enriches, keeps, or raises exactly like ``enrich``."""
+        server = _server(version=None, auths=None)
+        transport = httpx.MockTransport(
+            lambda request: httpx.Response(200, text=body, request=request)
+        )
+
+        with (
+            patch("canfar.models.config.CONFIG_PATH", tmp_path / "config.yaml"),
+            patch(
+                "canfar.client.AsyncClient",
+                side_effect=_async_client_factory(transport),
+            ),
+        ):
+            if strict and version is None:
+                with pytest.raises(
+                    platform.ServerFetchError, match="Failed to fetch capabilities"
+                ):
+                    await platform.aenrich(
+                        server, config=_anonymous_config(), strict=strict
+                    )
+                return
+            enriched = await platform.aenrich(
+                server, config=_anonymous_config(), strict=strict
+            )
+
+        assert enriched.version == version
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import asyncio
+import time
 from pathlib import Path
 from typing import TYPE_CHECKING
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -16,8 +18,13 @@ from canfar.models.active import ActiveConfig
 from canfar.models.auth import OIDCCredential, X509Credential
 from canfar.models.config import Configuration
 from canfar.models.http import Server
+from canfar.models.registry import IVOARegistrySearch
 from canfar.models.registry import Server as DiscoveredServer
 from canfar.server import (
+    ENRICH_CONCURRENCY,
+    FASTEST,
+    LATENCY_TTL,
+    UNREACHABLE,
     ServerDiscoveryError,
     ServerFetchError,
     ServerSelectionRequiredError,
@@ -25,11 +32,13 @@ from canfar.server import (
     _discovered_to_server,
     activate,
     discover,
+    rank,
     use,
 )
 from canfar.server import (
     list_servers as server_list,
 )
+from canfar.utils.discover import RANK_SAMPLES, RTT_SAMPLES, Discover
 from tests.helpers.config import assign_servers
 
 if TYPE_CHECKING:
@@ -39,12 +48,26 @@ _CADC_URI = "ivo://cadc.nrc.ca/skaha"
 _CADC_URL = "https://ws-uv.canfar.net/skaha"
 
 
+_ASYNC_CLIENT = httpx.AsyncClient
+
+
 def _http_client_factory(
     transport: httpx.BaseTransport,
 ) -> Callable[..., httpx.Client]:
     """Return an HTTPX client factory bound to a test transport."""
     client_type = httpx.Client
-    return lambda **kwargs: client_type(transport=transport, **kwargs)
+    return lambda **kwargs: client_type(**{**kwargs, "transport": transport})
+
+
+def _async_client_factory(
+    transport: httpx.AsyncBaseTransport,
+) -> Callable[..., httpx.AsyncClient]:
+    """Return an async HTTPX client factory bound to a test transport.
+
+    Registry mocks patch ``httpx.AsyncClient`` itself, so the real class is
+    captured at import.
+    """
+    return lambda **kwargs: _ASYNC_CLIENT(**{**kwargs, "transport": transport})
 
 
 def _cadc_server(**updates: object) -> Server:
@@ -122,6 +145,17 @@ class TestServerList:
 
         assert servers == []
 
+    def test_list_ranks_servers_by_latency(self) -> None:
+        """Nearest servers first, then unmeasured, then unreachable ones."""
+        far = _cadc_server(name="Far", latency=180.0, status="reachable")
+        near = _cadc_server(name="Near", latency=12.5, status="reachable")
+        unknown = _cadc_server(name="Unknown")
+        down = _cadc_server(name="Down", status=UNREACHABLE)
+
+        ranked = rank([down, unknown, far, near])
+
+        assert [server.name for server in ranked] == ["Near", "Far", "Unknown", "Down"]
+
 
 class TestServerUse:
     """Tests for canfar.server.use()."""
@@ -435,8 +469,8 @@ class TestServerDiscovery:
                     ),
                 ),
                 patch(
-                    "canfar.client.Client",
-                    side_effect=_http_client_factory(capabilities_transport),
+                    "canfar.client.AsyncClient",
+                    side_effect=_async_client_factory(capabilities_transport),
                 ),
             ):
                 discovered = discover("cadc", config=config)
@@ -445,7 +479,12 @@ class TestServerDiscovery:
 
         expected = (
             known.model_copy(
-                update={"version": "v2.1", "auths": ["oidc"]},
+                update={
+                    "version": "v2.1",
+                    "auths": ["oidc"],
+                    "latency": discovered[0].latency,
+                    "measured": discovered[0].measured,
+                },
                 deep=True,
             )
             if capabilities_case == "success"
@@ -484,6 +523,140 @@ class TestServerDiscovery:
             "Second",
         ]
 
+    def test_activate_fastest_selects_lowest_latency(self, tmp_path: Path) -> None:
+        """The ``fastest`` selector activates the nearest reachable server."""
+        now = time.time()
+        slow = _cadc_server(name="Slow", latency=90.0, measured=now, status="reachable")
+        fast = _cadc_server(
+            name="Fast",
+            uri=AnyUrl("ivo://fast.example/skaha"),
+            url=AnyHttpUrl("https://fast.example/skaha"),
+            latency=15.0,
+            measured=now,
+            status="reachable",
+        )
+        down = _cadc_server(
+            name="Down",
+            uri=AnyUrl("ivo://down.example/skaha"),
+            status=UNREACHABLE,
+        )
+        config_path = tmp_path / "config.yaml"
+        with patch("canfar.models.config.CONFIG_PATH", config_path):
+            config = _anonymous_config(slow, fast, down)
+
+            with patch(
+                "canfar.server._validate_server",
+                side_effect=lambda server, **_kwargs: server,
+            ):
+                activation = activate("cadc", FASTEST, config=config)
+
+        assert activation.reason == "fastest"
+        assert activation.server.name == "Fast"
+        assert config.active.server == "Fast"
+
+    def test_activate_fastest_remeasures_stale_latencies(self, tmp_path: Path) -> None:
+        """Measurements older than ``LATENCY_TTL`` are refreshed by discovery."""
+        stale = _cadc_server(
+            name="Stale",
+            latency=5.0,
+            measured=time.time() - LATENCY_TTL - 1,
+            status="reachable",
+        )
+        remeasured = stale.model_copy(
+            update={"latency": 50.0, "measured": time.time()}, deep=True
+        )
+        config_path = tmp_path / "config.yaml"
+        with patch("canfar.models.config.CONFIG_PATH", config_path):
+            config = _anonymous_config(stale)
+
+            with (
+                patch(
+                    "canfar.server._discover_for_idp", return_value=[remeasured]
+                ) as discovery,
+                patch(
+                    "canfar.server._validate_server",
+                    side_effect=lambda server, **_kwargs: server,
+                ),
+            ):
+                activate("cadc", FASTEST, config=config)
+
+        discovery.assert_called_once()
+        assert discovery.call_args.kwargs["samples"] == RANK_SAMPLES
+        assert config.servers["Stale"].latency == 50.0
+
+    def test_rediscovery_marks_only_probed_failures_unreachable(
+        self, tmp_path: Path
+    ) -> None:
+        """Failed probes become unreachable; servers not probed keep their records."""
+        kept = _cadc_server(name="Kept", status="reachable", latency=40.0)
+        down = _cadc_server(
+            name="Down",
+            uri=AnyUrl("ivo://down.example/skaha"),
+            status="reachable",
+            latency=20.0,
+        )
+        dev = _cadc_server(
+            name="Dev",
+            uri=AnyUrl("ivo://dev.example/skaha"),
+            status="reachable",
+            latency=10.0,
+        )
+        remeasured = kept.model_copy(update={"latency": 33.3}, deep=True)
+        failed = Server(
+            idp="cadc",
+            name="Down",
+            uri=down.uri,
+            url=down.url,
+            status=UNREACHABLE,
+        )
+        config_path = tmp_path / "config.yaml"
+        with patch("canfar.models.config.CONFIG_PATH", config_path):
+            config = _anonymous_config(kept, down, dev)
+
+            with patch(
+                "canfar.server._discover_for_idp", return_value=[remeasured, failed]
+            ):
+                discovered = discover("cadc", config=config, save=False)
+
+        assert discovered == [remeasured]
+        assert config.servers["Kept"].latency == 33.3
+        assert config.servers["Down"].status == UNREACHABLE
+        assert config.servers["Down"].latency is None
+        assert config.servers["Dev"] == dev
+
+    @pytest.mark.asyncio
+    async def test_check_records_median_round_trip_time(self) -> None:
+        """One HEAD by default, several to rank; failures leave no measurement."""
+        heads: list[str] = []
+
+        def respond(request: httpx.Request) -> httpx.Response:
+            heads.append(request.method)
+            if request.url.host == "down.example":
+                message = "unreachable"
+                raise httpx.ConnectError(message, request=request)
+            return httpx.Response(200, request=request)
+
+        up = DiscoveredServer(registry="CADC", uri=_CADC_URI, url=_CADC_URL)
+        down = DiscoveredServer(
+            registry="CADC", uri="ivo://down.example/skaha", url="https://down.example"
+        )
+        with patch(
+            "canfar.utils.discover.httpx.AsyncClient",
+            side_effect=_async_client_factory(httpx.MockTransport(respond)),
+        ):
+            async with Discover(IVOARegistrySearch()) as discovery:
+                checked_up = await discovery.check(up)
+                assert heads == ["HEAD"] * RTT_SAMPLES
+                checked_up = await discovery.check(up, RANK_SAMPLES)
+                checked_down = await discovery.check(down, RANK_SAMPLES)
+
+        assert heads == ["HEAD"] * (RTT_SAMPLES + RANK_SAMPLES + 1)
+        assert checked_up.status == 200
+        assert checked_up.rtt is not None
+        assert checked_up.rtt >= 0
+        assert checked_down.status is None
+        assert checked_down.rtt is None
+
     def test_discover_keys_named_server_by_registry_name(self, tmp_path: Path) -> None:
         """Discovery persists a registry-named server under that name key."""
         discovered = _cadc_server(
@@ -579,7 +752,7 @@ class TestServerDiscovery:
         mock_discovery = AsyncMock()
         mock_discovery.fetch.return_value = MagicMock(success=True, content="line")
         mock_discovery.extract = MagicMock(return_value=[endpoint])
-        mock_discovery.check = AsyncMock(side_effect=lambda item: item)
+        mock_discovery.check = AsyncMock(side_effect=lambda item, _samples: item)
         mock_discovery.__aenter__ = AsyncMock(return_value=mock_discovery)
         mock_discovery.__aexit__ = AsyncMock(return_value=None)
         config_path = tmp_path / "config.yaml"
@@ -588,7 +761,7 @@ class TestServerDiscovery:
             patch("canfar.models.config.CONFIG_PATH", config_path),
             patch("canfar.server.Discover", return_value=mock_discovery),
             patch(
-                "canfar.server.enrich",
+                "canfar.server.aenrich",
                 side_effect=lambda item, **_kwargs: item.model_copy(
                     update={"version": "v1", "auths": ["oidc"]},
                     deep=True,
@@ -607,7 +780,7 @@ class TestServerDiscovery:
 
     @pytest.mark.asyncio
     async def test_discover_for_idp_converts_active_endpoints(self) -> None:
-        """Discovery converts reachable registry endpoints into HTTP server models."""
+        """Reachable endpoints are converted; failed probes are reported bare."""
         endpoint = DiscoveredServer(
             registry="CADC",
             uri=_CADC_URI,
@@ -615,18 +788,24 @@ class TestServerDiscovery:
             status=200,
             name="CADC-CANFAR",
         )
+        down = DiscoveredServer(
+            registry="CADC",
+            uri="ivo://down.example/skaha",
+            url="https://down.example/skaha",
+            name="Down",
+        )
 
         mock_discovery = AsyncMock()
         mock_discovery.fetch.return_value = MagicMock(success=True, content="line")
-        mock_discovery.extract = MagicMock(return_value=[endpoint])
-        mock_discovery.check = AsyncMock(side_effect=lambda item: item)
+        mock_discovery.extract = MagicMock(return_value=[endpoint, down])
+        mock_discovery.check = AsyncMock(side_effect=lambda item, _samples: item)
         mock_discovery.__aenter__ = AsyncMock(return_value=mock_discovery)
         mock_discovery.__aexit__ = AsyncMock(return_value=None)
 
         with (
             patch("canfar.server.Discover", return_value=mock_discovery),
             patch(
-                "canfar.server.enrich",
+                "canfar.server.aenrich",
                 side_effect=lambda item, **_kwargs: item.model_copy(
                     update={"version": "v1", "auths": ["x509"]},
                     deep=True,
@@ -635,11 +814,14 @@ class TestServerDiscovery:
         ):
             servers = await _discover_for_idp("cadc")
 
-        assert len(servers) == 1
+        assert len(servers) == 2
         assert servers[0].idp == "cadc"
         assert str(servers[0].uri) == _CADC_URI
+        assert servers[0].status != UNREACHABLE
+        assert (servers[1].name, servers[1].status) == ("Down", UNREACHABLE)
 
-    def test_discovered_to_server_keeps_registry_metadata_when_capabilities_fail(
+    @pytest.mark.asyncio
+    async def test_discovered_to_server_keeps_registry_metadata_when_capabilities_fail(
         self,
     ) -> None:
         """Malformed capabilities must not abort discovery for other servers."""
@@ -659,10 +841,10 @@ class TestServerDiscovery:
         )
 
         with patch(
-            "canfar.client.Client",
-            side_effect=_http_client_factory(transport),
+            "canfar.client.AsyncClient",
+            side_effect=_async_client_factory(transport),
         ):
-            server = _discovered_to_server(
+            server = await _discovered_to_server(
                 endpoint,
                 "srcnet",
                 config=_anonymous_config(idp="srcnet"),
@@ -673,7 +855,10 @@ class TestServerDiscovery:
         assert str(server.url) == "https://broken.example.org/skaha"
         assert server.version is None
 
-    def test_discovered_to_server_names_unnamed_endpoint_by_host_slug(self) -> None:
+    @pytest.mark.asyncio
+    async def test_discovered_to_server_names_unnamed_endpoint_by_host_slug(
+        self,
+    ) -> None:
         """Endpoints without a registry name are named by their URI host slug."""
         endpoint = DiscoveredServer(
             registry="SRCNet",
@@ -690,10 +875,10 @@ class TestServerDiscovery:
         )
 
         with patch(
-            "canfar.client.Client",
-            side_effect=_http_client_factory(transport),
+            "canfar.client.AsyncClient",
+            side_effect=_async_client_factory(transport),
         ):
-            server = _discovered_to_server(
+            server = await _discovered_to_server(
                 endpoint,
                 "srcnet",
                 config=_anonymous_config(idp="srcnet"),
@@ -701,6 +886,44 @@ class TestServerDiscovery:
 
         assert server.name == "swesrc-chalmers-se"
 
+    @pytest.mark.asyncio
+    async def test_discover_for_idp_enriches_concurrently_within_bound(self) -> None:
+        """Capability requests overlap but never exceed ``ENRICH_CONCURRENCY``."""
+        endpoints = [
+            DiscoveredServer(
+                registry="SRCNet",
+                uri=f"ivo://site{index}.example/skaha",
+                url=f"https://site{index}.example/skaha",
+                status=200,
+                name=f"site-{index}",
+            )
+            for index in range(ENRICH_CONCURRENCY * 2)
+        ]
+        mock_discovery = AsyncMock()
+        mock_discovery.fetch.return_value = MagicMock(success=True, content="line")
+        mock_discovery.extract = MagicMock(return_value=endpoints)
+        mock_discovery.check = AsyncMock(side_effect=lambda item, _samples: item)
+        mock_discovery.__aenter__ = AsyncMock(return_value=mock_discovery)
+        mock_discovery.__aexit__ = AsyncMock(return_value=None)
+        in_flight = peak = 0
+
+        async def enrich(item: Server, **_kwargs: object) -> Server:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return item
+
+        with (
+            patch("canfar.server.Discover", return_value=mock_discovery),
+            patch("canfar.server.aenrich", side_effect=enrich),
+        ):
+            servers = await _discover_for_idp("srcnet")
+
+        assert [server.name for server in servers] == [e.name for e in endpoints]
+        assert peak == ENRICH_CONCURRENCY
+
     @pytest.mark.asyncio
     async def test_discover_for_idp_raises_when_registry_fetch_fails(self) -> None:
         """Registry fetch failures surface as ServerDiscoveryError."""
@@ -1,5 +1,6 @@
 """Test Canfar Session API."""
 
+import threading
 from time import sleep, time
 from typing import Any
 from unittest.mock import MagicMock, patch
@@ -76,13 +77,48 @@ def test_sync_session_methods_handle_success_and_failures() -> None:
     assert session.logs("s1") == {"s1": "hello"}
     assert session.logs("s1", verbose=True) is None
 
-    client.delete.side_effect = [
-        None,
-        _http_error("DELETE", "https://example.test/skaha/v1/session/s2"),
-    ]
+    failure = _http_error("DELETE", "https://example.test/skaha/v1/session/s2")
+
+    def delete(url: str) -> None:
+        if url.endswith("s2"):
+            raise failure
+
+    client.delete.side_effect = delete
     assert session.destroy(["s1", "s2"]) == {"s1": True, "s2": False}
 
 
+def test_sync_session_bulk_methods_run_concurrently() -> None:
+    """Sync bulk methods keep requests in flight up to ``concurrency``."""
+    barrier = threading.Barrier(2, timeout=5)
+
+    def respond(request: httpx.Request) -> httpx.Response:
+        barrier.wait()
+        session_id = request.url.path.rsplit("/", 1)[-1]
+        return httpx.Response(200, json={"id": session_id}, request=request)
+
+    transport = httpx.MockTransport(respond)
+    real_client = httpx.Client
+    with (
+        patch(
+            "canfar.client.Client",
+            side_effect=lambda **kwargs: real_client(
+                **{**kwargs, "transport": transport}
+            ),
+        ),
+        Session(
+            token=SecretStr("token"),
+            url="https://example.test/skaha/v1/",
+            concurrency=2,
+        ) as session,
+    ):
+        assert session.info(["s1", "s2", "s3", "s4"]) == [
+            {"id": "s1"},
+            {"id": "s2"},
+            {"id": "s3"},
+            {"id": "s4"},
+        ]
+
+
 def test_fetch_malformed_kind(session: Session) -> None:
     """Test fetching images with malformed kind."""
     with pytest.raises(ValidationError):
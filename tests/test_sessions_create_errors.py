@@ -73,15 +73,13 @@ async def test_sync_and_async_create_serialize_the_same_request() -> None:
         patch(
             "canfar.client.Client",
             side_effect=lambda **kwargs: real_client(
-                transport=sync_transport,
-                **kwargs,
+                **{**kwargs, "transport": sync_transport},
             ),
         ),
         patch(
             "canfar.client.AsyncClient",
             side_effect=lambda **kwargs: real_async_client(
-                transport=async_transport,
-                **kwargs,
+                **{**kwargs, "transport": async_transport},
             ),
         ),
         Session(token=SecretStr("token"), url=base_url) as session,
@@ -164,18 +162,21 @@ async def test_sync_and_async_create_share_http_failure_policy(
     with (
         patch(
             "canfar.client.Client",
-            side_effect=lambda **kwargs: real_client(transport=transport, **kwargs),
+            side_effect=lambda **kwargs: real_client(
+                **{**kwargs, "transport": transport}
+            ),
         ),
         patch(
             "canfar.client.AsyncClient",
             side_effect=lambda **kwargs: real_async_client(
-                transport=transport,
-                **kwargs,
+                **{**kwargs, "transport": transport},
             ),
         ),
-        Session(token=SecretStr("token"), url=base_url) as session,
+        Session(token=SecretStr("token"), url=base_url, create_retries=0) as session,
     ):
-        async with AsyncSession(token=SecretStr("token"), url=base_url) as asession:
+        async with AsyncSession(
+            token=SecretStr("token"), url=base_url, create_retries=0
+        ) as asession:
             assert session.create(request) == expected
             assert await asession.create(request) == expected
 
@@ -0,0 +1,185 @@
+"""Public contracts for following Session logs."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+import httpx
+import pytest
+from pydantic import SecretStr
+
+from canfar.sessions import AsyncSession
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Callable
+
+_BASE_URL = "https://example.test/skaha/v1/"
+
+
+class _Platform:
+    """Mock Science Platform whose logs grow on every status poll."""
+
+    def __init__(
+        self,
+        timeline: dict[str, list[tuple[str, bytes]]],
+        *,
+        ranges: bool = False,
+        whole: bool = False,
+    ) -> None:
+        self.timeline = timeline
+        self.ranges = ranges
+        self.whole = whole
+        self.polls = dict.fromkeys(timeline, -1)
+        self.ranges_sent: list[str | None] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        session_id = request.url.path.rsplit("/", 1)[-1]
+        if session_id not in self.timeline:
+            return httpx.Response(404, request=request)
+        steps = self.timeline[session_id]
+        if request.url.params.get("view") != "logs":
+            self.polls[session_id] = min(self.polls[session_id] + 1, len(steps) - 1)
+            status = steps[self.polls[session_id]][0]
+            return httpx.Response(200, json={"status": status}, request=request)
+
+        body = steps[self.polls[session_id]][1]
+        requested = request.headers.get("Range")
+        self.ranges_sent.append(requested)
+        chunks = [body[index : index + 3] for index in range(0, len(body), 3)]
+        if not (self.ranges and requested):
+            return httpx.Response(200, content=_stream(chunks), request=request)
+        # ``whole`` servers answer every range with the complete log.
+        start = 0 if self.whole else int(requested[len("bytes=") : -1])
+        if start >= len(body):
+            return httpx.Response(
+                416, headers={"Content-Range": f"bytes */{len(body)}"}, request=request
+            )
+        return httpx.Response(
+            206,
+            headers={"Content-Range": f"bytes {start}-{len(body) - 1}/{len(body)}"},
+            content=_stream([body[start:]]),
+            request=request,
+        )
+
+
+async def _stream(chunks: list[bytes]) -> AsyncIterator[bytes]:
+    for chunk in chunks:
+        yield chunk
+
+
+def _patched(platform: Callable[[httpx.Request], httpx.Response]):
+    transport = httpx.MockTransport(platform)
+    real_async_client = httpx.AsyncClient
+    return patch(
+        "canfar.client.AsyncClient",
+        side_effect=lambda **kwargs: real_async_client(
+            **{**kwargs, "transport": transport}
+        ),
+    )
+
+
+async def _collect(ids: list[str] | str) -> list[tuple[str, str]]:
+    async with AsyncSession(token=SecretStr("token"), url=_BASE_URL) as session:
+        return [item async for item in session.follow_logs(ids, interval=0)]
+
+
+@pytest.mark.asyncio
+async def test_follow_logs_emits_each_line_once_until_terminal_status() -> None:
+    """Only new complete lines are emitted; the trailing line on completion."""
+    platform = _Platform(
+        {
+            "job": [
+                ("Pending", b""),
+                ("Running", b"one\ntw"),
+                ("Running", b"one\ntwo\nthree\n"),
+                ("Succeeded", b"one\ntwo\nthree\nfour"),
+            ]
+        }
+    )
+
+    with _patched(platform):
+        lines = await _collect("job")
+
+    assert lines == [("job", "one"), ("job", "two"), ("job", "three"), ("job", "four")]
+    assert platform.ranges_sent == [None, None, "bytes=4-", "bytes=14-"]
+
+
+@pytest.mark.asyncio
+async def test_follow_logs_multiplexes_sessions_and_uses_ranges() -> None:
+    """Many Sessions share one stream; missing Sessions end their follow."""
+    platform = _Platform(
+        {
+            "alpha": [
+                ("Running", b"a1\n"),
+                ("Running", b"a1\n"),
+                ("Completed", b"a1\na2\n"),
+            ],
+            "beta": [("Running", b"b1\n"), ("Failed", b"b1\nb2\n")],
+        },
+        ranges=True,
+    )
+
+    with _patched(platform):
+        lines = await _collect(["alpha", "beta", "gone"])
+
+    assert [line for session_id, line in lines if session_id == "alpha"] == [
+        "a1",
+        "a2",
+    ]
+    assert [line for session_id, line in lines if session_id == "beta"] == [
+        "b1",
+        "b2",
+    ]
+    assert "bytes=3-" in platform.ranges_sent
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("steps", "whole", "expected"),
+    [
+        pytest.param(
+            [
+                ("Running", b"one\ntwo\n"),
+                ("Running", b"new\n"),
+                ("Succeeded", b"new\nmore\n"),
+            ],
+            False,
+            ["one", "two", "new", "more"],
+            id="log-shrank",
+        ),
+        pytest.param(
+            [("Running", b"one\n"), ("Succeeded", b"one\ntwo\n")],
+            True,
+            ["one", "two"],
+            id="range-ignored",
+        ),
+    ],
+)
+async def test_follow_logs_rereads_when_a_range_does_not_continue(
+    steps: list[tuple[str, bytes]], whole: bool, expected: list[str]
+) -> None:
+    """A shrunk log or a range from another offset is read again in full."""
+    platform = _Platform({"job": steps}, ranges=True, whole=whole)
+
+    with _patched(platform):
+        lines = await _collect("job")
+
+    assert [line for _, line in lines] == expected
+    assert None in platform.ranges_sent[1:]
+
+
+@pytest.mark.asyncio
+async def test_slow_consumer_holds_no_limiter_slot() -> None:
+    """A consumer that stops reading does not pin a slot or a log stream."""
+    log = b"".join(b"line %d\n" % index for index in range(3000))
+    platform = _Platform({"job": [("Running", log)]})
+
+    with _patched(platform):
+        async with AsyncSession(token=SecretStr("token"), url=_BASE_URL) as session:
+            stream = session.follow_logs("job", interval=0)
+            assert await stream.__anext__() == ("job", "line 0")
+            await asyncio.sleep(0.05)
+            assert session.limiter.active == 0
+            await stream.aclose()
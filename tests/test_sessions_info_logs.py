@@ -59,13 +59,14 @@ async def test_sync_and_async_info_and_logs_share_public_policy(
     with (
         patch(
             "canfar.client.Client",
-            side_effect=lambda **kwargs: real_client(transport=transport, **kwargs),
+            side_effect=lambda **kwargs: real_client(
+                **{**kwargs, "transport": transport}
+            ),
         ),
         patch(
             "canfar.client.AsyncClient",
             side_effect=lambda **kwargs: real_async_client(
-                transport=transport,
-                **kwargs,
+                **{**kwargs, "transport": transport},
             ),
         ),
         Session(token=SecretStr("token"), url=base_url) as session,
@@ -92,3 +93,64 @@ async def test_sync_and_async_info_and_logs_share_public_policy(
                 if record.name == "canfar.sessions"
             ]
             assert sync_messages == async_messages
+
+
+@pytest.mark.asyncio
+async def test_info_above_threshold_uses_one_listing_and_falls_back_by_id(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Large ID sets cost one list request plus one GET per unlisted ID."""
+    listed = [f"s{index}" for index in range(40)]
+    requested: list[str] = []
+
+    def respond(request: httpx.Request) -> httpx.Response:
+        requested.append(request.url.path)
+        if request.url.path.endswith("/session"):
+            return httpx.Response(
+                200,
+                json=[{"id": value, "status": "Running"} for value in listed],
+                request=request,
+            )
+        session_id = request.url.path.rsplit("/", 1)[-1]
+        return httpx.Response(
+            200, json={"id": session_id, "status": "Pending"}, request=request
+        )
+
+    base_url = "https://example.test/skaha/v1/"
+    transport = httpx.MockTransport(respond)
+    real_client = httpx.Client
+    real_async_client = httpx.AsyncClient
+    ids = [*reversed(listed), "fresh"]
+    expected = [
+        *({"id": value, "status": "Running"} for value in reversed(listed)),
+        {"id": "fresh", "status": "Pending"},
+    ]
+    caplog.set_level(logging.DEBUG, logger="canfar.sessions")
+
+    with (
+        patch(
+            "canfar.client.Client",
+            side_effect=lambda **kwargs: real_client(
+                **{**kwargs, "transport": transport}
+            ),
+        ),
+        patch(
+            "canfar.client.AsyncClient",
+            side_effect=lambda **kwargs: real_async_client(
+                **{**kwargs, "transport": transport},
+            ),
+        ),
+        Session(token=SecretStr("token"), url=base_url) as session,
+    ):
+        async with AsyncSession(token=SecretStr("token"), url=base_url) as asession:
+            assert session.info(ids) == expected
+            assert await asession.info(ids) == expected
+            assert requested == ["/skaha/v1/session", "/skaha/v1/session/fresh"] * 2
+
+            requested.clear()
+            asession.bulk_info_threshold = len(ids)
+            await asession.info(ids)
+            assert "/skaha/v1/session" not in requested
+            assert len(requested) == len(ids)
+
+    assert "40 of 41 ID(s) resolved from one list request" in caplog.text
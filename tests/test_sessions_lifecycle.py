@@ -100,13 +100,14 @@ async def test_sync_and_async_lifecycle_share_public_policy() -> None:
     with (
         patch(
             "canfar.client.Client",
-            side_effect=lambda **kwargs: real_client(transport=transport, **kwargs),
+            side_effect=lambda **kwargs: real_client(
+                **{**kwargs, "transport": transport}
+            ),
         ),
         patch(
             "canfar.client.AsyncClient",
             side_effect=lambda **kwargs: real_async_client(
-                transport=transport,
-                **kwargs,
+                **{**kwargs, "transport": transport},
             ),
         ),
         patch("canfar.sessions.open_new_tab") as open_tab,
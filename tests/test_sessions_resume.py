@@ -0,0 +1,157 @@
+"""Tests for journaled, resumable session launches."""
+
+from __future__ import annotations
+
+import json
+import stat
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+import httpx
+import pytest
+from pydantic import SecretStr
+
+from canfar.models.session import CreateRequest
+from canfar.sessions import AsyncSession, Session
+from canfar.utils import build
+from canfar.utils.journal import Journal
+
+_BASE_URL = "https://example.test/skaha/v1/"
+_REQUEST = CreateRequest(
+    name="batch",
+    image="skaha/terminal:latest",
+    kind="headless",
+    env={"TOKEN": "secret"},
+    replicas=3,
+)
+
+
+def _listed(session_id: str, name: str, age: float = 0) -> dict[str, str]:
+    started = datetime.now(timezone.utc) - timedelta(seconds=age)
+    return {
+        "id": session_id,
+        "name": name,
+        "status": "Running",
+        "startTime": started.strftime("%Y-%m-%dT%H:%M:%SZ"),
+    }
+
+
+class _Skaha:
+    """Skaha stand-in that launches sessions and lists them by name."""
+
+    def __init__(self, failing: set[str] | None = None) -> None:
+        self.failing = failing or set()
+        self.running: list[dict[str, str]] = []
+        self.posted: list[str] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        if request.method == "GET":
+            return httpx.Response(200, json=self.running, request=request)
+        name = request.url.params["name"]
+        self.posted.append(name)
+        if name in self.failing:
+            return httpx.Response(500, request=request)
+        self.running.append(_listed(f"{name}-id", name))
+        return httpx.Response(200, text=f"{name}-id\n", request=request)
+
+
+def _clients(transport: httpx.MockTransport):
+    real_client, real_async_client = httpx.Client, httpx.AsyncClient
+    return (
+        patch(
+            "canfar.client.Client",
+            side_effect=lambda **kwargs: real_client(
+                **{**kwargs, "transport": transport}
+            ),
+        ),
+        patch(
+            "canfar.client.AsyncClient",
+            side_effect=lambda **kwargs: real_async_client(
+                **{**kwargs, "transport": transport}
+            ),
+        ),
+    )
+
+
+def test_resume_submits_only_replicas_that_are_not_running() -> None:
+    """Failed replicas are reconciled by name and only missing ones re-sent."""
+    skaha = _Skaha(failing={"batch-2", "batch-3"})
+    sync_client, _ = _clients(httpx.MockTransport(skaha))
+    with (
+        sync_client,
+        Session(token=SecretStr("token"), url=_BASE_URL, create_rate=0) as session,
+    ):
+        first = session.submit(_REQUEST)
+        # The 500 for replica 3 was lost on the way back: it is actually running.
+        skaha.running.append(_listed("batch-3-late", "batch-3"))
+        skaha.failing.clear()
+        skaha.posted.clear()
+        resumed = session.submit(_REQUEST, resume=True)
+
+    assert first[1] == "batch-1-id"
+    assert isinstance(first[2], httpx.HTTPStatusError)
+    assert skaha.posted == ["batch-2"]
+    assert resumed == {1: "batch-1-id", 2: "batch-2-id", 3: "batch-3-late"}
+
+
+@pytest.mark.asyncio
+async def test_async_resume_after_an_interrupted_launch() -> None:
+    """Replicas journaled as submitted but never answered are re-sent."""
+    skaha = _Skaha()
+    _, async_client = _clients(httpx.MockTransport(skaha))
+    journal = Journal(build.create_parameters(_REQUEST))
+    journal.submitted(1)
+    journal.completed(1, "batch-1-id")
+    journal.submitted(2)  # the process died before Skaha answered
+    skaha.running.append(_listed("batch-1-id", "batch-1"))
+
+    with async_client:
+        async with AsyncSession(
+            token=SecretStr("token"), url=_BASE_URL, create_rate=0
+        ) as session:
+            ids = await session.create(_REQUEST, resume=True)
+
+    assert skaha.posted == ["batch-2", "batch-3"]
+    assert ids == ["batch-1-id", "batch-2-id", "batch-3-id"]
+
+
+def test_reconcile_ignores_earlier_sessions_with_the_same_name() -> None:
+    """Only sessions started since the journaled submit are this launch's."""
+    journal = Journal(build.create_parameters(_REQUEST))
+    for replica in (1, 2, 3):
+        journal.submitted(replica)
+    listing = [
+        _listed("old-1", "batch-1", age=3600),
+        _listed("new-2", "batch-2"),
+        _listed("twin-3a", "batch-3"),
+        _listed("twin-3b", "batch-3"),
+    ]
+
+    launched, missing = journal.reconcile(listing)
+
+    assert launched == {2: "new-2"}
+    assert missing == [1]
+    assert journal.load()[2].id == "new-2"
+
+
+def test_journal_is_private_and_tolerates_torn_lines() -> None:
+    """Journals are owner-only, and a line cut short by a crash is skipped."""
+    journal = Journal(build.create_parameters(_REQUEST))
+    journal.submitted(1)
+    journal.completed(1, "batch-1-id")
+    with journal.path.open("a", encoding="utf-8") as stream:
+        stream.write('{"event": "result", "replica": 2, "id": "ba')
+
+    state = journal.load()
+
+    assert stat.S_IMODE(journal.path.stat().st_mode) == 0o600
+    assert state[1].id == "batch-1-id"
+    assert state[2].submitted is None
+    assert state[2].id is None
+    first = json.loads(journal.path.read_text(encoding="utf-8").splitlines()[0])
+    assert first["name"] == "batch-1"
+    assert "secret" not in journal.path.read_text(encoding="utf-8")
+    assert "payload" not in first
+
+    journal.start()
+    assert not journal.path.exists()
@@ -0,0 +1,259 @@
+"""Tests for rate-limited, retrying session creation."""
+
+from __future__ import annotations
+
+import time
+from datetime import datetime, timedelta, timezone
+from email.utils import formatdate
+from unittest.mock import patch
+
+import httpx
+import pytest
+from pydantic import SecretStr
+
+from canfar import sessions
+from canfar.models.session import CreateRequest
+from canfar.sessions import AsyncSession, Session
+from canfar.utils import retry
+from canfar.utils.ratelimit import TokenBucket
+
+_BASE_URL = "https://example.test/skaha/v1/"
+_REQUEST = CreateRequest(
+    name="batch", image="skaha/terminal:latest", kind="headless", replicas=3
+)
+
+
+class _Flaky:
+    """Skaha stand-in: replica 2 is throttled once, replica 3 always fails."""
+
+    def __init__(self) -> None:
+        self.calls: dict[str, int] = {}
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        name = request.url.params["name"]
+        self.calls[name] = self.calls.get(name, 0) + 1
+        if name == "batch-2" and self.calls[name] == 1:
+            return httpx.Response(429, headers={"Retry-After": "0"}, request=request)
+        if name == "batch-3":
+            return httpx.Response(500, text="boom", request=request)
+        return httpx.Response(200, text=f"{name}-id\n", request=request)
+
+
+def _expect(result: dict[int, object], origin: _Flaky) -> None:
+    assert result[1] == "batch-1-id"
+    assert result[2] == "batch-2-id"
+    assert isinstance(result[3], httpx.HTTPStatusError)
+    assert origin.calls == {"batch-1": 1, "batch-2": 2, "batch-3": 1}
+
+
+def test_sync_submit_maps_replicas_to_ids_or_final_errors() -> None:
+    """Throttled replicas are retried; non-retryable errors are reported."""
+    origin = _Flaky()
+    transport = httpx.MockTransport(origin)
+    real_client = httpx.Client
+    with (
+        patch(
+            "canfar.client.Client",
+            side_effect=lambda **kwargs: real_client(
+                **{**kwargs, "transport": transport}
+            ),
+        ),
+        Session(token=SecretStr("token"), url=_BASE_URL, create_rate=0) as session,
+    ):
+        _expect(session.submit(_REQUEST), origin)
+
+
+@pytest.mark.asyncio
+async def test_async_submit_maps_replicas_to_ids_or_final_errors() -> None:
+    """The async client applies the same retry policy."""
+    origin = _Flaky()
+    transport = httpx.MockTransport(origin)
+    real_client = httpx.AsyncClient
+    with patch(
+        "canfar.client.AsyncClient",
+        side_effect=lambda **kwargs: real_client(**{**kwargs, "transport": transport}),
+    ):
+        async with AsyncSession(
+            token=SecretStr("token"), url=_BASE_URL, create_rate=0
+        ) as session:
+            _expect(await session.submit(_REQUEST), origin)
+
+
+def _listed(session_id: str, name: str, status: str, age: float) -> dict[str, str]:
+    started = datetime.now(timezone.utc) - timedelta(seconds=age)
+    return {
+        "id": session_id,
+        "name": name,
+        "status": status,
+        "startTime": started.strftime("%Y-%m-%dT%H:%M:%SZ"),
+    }
+
+
+class _LossyGateway:
+    """Skaha stand-in behind a gateway that loses the first reply per replica.
+
+    ``batch-1`` launches but the gateway answers 502; ``batch-2`` times out
+    before Skaha sees it; ``batch-3`` launches normally. ``listed`` sessions
+    already exist, e.g. from earlier launches of the same request.
+    """
+
+    def __init__(self, listed: list[dict[str, str]] | None = None) -> None:
+        self.posted: list[str] = []
+        self.running: list[dict[str, str]] = list(listed or [])
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        if request.method == "GET":
+            return httpx.Response(200, json=self.running, request=request)
+        name = request.url.params["name"]
+        self.posted.append(name)
+        first = self.posted.count(name) == 1
+        if name == "batch-2" and first:
+            message = "read timed out"
+            raise httpx.ReadTimeout(message, request=request)
+        self.running.append(_listed(f"{name}-id", name, "Running", 0))
+        if name == "batch-1" and first:
+            return httpx.Response(502, headers={"Retry-After": "0"}, request=request)
+        return httpx.Response(200, text=f"{name}-id\n", request=request)
+
+
+@pytest.mark.parametrize(
+    "listed",
+    [
+        [],
+        [
+            _listed("old-1", "batch-1", "Completed", 3600),
+            _listed("old-2", "batch-2", "Running", 3600),
+        ],
+    ],
+    ids=["fresh", "earlier-launch"],
+)
+def test_ambiguous_failures_are_reconciled_before_resubmitting(
+    listed: list[dict[str, str]],
+) -> None:
+    """A create that may have launched is looked up, not re-POSTed.
+
+    Sessions of earlier launches with the same name started before this one
+    and are never taken for its replicas.
+    """
+    origin = _LossyGateway(listed)
+    transport = httpx.MockTransport(origin)
+    real_client = httpx.Client
+    with (
+        patch(
+            "canfar.client.Client",
+            side_effect=lambda **kwargs: real_client(
+                **{**kwargs, "transport": transport}
+            ),
+        ),
+        patch("canfar.sessions.time.sleep"),
+        Session(token=SecretStr("token"), url=_BASE_URL, create_rate=0) as session,
+    ):
+        result = session.submit(_REQUEST)
+
+    assert result == {1: "batch-1-id", 2: "batch-2-id", 3: "batch-3-id"}
+    assert sorted(origin.posted) == ["batch-1", "batch-2", "batch-2", "batch-3"]
+
+
+def test_several_matching_sessions_leave_the_outcome_unknown() -> None:
+    """Two candidate sessions are neither claimed nor submitted again."""
+    origin = _LossyGateway([_listed("other-1", "batch-1", "Pending", 0)])
+    transport = httpx.MockTransport(origin)
+    real_client = httpx.Client
+    with (
+        patch(
+            "canfar.client.Client",
+            side_effect=lambda **kwargs: real_client(
+                **{**kwargs, "transport": transport}
+            ),
+        ),
+        patch("canfar.sessions.time.sleep"),
+        Session(token=SecretStr("token"), url=_BASE_URL, create_rate=0) as session,
+    ):
+        result = session.submit(_REQUEST)
+
+    assert isinstance(result[1], httpx.HTTPStatusError)
+    assert origin.posted.count("batch-1") == 1
+
+
+@pytest.mark.asyncio
+async def test_async_ambiguous_failures_are_reconciled() -> None:
+    """The async client reconciles the same way."""
+    origin = _LossyGateway()
+    transport = httpx.MockTransport(origin)
+    real_client = httpx.AsyncClient
+    with patch(
+        "canfar.client.AsyncClient",
+        side_effect=lambda **kwargs: real_client(**{**kwargs, "transport": transport}),
+    ):
+        async with AsyncSession(
+            token=SecretStr("token"), url=_BASE_URL, create_rate=0
+        ) as session:
+            result = await session.submit(_REQUEST)
+
+    assert result == {1: "batch-1-id", 2: "batch-2-id", 3: "batch-3-id"}
+    assert sorted(origin.posted) == ["batch-1", "batch-2", "batch-2", "batch-3"]
+
+
+def test_connect_errors_back_off_until_retries_run_out() -> None:
+    """Connection failures back off exponentially and then surface."""
+
+    def refuse(request: httpx.Request) -> httpx.Response:
+        message = "connection refused"
+        raise httpx.ConnectError(message, request=request)
+
+    transport = httpx.MockTransport(refuse)
+    real_client = httpx.Client
+    with (
+        patch(
+            "canfar.client.Client",
+            side_effect=lambda **kwargs: real_client(
+                **{**kwargs, "transport": transport}
+            ),
+        ),
+        patch("canfar.sessions.time.sleep") as sleep,
+        Session(token=SecretStr("token"), url=_BASE_URL, create_retries=2) as session,
+    ):
+        result = session.submit(
+            CreateRequest(name="one", image="skaha/terminal:1", kind="headless")
+        )
+
+    assert isinstance(result[1], httpx.ConnectError)
+    delays = [call.args[0] for call in sleep.call_args_list]
+    assert len(delays) == 2
+    assert 0 <= delays[0] <= retry.Backoff().base
+    assert 0 <= delays[1] <= retry.Backoff().base * 2
+
+
+def test_retry_policy_classifies_errors_and_reads_retry_after() -> None:
+    """Only transient failures retry; ``Retry-After`` accepts both formats."""
+    request = httpx.Request("POST", _BASE_URL)
+
+    def failure(status: int, **headers: str) -> httpx.HTTPStatusError:
+        response = httpx.Response(status, headers=headers, request=request)
+        return httpx.HTTPStatusError("failed", request=request, response=response)
+
+    assert sessions._create_failure(failure(503)) == "refused"  # noqa: SLF001
+    assert sessions._create_failure(failure(504)) == "unknown"  # noqa: SLF001
+    assert sessions._create_failure(failure(500)) is None  # noqa: SLF001
+    assert retry.retryable(failure(503))
+    assert retry.retryable(httpx.ConnectTimeout("slow", request=request))
+    assert not retry.retryable(failure(500))
+    assert not retry.retryable(httpx.ReadTimeout("slow", request=request))
+    assert retry.retry_after(failure(429, **{"Retry-After": "7"})) == 7.0
+    dated = failure(429, **{"Retry-After": formatdate(time.time() + 60, usegmt=True)})
+    assert 55 < retry.retry_after(dated) <= 60
+    assert retry.retry_after(failure(429, **{"Retry-After": "soon"})) is None
+    assert retry.Backoff(cap=5).delay(0, retry_after=120) == 5
+
+
+def test_token_bucket_spaces_requests_after_the_burst() -> None:
+    """Reservations beyond the burst queue ``1 / rate`` seconds apart."""
+    bucket = TokenBucket(rate=10, capacity=2)
+
+    delays = [bucket.reserve() for _ in range(4)]
+
+    assert delays[:2] == [0.0, 0.0]
+    assert delays[2] == pytest.approx(0.1, abs=0.01)
+    assert delays[3] == pytest.approx(0.2, abs=0.01)
+    with pytest.raises(ValueError, match="positive"):
+        TokenBucket(rate=0)
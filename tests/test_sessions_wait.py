@@ -0,0 +1,119 @@
+"""Public contracts for waiting on Session statuses."""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import httpx
+import pytest
+from pydantic import SecretStr
+
+from canfar.sessions import TERMINAL_STATUSES, AsyncSession, Session
+
+_BASE_URL = "https://example.test/skaha/v1/"
+
+
+class _Platform:
+    """Mock Science Platform replaying one Session listing per poll."""
+
+    def __init__(self, polls: list[dict[str, str]]) -> None:
+        self.polls = polls
+        self.requests: list[httpx.Request] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        listing = self.polls[min(len(self.requests), len(self.polls)) - 1]
+        return httpx.Response(
+            200,
+            json=[{"id": key, "status": value} for key, value in listing.items()],
+            request=request,
+        )
+
+
+def _patched(platform: _Platform):
+    transport = httpx.MockTransport(platform)
+    real_client, real_async_client = httpx.Client, httpx.AsyncClient
+    return (
+        patch(
+            "canfar.client.Client",
+            side_effect=lambda **kwargs: real_client(
+                **{**kwargs, "transport": transport}
+            ),
+        ),
+        patch(
+            "canfar.client.AsyncClient",
+            side_effect=lambda **kwargs: real_async_client(
+                **{**kwargs, "transport": transport}
+            ),
+        ),
+    )
+
+
+_REPLICAS = [f"replica-{index}" for index in range(500)]
+_POLLS = [
+    dict.fromkeys(_REPLICAS, "Pending"),
+    {key: "Running" if index % 2 else "Pending" for index, key in enumerate(_REPLICAS)},
+    dict.fromkeys(_REPLICAS, "Running"),
+]
+
+
+@pytest.mark.asyncio
+async def test_async_wait_polls_one_listing_per_interval() -> None:
+    """500 replicas cost one list request per poll, never per-ID requests."""
+    platform = _Platform(_POLLS)
+    sync_patch, async_patch = _patched(platform)
+
+    with sync_patch, async_patch:
+        async with AsyncSession(token=SecretStr("token"), url=_BASE_URL) as session:
+            ready = await session.wait(
+                _REPLICAS,
+                until={"Running"} | TERMINAL_STATUSES,
+                interval=0,
+            )
+
+    assert len(platform.requests) == 3
+    assert {request.url.path for request in platform.requests} == {"/skaha/v1/session"}
+    assert list(ready) == _REPLICAS[1::2] + _REPLICAS[0::2]
+    assert all(info["status"] == "Running" for info in ready.values())
+
+
+def test_sync_watch_backs_off_until_a_status_changes() -> None:
+    """Quiet polls stretch the interval; any change resets it."""
+    platform = _Platform(
+        [
+            {"job": "Pending", "other": "Running"},
+            {"job": "Pending", "other": "Running"},
+            {"job": "Pending", "other": "Running"},
+            {"job": "Running", "other": "Running"},
+            {"job": "Succeeded", "other": "Running"},
+        ]
+    )
+    sync_patch, async_patch = _patched(platform)
+    delays: list[float] = []
+
+    with (
+        sync_patch,
+        async_patch,
+        patch("canfar.sessions.time.sleep", side_effect=delays.append),
+        Session(token=SecretStr("token"), url=_BASE_URL) as session,
+    ):
+        finished = list(session.watch("job", interval=1, max_interval=2))
+
+    assert [info["status"] for info in finished] == ["Succeeded"]
+    assert delays == [1, 1.5, 2, 1]
+
+
+def test_sync_wait_times_out_and_drops_unlisted_sessions() -> None:
+    """Sessions that vanish stop the wait; pending ones time out."""
+    platform = _Platform([{"job": "Running"}])
+    sync_patch, async_patch = _patched(platform)
+
+    with (
+        sync_patch,
+        async_patch,
+        patch("canfar.sessions.time.sleep"),
+        Session(token=SecretStr("token"), url=_BASE_URL) as session,
+    ):
+        assert session.wait("gone", interval=0) == {}
+        with pytest.raises(TimeoutError, match=r"1 session\(s\).*job"):
+            session.wait(["job"], timeout=0)
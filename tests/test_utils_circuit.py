@@ -0,0 +1,241 @@
+"""Tests for per-server circuit breakers."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import patch
+
+import httpx
+import pytest
+from pydantic import SecretStr
+
+from canfar.cli.output import boundary_failure
+from canfar.errors import ErrorCode
+from canfar.sessions import AsyncSession, Session
+from canfar.utils import circuit
+
+_BASE = "https://example.test/skaha/v1"
+_AVAILABLE = """<?xml version="1.0" encoding="UTF-8"?>
+<vosi:availability xmlns:vosi="http://www.ivoa.net/xml/VOSIAvailability/v1.0">
+  <vosi:available>{}</vosi:available>
+  <vosi:note>skaha</vosi:note>
+</vosi:availability>
+"""
+
+
+class _Server:
+    """Skaha stand-in that is down until ``up`` is set."""
+
+    def __init__(self) -> None:
+        self.up = False
+        self.paths: list[str] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.paths.append(request.url.path)
+        if request.url.path == "/skaha/availability":
+            return httpx.Response(200, text=_AVAILABLE.format(str(self.up).lower()))
+        if not self.up:
+            message = "connection refused"
+            raise httpx.ConnectError(message, request=request)
+        return httpx.Response(200, json=[])
+
+
+def _client(server: _Server, breaker: circuit.Breaker) -> httpx.Client:
+    transport = circuit.CircuitTransport(httpx.MockTransport(server), breaker)
+    return httpx.Client(base_url=_BASE, transport=transport)
+
+
+def test_circuit_opens_fails_fast_and_recovers_after_probe() -> None:
+    """Failures open the circuit; an available probe closes it again."""
+    server = _Server()
+    breaker = circuit.Breaker(_BASE, threshold=2, cooldown=0.05)
+    with _client(server, breaker) as client:
+        for _ in range(2):
+            with pytest.raises(httpx.ConnectError):
+                client.get("session")
+        assert breaker.state == "open"
+
+        with pytest.raises(circuit.CircuitOpenError) as raised:
+            client.get("session")
+        assert raised.value.code is ErrorCode.SERVER_UNAVAILABLE
+        assert len(server.paths) == 2
+
+        breaker._opened -= 0.05  # noqa: SLF001
+        with pytest.raises(circuit.CircuitOpenError):
+            client.get("session")
+        assert server.paths[-1] == "/skaha/availability"
+        assert breaker.state == "open"
+
+        server.up = True
+        breaker._opened -= 0.05  # noqa: SLF001
+        assert client.get("session").json() == []
+
+    assert breaker.state == "closed"
+    assert server.paths[-2:] == ["/skaha/availability", "/skaha/v1/session"]
+
+
+def test_gateway_errors_count_and_other_outcomes_reset() -> None:
+    """502, 503 and 504 are failures; any other response closes the count."""
+    statuses = iter([502, 503, 504, 500, 504, 404, 504, 504])
+    breaker = circuit.Breaker(_BASE, threshold=2)
+    transport = circuit.CircuitTransport(
+        httpx.MockTransport(lambda _request: httpx.Response(next(statuses))),
+        breaker,
+    )
+    with httpx.Client(base_url=_BASE, transport=transport) as client:
+        client.get("session")
+        client.get("session")
+        assert breaker.state == "open"
+        breaker.settle(available=True)
+        for _ in range(4):
+            client.get("session")
+            assert breaker.failures in {0, 1}
+        assert breaker.state == "closed"
+        client.get("session")
+        client.get("session")
+
+    assert breaker.state == "open"
+
+
+def test_read_timeouts_do_not_count() -> None:
+    """Only failures to connect count; a slow response says nothing of the server."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        message = "read timed out"
+        raise httpx.ReadTimeout(message, request=request)
+
+    breaker = circuit.Breaker(_BASE, threshold=1)
+    transport = circuit.CircuitTransport(httpx.MockTransport(handler), breaker)
+    with httpx.Client(base_url=_BASE, transport=transport) as client:
+        for _ in range(3):
+            with pytest.raises(httpx.ReadTimeout):
+                client.get("session")
+
+    assert breaker.state == "closed"
+
+
+def test_retried_request_counts_once() -> None:
+    """The breaker sits above retries and sees one outcome per request."""
+    statuses = iter([503, 503, 200, 503, 503, 503])
+    with patch(
+        "canfar.client.transport.shared",
+        return_value=httpx.MockTransport(
+            lambda _request: httpx.Response(
+                next(statuses), json=[], headers={"Retry-After": "0"}
+            )
+        ),
+    ):
+        session = Session(
+            token=SecretStr("token"),
+            url=f"{_BASE}/",
+            retries=2,
+            retry_budget=1.0,
+            breaker_threshold=2,
+        )
+        assert session.fetch() == []
+        with pytest.raises(httpx.HTTPStatusError):
+            session.fetch()
+
+    shared = circuit.breaker(_BASE, threshold=2)
+    assert shared.failures == 1
+    assert shared.state == "closed"
+
+
+def test_breakers_are_shared_per_url_and_settings() -> None:
+    """Clients with different settings do not share, or override, a breaker."""
+    assert circuit.breaker(f"{_BASE}/") is circuit.breaker(_BASE)
+    strict = circuit.breaker(_BASE, threshold=1, cooldown=5.0)
+    assert strict is not circuit.breaker(_BASE)
+    assert (strict.threshold, strict.cooldown) == (1, 5.0)
+
+
+def test_probe_uses_the_request_timeout() -> None:
+    """The availability probe is bounded by the client's timeout."""
+    server = _Server()
+    timeouts: list[object] = []
+    breaker = circuit.Breaker(_BASE, threshold=1, cooldown=0.05)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        timeouts.append(request.extensions.get("timeout"))
+        return server(request)
+
+    transport = circuit.CircuitTransport(httpx.MockTransport(handler), breaker)
+    with httpx.Client(base_url=_BASE, transport=transport, timeout=1.0) as client:
+        with pytest.raises(httpx.ConnectError):
+            client.get("session")
+        breaker._opened -= 0.05  # noqa: SLF001
+        with pytest.raises(circuit.CircuitOpenError):
+            client.get("session")
+
+    assert server.paths[-1] == "/skaha/availability"
+    assert timeouts[-1] == httpx.Timeout(1.0).as_dict()
+
+
+@pytest.mark.asyncio
+async def test_cancelled_probe_does_not_wedge_the_breaker() -> None:
+    """A probe that never completes is settled when its request is cancelled."""
+    hung = asyncio.Event()
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/skaha/availability":
+            hung.set()
+            await asyncio.Event().wait()
+        message = "connection refused"
+        raise httpx.ConnectError(message, request=request)
+
+    breaker = circuit.Breaker(_BASE, threshold=1, cooldown=0.05)
+    transport = circuit.AsyncCircuitTransport(httpx.MockTransport(handler), breaker)
+    async with httpx.AsyncClient(base_url=_BASE, transport=transport) as client:
+        with pytest.raises(httpx.ConnectError):
+            await client.get("session")
+        breaker._opened -= 0.05  # noqa: SLF001
+        request = asyncio.create_task(client.get("session"))
+        await hung.wait()
+        request.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await request
+
+    assert not breaker._probing  # noqa: SLF001
+    assert breaker.state == "open"
+
+
+@pytest.mark.asyncio
+async def test_bulk_calls_fail_fast_once_the_server_is_down() -> None:
+    """Later items of a bulk call skip the network instead of timing out."""
+    server = _Server()
+    with patch(
+        "canfar.client.transport.ashared",
+        return_value=httpx.MockTransport(server),
+    ):
+        async with AsyncSession(
+            token=SecretStr("token"),
+            url=f"{_BASE}/",
+            concurrency=1,
+            retries=0,
+            breaker_threshold=3,
+        ) as session:
+            info = await session.info([f"s{index}" for index in range(10)])
+
+    assert info == []
+    assert len(server.paths) == 3
+
+
+def test_open_circuit_maps_to_structured_error() -> None:
+    """The CLI reports an open circuit with its own error code and hint."""
+    server = _Server()
+    with patch(
+        "canfar.client.transport.shared",
+        return_value=httpx.MockTransport(server),
+    ):
+        session = Session(
+            token=SecretStr("token"), url=f"{_BASE}/", retries=0, breaker_threshold=1
+        )
+        with pytest.raises(httpx.ConnectError):
+            session.fetch()
+        with pytest.raises(circuit.CircuitOpenError) as raised:
+            session.fetch()
+
+    error = boundary_failure(raised.value)
+    assert error.code == ErrorCode.SERVER_UNAVAILABLE
+    assert error.hint is not None
+    assert "canfar server use" in error.hint
@@ -0,0 +1,140 @@
+"""Tests for the persistent discovery document cache."""
+
+from __future__ import annotations
+
+import time
+
+import httpx
+import pytest
+
+from canfar.models.active import ActiveConfig
+from canfar.models.auth import X509Credential
+from canfar.models.config import Configuration
+from canfar.models.http import Server
+from canfar.server import enrich
+from canfar.utils import httpcache
+
+_URL = "https://registry.example/reg/resource-caps"
+_CAPABILITIES = """<?xml version="1.0" encoding="UTF-8"?>
+<vosi:capabilities xmlns:vosi="http://www.ivoa.net/xml/VOSICapabilities/v1.0"
+    xmlns:vs="http://www.ivoa.net/xml/VODataService/v1.1"
+    xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance">
+  <capability standardID="vos://cadc.nrc.ca~vospace/CADC/std/Proc#sessions-1.0">
+    <interface xsi:type="vs:ParamHTTP" role="std">
+      <accessURL use="base">https://skaha.example/skaha/v1/session</accessURL>
+      <securityMethod standardID="ivo://ivoa.net/sso#tls-with-certificate" />
+    </interface>
+  </capability>
+</vosi:capabilities>
+"""
+
+
+class _Origin:
+    """Mock origin server that honours ``If-None-Match``."""
+
+    def __init__(self, body: str = "ivo://a = https://a", **headers: str) -> None:
+        self.body = body
+        self.headers = {"ETag": '"v1"', **headers}
+        self.requests: list[httpx.Request] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        if request.headers.get("If-None-Match") == self.headers["ETag"]:
+            return httpx.Response(304, headers={"ETag": self.headers["ETag"]})
+        return httpx.Response(200, text=self.body, headers=self.headers)
+
+
+def _expire(url: str) -> None:
+    entry = httpcache.load(url)
+    assert entry is not None
+    httpcache.store(entry._replace(fetched=time.time() - httpcache.DEFAULT_TTL - 1))
+
+
+def test_fresh_documents_are_served_without_a_request() -> None:
+    """Within the TTL the second read never reaches the network."""
+    origin = _Origin()
+    with httpx.Client(transport=httpx.MockTransport(origin)) as client:
+        first = httpcache.fetch(client, _URL)
+        second = httpcache.fetch(client, _URL)
+
+    assert first == httpcache.Document(origin.body, "network")
+    assert second == httpcache.Document(origin.body, "cache")
+    assert len(origin.requests) == 1
+
+
+def test_stale_documents_are_revalidated_conditionally() -> None:
+    """After the TTL a 304 reuses the stored body and restarts the TTL."""
+    origin = _Origin(**{"Last-Modified": "Wed, 01 Jan 2025 00:00:00 GMT"})
+    with httpx.Client(transport=httpx.MockTransport(origin)) as client:
+        httpcache.fetch(client, _URL)
+        _expire(_URL)
+        revalidated = httpcache.fetch(client, _URL)
+        again = httpcache.fetch(client, _URL)
+
+    conditional = origin.requests[1].headers
+    assert conditional["If-None-Match"] == '"v1"'
+    assert conditional["If-Modified-Since"] == "Wed, 01 Jan 2025 00:00:00 GMT"
+    assert revalidated == httpcache.Document(origin.body, "revalidated")
+    assert again.source == "cache"
+    assert len(origin.requests) == 2
+
+
+@pytest.mark.asyncio
+async def test_async_fetch_replaces_changed_documents() -> None:
+    """A changed document is downloaded in full and replaces the entry."""
+    origin = _Origin()
+    async with httpx.AsyncClient(transport=httpx.MockTransport(origin)) as client:
+        await httpcache.afetch(client, _URL)
+        origin.body, origin.headers["ETag"] = "ivo://b = https://b", '"v2"'
+        changed = await httpcache.afetch(client, _URL, ttl=0)
+
+    assert changed == httpcache.Document("ivo://b = https://b", "network")
+    assert httpcache.load(_URL).etag == '"v2"'
+
+
+def test_errors_and_no_store_responses_are_not_cached() -> None:
+    """Failures propagate; ``no-store`` bodies and corrupt files are misses."""
+    origin = _Origin(**{"Cache-Control": "no-store"})
+    with httpx.Client(transport=httpx.MockTransport(origin)) as client:
+        httpcache.fetch(client, _URL)
+        assert httpcache.load(_URL) is None
+
+        failing = httpx.MockTransport(lambda _: httpx.Response(503))
+        with (
+            httpx.Client(transport=failing) as broken,
+            pytest.raises(httpx.HTTPStatusError),
+        ):
+            httpcache.fetch(broken, _URL)
+
+    httpcache.store(httpcache.Entry(_URL, "body", None, None, time.time()))
+    for path in httpcache.directory().glob("*.json"):
+        path.write_text("{not json", encoding="utf-8")
+    assert httpcache.load(_URL) is None
+
+
+def test_enrich_reuses_cached_capabilities(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Activation-time validation reuses capabilities fetched by discovery."""
+    origin = _Origin(_CAPABILITIES)
+    transport = httpx.MockTransport(origin)
+    factory = httpx.Client
+    monkeypatch.setattr(
+        "canfar.client.Client",
+        lambda **kwargs: factory(**{**kwargs, "transport": transport}),
+    )
+    config = Configuration(
+        active=ActiveConfig(authentication="cadc", server=None),
+        authentication={"cadc": X509Credential(idp="cadc")},
+    )
+    server = Server(
+        idp="cadc",
+        name="Example",
+        uri="ivo://example/skaha",
+        url="https://skaha.example/skaha",
+    )
+
+    first = enrich(server, config=config)
+    second = enrich(server, config=config)
+
+    assert first == second
+    assert first.version is not None
+    assert len(origin.requests) == 1
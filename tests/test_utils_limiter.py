@@ -0,0 +1,169 @@
+"""Tests for the shared async concurrency limiter."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import patch
+
+import httpx
+import pytest
+from pydantic import SecretStr
+
+from canfar.sessions import AsyncSession
+from canfar.utils.limiter import AIMD, Limiter
+
+
+@pytest.mark.asyncio
+async def test_limiter_admits_waiters_in_order_and_records_waits() -> None:
+    """Queued acquisitions are served FIFO and their wait is measured."""
+    limiter = Limiter(1)
+    order: list[int] = []
+
+    async def hold(index: int) -> None:
+        async with limiter.slot():
+            order.append(index)
+            await asyncio.sleep(0.01)
+
+    await asyncio.gather(*(hold(index) for index in range(3)))
+
+    assert order == [0, 1, 2]
+    assert limiter.active == 0
+    assert limiter.stats.acquired == 3
+    assert limiter.stats.queued == 2
+    assert limiter.stats.wait_max >= 0.01
+    assert 0 < limiter.stats.wait_mean <= limiter.stats.wait_max
+
+
+@pytest.mark.asyncio
+async def test_limiter_survives_cancelled_waiters_and_limit_changes() -> None:
+    """Cancelled waiters give up their place; raising the limit admits others."""
+    limiter = Limiter(1)
+    await limiter.acquire()
+    cancelled = asyncio.create_task(limiter.acquire())
+    admitted = asyncio.create_task(limiter.acquire())
+    await asyncio.sleep(0)
+    cancelled.cancel()
+    await asyncio.gather(cancelled, return_exceptions=True)
+
+    assert limiter.waiting == 1
+    limiter.limit = 2
+    await admitted
+    assert limiter.active == 2
+    with pytest.raises(ValueError, match="at least 1"):
+        Limiter(0)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_bulk_calls_share_one_limit() -> None:
+    """``logs`` and ``info`` running together stay within ``concurrency``."""
+    in_flight = peak = 0
+
+    async def respond(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        if request.url.params.get("view") == "logs":
+            return httpx.Response(200, text="log\n", request=request)
+        return httpx.Response(200, json={"id": "x"}, request=request)
+
+    transport = httpx.MockTransport(respond)
+    real_client = httpx.AsyncClient
+    ids = [f"s{index}" for index in range(6)]
+    with patch(
+        "canfar.client.AsyncClient",
+        side_effect=lambda **kwargs: real_client(**{**kwargs, "transport": transport}),
+    ):
+        async with AsyncSession(
+            token=SecretStr("token"),
+            url="https://example.test/skaha/v1/",
+            concurrency=2,
+        ) as session:
+            await asyncio.gather(session.logs(ids), session.info(ids))
+
+    assert peak == 2
+    assert session.limiter.stats.acquired == 12
+    assert session.limiter.stats.queued > 0
+
+
+def test_aimd_grows_on_flat_latency_and_backs_off_on_overload() -> None:
+    """One slot per window of fast successes; halve once per overload burst."""
+    request = httpx.Request("GET", "https://example.test/session")
+    throttled = httpx.HTTPStatusError(
+        "throttled",
+        request=request,
+        response=httpx.Response(429, request=request),
+    )
+    controller = AIMD(maximum=5)
+    limit = 4
+    for _ in range(4):
+        limit = controller.update(limit, 0.1, None)
+    assert limit == 5
+    for _ in range(10):
+        limit = controller.update(limit, 0.1, None)
+    assert limit == 5
+    assert controller.latency == pytest.approx(0.1)
+
+    limit = controller.update(limit, 0.1, throttled)
+    assert limit == 2
+    assert controller.update(limit, 0.1, throttled) == 2
+    assert controller.update(limit, 0.1, httpx.ReadTimeout("slow")) == 2
+    assert controller.update(limit, 0.1, ValueError("not a signal")) == 2
+    # Latency far above the baseline shrinks the limit by one.
+    for _ in range(10):
+        limit = controller.update(limit, 5.0, None)
+    assert limit == 1
+
+
+@pytest.mark.asyncio
+async def test_adaptive_session_limiter_reacts_to_server_pushback() -> None:
+    """An opted-in client halves its limit when Skaha answers 503."""
+
+    def respond(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("busy"):
+            return httpx.Response(503, request=request)
+        return httpx.Response(200, json={"id": "x"}, request=request)
+
+    transport = httpx.MockTransport(respond)
+    real_client = httpx.AsyncClient
+    with patch(
+        "canfar.client.AsyncClient",
+        side_effect=lambda **kwargs: real_client(**{**kwargs, "transport": transport}),
+    ):
+        async with AsyncSession(
+            token=SecretStr("token"),
+            url="https://example.test/skaha/v1/",
+            concurrency=8,
+            adaptive_concurrency=True,
+        ) as session:
+            await session.info(["ok"])
+            assert session.limiter.latency is not None
+            await session.info(["busy"])
+
+    assert session.limiter.limit == 4
+
+
+@pytest.mark.asyncio
+async def test_adaptive_limiter_sees_destroy_pushback() -> None:
+    """Failed deletions reach the controller and are still reported as False."""
+    transport = httpx.MockTransport(
+        lambda request: httpx.Response(
+            503 if request.url.path.endswith("busy") else 200, request=request
+        )
+    )
+    real_client = httpx.AsyncClient
+    with patch(
+        "canfar.client.AsyncClient",
+        side_effect=lambda **kwargs: real_client(**{**kwargs, "transport": transport}),
+    ):
+        async with AsyncSession(
+            token=SecretStr("token"),
+            url="https://example.test/skaha/v1/",
+            concurrency=8,
+            adaptive_concurrency=True,
+        ) as session:
+            results = await session.destroy(["ok", "busy"])
+
+    assert results == {"ok": True, "busy": False}
+    assert session.limiter.limit == 4
@@ -0,0 +1,98 @@
+"""Tests for job array rate budgets shared by replicas."""
+
+from __future__ import annotations
+
+import time
+from unittest.mock import patch
+
+import httpx
+import pytest
+from pydantic import SecretStr
+
+from canfar.client import HTTPClient
+from canfar.utils import ratelimit
+
+_URL = "https://example.test/skaha/v1"
+
+
+def _schedule(bucket: ratelimit.TokenBucket, requests: int) -> list[float]:
+    """Return when each of ``requests`` reserved at once may be sent."""
+    return [bucket.reserve() for _ in range(requests)]
+
+
+def test_replicas_interleave_within_the_budget() -> None:
+    """A 16-replica burst is spread to one request per ``1 / budget`` seconds."""
+    budget, replicas = 40.0, 16
+    sends = sorted(
+        when
+        for replica in range(1, replicas + 1)
+        for when in _schedule(
+            ratelimit.replica_bucket(budget, replica=replica, total=replicas), 4
+        )
+    )
+
+    gaps = [later - earlier for earlier, later in zip(sends, sends[1:])]
+    assert min(gaps) == pytest.approx(1 / budget, abs=1e-3)
+    assert sends[0] == 0.0
+    # 64 requests at 40/s need 1.6s; without the budget they would all go at once.
+    assert sends[-1] == pytest.approx(63 / budget, abs=1e-2)
+
+
+def test_replica_defaults_come_from_the_environment(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """``REPLICA_ID`` and ``REPLICA_COUNT`` select the share and the offset."""
+    monkeypatch.setenv("REPLICA_ID", "3")
+    monkeypatch.setenv("REPLICA_COUNT", "4")
+
+    bucket = ratelimit.replica_bucket(8)
+
+    assert bucket.rate == 2
+    assert bucket.reserve() == pytest.approx(2 / 8, abs=1e-3)
+    assert ratelimit.shared(8) is ratelimit.shared(8)
+
+
+@pytest.mark.parametrize(
+    ("replica", "total", "rate"),
+    [("abc", "4", 2), ("", "4", 2), ("0", "4", 2), ("5", "4", 2), ("2", "x", 8)],
+)
+def test_invalid_replica_environment_falls_back_to_the_first_slot(
+    monkeypatch: pytest.MonkeyPatch,
+    replica: str,
+    total: str,
+    rate: float,
+) -> None:
+    """Malformed or out-of-range values warn instead of raising."""
+    monkeypatch.setenv("REPLICA_ID", replica)
+    monkeypatch.setenv("REPLICA_COUNT", total)
+
+    with patch.object(ratelimit.log, "warning") as warning:
+        bucket = ratelimit.replica_bucket(8)
+
+    assert bucket.rate == rate
+    assert bucket.reserve() == 0.0
+    warning.assert_called()
+
+
+def test_client_requests_are_paced_by_the_budget(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Every request of every client in the replica draws from one share."""
+    monkeypatch.setenv("REPLICA_ID", "1")
+    monkeypatch.setenv("REPLICA_COUNT", "2")
+    monkeypatch.setattr(
+        "canfar.client.transport.shared",
+        lambda *_, **__: httpx.MockTransport(lambda _: httpx.Response(200)),
+    )
+    clients = [
+        HTTPClient(token=SecretStr("token"), url=_URL, rate_budget=20) for _ in range(2)
+    ]
+
+    start = time.monotonic()
+    for client in clients:
+        for _ in range(2):
+            client.client.get("session")
+    elapsed = time.monotonic() - start
+
+    # Four requests at this replica's 10/s share: three waits of 0.1s.
+    assert elapsed >= 0.3
@@ -0,0 +1,104 @@
+"""Tests for the transport-level retry policy."""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import httpx
+import pytest
+from pydantic import SecretStr
+
+from canfar.sessions import AsyncSession
+from canfar.utils import retry
+
+_URL = "https://example.test/skaha/v1/session"
+_NO_WAIT = retry.Backoff(retries=2, base=0)
+
+
+class _Flaky:
+    """Fail the first ``failures`` attempts of every request, then succeed."""
+
+    def __init__(self, failures: int, failure: httpx.Response | None = None) -> None:
+        self.failures = failures
+        self.failure = failure or httpx.Response(503, headers={"Retry-After": "0"})
+        self.attempts = 0
+
+    def __call__(self, _request: httpx.Request) -> httpx.Response:
+        self.attempts += 1
+        if self.attempts <= self.failures:
+            return self.failure
+        return httpx.Response(200, json={"id": "abc"})
+
+
+def test_idempotent_requests_retry_and_others_do_not() -> None:
+    """GET retries a 503; POST only when marked safe."""
+    stats = retry.RetryStats()
+    flaky = _Flaky(failures=1)
+    transport = retry.RetryTransport(httpx.MockTransport(flaky), _NO_WAIT, stats=stats)
+    with httpx.Client(transport=transport) as client:
+        assert client.get(_URL).status_code == httpx.codes.OK
+
+        flaky.attempts = 0
+        assert client.post(_URL).status_code == httpx.codes.SERVICE_UNAVAILABLE
+
+        flaky.attempts = 0
+        marked = client.post(_URL, extensions={retry.SAFE: True})
+        assert marked.status_code == httpx.codes.OK
+
+    assert stats == retry.RetryStats(requests=3, retries=2, exhausted=0, denied=0)
+
+
+def test_timeouts_are_retried_until_the_policy_is_exhausted() -> None:
+    """Transport errors surface once every retry failed."""
+    attempts = 0
+
+    def time_out(request: httpx.Request) -> httpx.Response:
+        nonlocal attempts
+        attempts += 1
+        message = "read timed out"
+        raise httpx.ReadTimeout(message, request=request)
+
+    stats = retry.RetryStats()
+    transport = retry.RetryTransport(
+        httpx.MockTransport(time_out), _NO_WAIT, stats=stats
+    )
+    with httpx.Client(transport=transport) as client, pytest.raises(httpx.ReadTimeout):
+        client.delete(_URL)
+
+    assert attempts == 3
+    assert stats.retries == 2
+    assert stats.exhausted == 1
+
+
+def test_retry_budget_caps_retries_across_requests() -> None:
+    """A spent budget returns the failure instead of retrying again."""
+    stats = retry.RetryStats()
+    budget = retry.RetryBudget(ratio=0, minimum=1)
+    transport = retry.RetryTransport(
+        httpx.MockTransport(_Flaky(failures=10)), _NO_WAIT, budget, stats
+    )
+    with httpx.Client(transport=transport) as client:
+        response = client.get(_URL)
+
+    assert response.status_code == httpx.codes.SERVICE_UNAVAILABLE
+    assert stats.retries == 1
+    assert stats.denied == 1
+
+
+@pytest.mark.asyncio
+async def test_async_session_requests_recover_from_transient_errors() -> None:
+    """Bulk methods no longer drop items after one 502 from Skaha."""
+    flaky = _Flaky(
+        failures=1, failure=httpx.Response(502, headers={"Retry-After": "0"})
+    )
+    with patch(
+        "canfar.client.transport.ashared",
+        return_value=httpx.MockTransport(flaky),
+    ):
+        async with AsyncSession(
+            token=SecretStr("token"), url="https://example.test/skaha/v1/", retries=2
+        ) as session:
+            info = await session.info("abc")
+
+    assert info == [{"id": "abc"}]
+    assert session.retry_stats.retries == 1
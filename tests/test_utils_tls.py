@@ -0,0 +1,148 @@
+"""Tests for cached TLS contexts and session resumption."""
+
+from __future__ import annotations
+
+import datetime as dt
+import os
+import ssl
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import TYPE_CHECKING
+
+import httpx
+import pytest
+from cryptography import x509
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import ec
+from cryptography.x509.oid import NameOID
+
+from canfar.utils import tls
+from tests.test_auth_x509 import generate_cert
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+
+@pytest.fixture(autouse=True)
+def fresh_contexts() -> Iterator[None]:
+    """Start and finish every test without cached contexts."""
+    tls.clear()
+    yield
+    tls.clear()
+
+
+def _server_certificate(directory: Path) -> Path:
+    """Write a self-signed ``localhost`` certificate and key; return its path."""
+    key = ec.generate_private_key(ec.SECP256R1())
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, "localhost")])
+    now = dt.datetime.now(dt.timezone.utc)
+    certificate = (
+        x509.CertificateBuilder()
+        .subject_name(name)
+        .issuer_name(name)
+        .public_key(key.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(now - dt.timedelta(minutes=5))
+        .not_valid_after(now + dt.timedelta(days=1))
+        .add_extension(
+            x509.SubjectAlternativeName([x509.DNSName("localhost")]),
+            critical=False,
+        )
+        .add_extension(x509.BasicConstraints(ca=True, path_length=None), critical=True)
+        .sign(key, hashes.SHA256())
+    )
+    path = directory / "localhost.pem"
+    path.write_bytes(
+        key.private_bytes(
+            serialization.Encoding.PEM,
+            serialization.PrivateFormat.PKCS8,
+            serialization.NoEncryption(),
+        )
+        + certificate.public_bytes(serialization.Encoding.PEM)
+    )
+    return path
+
+
+@pytest.fixture
+def https_server(tmp_path: Path) -> Iterator[tuple[str, Path, list[bool]]]:
+    """Serve HTTPS on localhost, recording whether each handshake resumed."""
+    pem = _server_certificate(tmp_path)
+    resumed: list[bool] = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:
+            resumed.append(self.request.session_reused)
+            self.send_response(200)
+            self.send_header("Content-Length", "2")
+            self.send_header("Connection", "close")
+            self.end_headers()
+            self.wfile.write(b"ok")
+
+        def log_message(self, *args: object) -> None:
+            """Keep test output quiet."""
+
+    context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+    context.load_cert_chain(pem)
+    server = ThreadingHTTPServer(("localhost", 0), Handler)
+    server.socket = context.wrap_socket(server.socket, server_side=True)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"https://localhost:{server.server_address[1]}/", pem, resumed
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_default_context_is_shared() -> None:
+    """Clients without a certificate reuse one CA-bundle context."""
+    context = tls.default()
+
+    assert tls.default() is context
+    assert isinstance(context, tls.SessionContext)
+    assert context.verify_mode == ssl.CERT_REQUIRED
+    assert context.check_hostname
+
+
+def test_certificate_context_is_rebuilt_when_the_file_changes(tmp_path: Path) -> None:
+    """One context per certificate file version."""
+    pem = tmp_path / "cert.pem"
+    generate_cert(pem)
+    first = tls.certificate(pem)
+
+    assert tls.certificate(pem) is first
+    assert first.minimum_version == ssl.TLSVersion.TLSv1_2
+
+    generate_cert(pem)
+    mtime = pem.stat().st_mtime_ns + 1_000_000_000
+    os.utime(pem, ns=(mtime, mtime))
+
+    assert tls.certificate(pem) is not first
+
+
+def test_sync_connections_resume_tls_sessions(https_server) -> None:
+    """A new connection to a known host resumes the previous session."""
+    url, pem, resumed = https_server
+    context = tls.SessionContext(ssl.PROTOCOL_TLS_CLIENT)
+    context.load_verify_locations(pem)
+
+    for _ in range(3):
+        with httpx.Client(verify=context) as client:
+            assert client.get(url).text == "ok"
+
+    assert resumed == [False, True, True]
+
+
+@pytest.mark.asyncio
+async def test_async_connections_resume_tls_sessions(https_server) -> None:
+    """Async connections resume sessions through ``wrap_bio`` as well."""
+    url, pem, resumed = https_server
+    context = tls.SessionContext(ssl.PROTOCOL_TLS_CLIENT)
+    context.load_verify_locations(pem)
+
+    for _ in range(3):
+        async with httpx.AsyncClient(verify=context) as client:
+            assert (await client.get(url)).text == "ok"
+
+    assert resumed == [False, True, True]
@@ -0,0 +1,117 @@
+"""Tests for process-wide shared HTTPx transports."""
+
+from __future__ import annotations
+
+import ssl
+
+import httpx
+import pytest
+from pydantic import SecretStr
+
+from canfar.client import HTTPClient
+from canfar.utils import circuit, retry, tls, transport
+
+URL = "https://example.test/skaha/v1"
+
+
+@pytest.fixture(autouse=True)
+def fresh_pools():
+    """Start and finish every test without shared pools."""
+    transport.close()
+    yield
+    transport.close()
+
+
+def _unwrap(client: httpx.Client | httpx.AsyncClient) -> object:
+    layer = client._transport  # noqa: SLF001
+    # Peel the opt-in breaker and retry layers, when enabled.
+    if isinstance(layer, (circuit.CircuitTransport, circuit.AsyncCircuitTransport)):
+        layer = layer.transport
+    if isinstance(layer, (retry.RetryTransport, retry.AsyncRetryTransport)):
+        layer = layer.transport
+    return layer
+
+
+def _pool(client: httpx.Client | httpx.AsyncClient) -> object:
+    shared = _unwrap(client)
+    assert isinstance(
+        shared, (transport.SharedTransport, transport.AsyncSharedTransport)
+    )
+    return shared.transport
+
+
+def test_clients_for_same_origin_share_one_pool() -> None:
+    """Different clients to one server reuse one connection pool."""
+    first = HTTPClient(token=SecretStr("a"), url=f"{URL}/")
+    second = HTTPClient(token=SecretStr("b"), url="https://example.test/other")
+
+    assert _pool(first.client) is _pool(second.client)
+
+
+def test_closing_a_client_keeps_the_shared_pool_open() -> None:
+    """Client close releases only its view of the pool."""
+    with HTTPClient(token=SecretStr("a"), url=URL) as first:
+        pool = _pool(first.client)
+    second = HTTPClient(token=SecretStr("a"), url=URL)
+
+    assert _pool(second.client) is pool
+
+
+def test_pools_are_keyed_by_origin_tls_context_and_limits() -> None:
+    """Distinct origins, TLS contexts, limits, and protocols split pools."""
+    limits = httpx.Limits(max_connections=8, max_keepalive_connections=2)
+    verify = tls.default()
+    base = transport.key(httpx.URL(URL), verify=verify, limits=limits)
+
+    assert base == transport.key(
+        httpx.URL("https://example.test/another/path"),
+        verify=verify,
+        limits=limits,
+    )
+    assert base != transport.key(
+        httpx.URL("https://other.test/skaha"), verify=verify, limits=limits
+    )
+    assert base != transport.key(
+        httpx.URL(URL), verify=ssl.create_default_context(), limits=limits
+    )
+    assert base != transport.key(
+        httpx.URL(URL), verify=verify, limits=httpx.Limits(max_connections=4)
+    )
+    assert base != transport.key(
+        httpx.URL(URL), verify=verify, limits=limits, http2=True
+    )
+
+
+def test_share_connections_false_uses_a_private_transport() -> None:
+    """Opting out builds a client-owned HTTPx transport."""
+    client = HTTPClient(token=SecretStr("a"), url=URL, share_connections=False)
+
+    assert isinstance(_unwrap(client.client), httpx.HTTPTransport)
+
+
+def test_close_drains_the_registry() -> None:
+    """Explicit close forgets existing pools so new clients start fresh."""
+    pool = _pool(HTTPClient(token=SecretStr("a"), url=URL).client)
+    transport.close()
+
+    assert _pool(HTTPClient(token=SecretStr("a"), url=URL).client) is not pool
+
+
+@pytest.mark.asyncio
+async def test_async_clients_share_a_pool_per_event_loop() -> None:
+    """Async clients built inside one loop share its pool until ``aclose``."""
+    first = HTTPClient(token=SecretStr("a"), url=URL)
+    second = HTTPClient(token=SecretStr("a"), url=URL)
+    pool = _pool(first.asynclient)
+
+    assert _pool(second.asynclient) is pool
+    await transport.aclose()
+    third = HTTPClient(token=SecretStr("a"), url=URL)
+    assert _pool(third.asynclient) is not pool
+
+
+def test_async_client_outside_a_loop_owns_its_transport() -> None:
+    """Without a running loop there is nothing to bind a shared pool to."""
+    client = HTTPClient(token=SecretStr("a"), url=URL)
+
+    assert isinstance(_unwrap(client.asynclient), httpx.AsyncHTTPTransport)